@@ -10,7 +10,8 @@ with open(str(here / 'README.rst'), 'r') as f:
 
 ext_modules = []
 install_requires = [
-    'typing_extensions; python_version < "3.9.0"'
+    'typing_extensions; python_version < "3.9.0"',
+    'importlib_metadata>=3.6; python_version < "3.8.0"'
 ]
 
 # Ideally this would be done with a installation flag...
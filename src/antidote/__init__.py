@@ -1,13 +1,74 @@
-from . import world
-from .constants import Constants, const
-from .core import (From, FromArg, FromArgName, Get, Provide, ProvideArgName, Scope,
-                   Wiring, auto_provide, inject, wire)
-from .factory import Factory, factory
-from .implementation import implementation
-from .lazy import LazyCall, LazyMethodCall
-from .service import Service, service
-from .tag import Tag, Tagged
-from .utils import is_compiled
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+# Public objects are only imported on first access (PEP-562) to keep the import of
+# antidote as fast as possible.
+_LAZY_EXPORTS = {
+    'world': '.world',
+    'Constants': '.constants',
+    'const': '.constants',
+    'From': '.core',
+    'FromArg': '.core',
+    'FromArgName': '.core',
+    'Get': '.core',
+    'LazyProvide': '.core',
+    'Provide': '.core',
+    'ProvideArgName': '.core',
+    'Scope': '.core',
+    'Wiring': '.core',
+    'auto_provide': '.core',
+    'inject': '.core',
+    'wire': '.core',
+    'Factory': '.factory',
+    'factory': '.factory',
+    'implementation': '.implementation',
+    'LazyCall': '.lazy',
+    'LazyMethodCall': '.lazy',
+    'Service': '.service',
+    'service': '.service',
+    'Tag': '.tag',
+    'Tagged': '.tag',
+    'is_compiled': '.utils',
+}
+
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    from . import world
+    from .constants import Constants, const
+    from .core import (From, FromArg, FromArgName, Get, LazyProvide, Provide,
+                       ProvideArgName, Scope, Wiring, auto_provide, inject, wire)
+    from .factory import Factory, factory
+    from .implementation import implementation
+    from .lazy import LazyCall, LazyMethodCall
+    from .service import Service, service
+    from .tag import Tag, Tagged
+    from .utils import is_compiled
+else:
+    def __getattr__(name: str) -> object:
+        try:
+            module_name = _LAZY_EXPORTS[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        import importlib
+        module = importlib.import_module(module_name, __name__)
+        value = module if name == 'world' else getattr(module, name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+    class _AntidoteModule(ModuleType):
+        def __setattr__(self, name: str, value: object) -> None:
+            # Importing a submodule sets it as an attribute of its package. It must not
+            # hide the objects with the same name, such as antidote.factory.
+            if not (isinstance(value, ModuleType)
+                    and name in _LAZY_EXPORTS
+                    and name != 'world'):
+                super().__setattr__(name, value)
+
+    sys.modules[__name__].__class__ = _AntidoteModule
 
 
 def __version__() -> str:  # pragma: no cover
@@ -19,6 +80,6 @@ def __version__() -> str:  # pragma: no cover
 
 
 __all__ = ['world', 'Get', 'From', 'FromArg', 'FromArgName', 'Provide', 'ProvideArgName',
-           'const', 'Constants', 'inject', 'auto_provide', 'wire', 'Wiring', 'factory',
-           'Factory', 'implementation', 'LazyCall', 'LazyMethodCall',
+           'LazyProvide', 'const', 'Constants', 'inject', 'auto_provide', 'wire',
+           'Wiring', 'factory', 'Factory', 'implementation', 'LazyCall', 'LazyMethodCall',
            'service', 'Service', 'Tag', 'Tagged', 'is_compiled']
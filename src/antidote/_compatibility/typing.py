@@ -1,8 +1,9 @@
 import sys
+from typing import Callable, Dict
 
 # Annotation
 if sys.version_info < (3, 7):
-    from typing import Callable, get_type_hints as _get_type_hints, cast
+    from typing import get_type_hints as _get_type_hints, cast
     from typing_extensions import Annotated, AnnotatedMeta
 
     # All of this is brittle, only working in our limited use case.
@@ -10,6 +11,9 @@ if sys.version_info < (3, 7):
         # annotations cannot be removed in Python 3.6
         return _get_type_hints(obj)
 
+    def _strip_annotations(hint: object) -> object:
+        return hint
+
     def get_origin(tp: object) -> object:
         if isinstance(tp, AnnotatedMeta):
             return Annotated
@@ -21,9 +25,27 @@ if sys.version_info < (3, 7):
 elif sys.version_info < (3, 9):
     # get_origin and get_args must be retrieved from typing_extensions even for Python
     # 3.8 as the typing 3.8 implementation is not annotation-aware
+    import typing_extensions
     from typing_extensions import Annotated, get_type_hints, get_origin, get_args
+    # Private, hence retrieved dynamically, and renamed in recent versions.
+    _strip_annotations: Callable[[object], object] = getattr(
+        typing_extensions, '_strip_extras',
+        getattr(typing_extensions, '_strip_annotations', None))
 else:
+    import typing
     from typing import Annotated, get_type_hints, get_origin, get_args
+    # Private, hence retrieved dynamically.
+    _strip_annotations: Callable[[object], object] = getattr(typing,
+                                                             '_strip_annotations')
+
+
+def strip_annotated(hints: Dict[str, object]) -> Dict[str, object]:
+    """
+    Equivalent to get_type_hints(include_extras=False) applied on the result of
+    get_type_hints(include_extras=True).
+    """
+    return {name: _strip_annotations(hint) for name, hint in hints.items()}
+
 
 # Final / Protocol
 if sys.version_info < (3, 8):
@@ -39,4 +61,4 @@ else:
         pass
 
 __all__ = ['final', 'Protocol', 'GenericMeta', 'Annotated', 'get_type_hints',
-           'get_origin', 'get_args']
+           'get_origin', 'get_args', 'strip_annotated']
@@ -1,5 +1,5 @@
-from typing import (Any, Callable, cast, Dict, Generic, Hashable, Optional, Tuple, Type,
-                    TypeVar, TYPE_CHECKING)
+from typing import (Any, Callable, cast, Dict, Generic, Hashable, List, Optional, Tuple,
+                    Type, TypeVar, TYPE_CHECKING)
 
 from ._compatibility.typing import final
 from ._internal import API
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from mypy_extensions import DefaultNamedArg
 
 _CONST_CONSTRUCTOR_METHOD = 'get'
+_CONST_BULK_METHOD = 'get_all'
 _SENTINEL = object()
 
 
@@ -76,17 +77,25 @@ def _configure_constants(cls: ConstantsMeta) -> None:
         conf.wiring.wire(cls)
 
     dependency: Hashable = service(cls, singleton=True)
+    bulk: Optional[ConstantsBulk] = None
+    if conf.bulk_load:
+        if not callable(getattr(cls, _CONST_BULK_METHOD, None)):
+            raise TypeError(f"Constants with bulk_load must define a "
+                            f"{_CONST_BULK_METHOD}() method.")
+        bulk = ConstantsBulk(_CONST_BULK_METHOD)
     for name, v in list(cls.__dict__.items()):
         if isinstance(v, LazyConstToDo):
-            setattr(cls,
-                    name,
-                    LazyConstDescriptor(
-                        name=name,
-                        dependency=dependency,
-                        method_name=_CONST_CONSTRUCTOR_METHOD,
-                        key=v.key,
-                        default=v.default,
-                        cast=v.type_ if v.type_ in conf.auto_cast else None))
+            descriptor = LazyConstDescriptor(
+                name=name,
+                dependency=dependency,
+                method_name=_CONST_CONSTRUCTOR_METHOD,
+                key=v.key,
+                default=v.default,
+                cast=v.type_ if v.type_ in conf.auto_cast else None,
+                bulk=bulk)
+            if bulk is not None:
+                bulk.descriptors.append(descriptor)
+            setattr(cls, name, descriptor)
 
 
 Cast = Callable[[object], object]
@@ -95,13 +104,19 @@ Cast = Callable[[object], object]
 @API.private
 @final
 class LazyConstDescriptor(FinalImmutable):
-    __slots__ = ('name', 'dependency', 'method_name', 'key', 'default', 'cast', '_cache')
+    """
+    Values retrieved from an instance are cast and stored in its :code:`__dict__`,
+    which takes precedence over this (non-data) descriptor on the next access.
+    """
+    __slots__ = ('name', 'dependency', 'method_name', 'key', 'default', 'cast', 'bulk',
+                 '_cache')
     name: str
     dependency: Hashable
     method_name: str
     key: object
     default: object
     cast: Cast
+    bulk: 'Optional[ConstantsBulk]'
     _cache: str
 
     def __init__(self,
@@ -111,7 +126,8 @@ class LazyConstDescriptor(FinalImmutable):
                  method_name: str,
                  key: object,
                  default: object,
-                 cast: Cast = None):
+                 cast: Cast = None,
+                 bulk: 'ConstantsBulk' = None):
         super().__init__(
             name=name,
             dependency=dependency,
@@ -119,6 +135,7 @@ class LazyConstDescriptor(FinalImmutable):
             key=key,
             default=default,
             cast=cast or (lambda x: x),
+            bulk=bulk,
             _cache=f"__antidote_dependency_{hex(id(self))}"
         )
 
@@ -127,11 +144,34 @@ class LazyConstDescriptor(FinalImmutable):
             try:
                 return getattr(owner, self._cache)
             except AttributeError:
-                # TODO: Waiting for a fix: https://github.com/python/mypy/issues/6910
-                _cast = cast(Cast, getattr(self, 'cast'))
                 dependency = LazyConst(self)
                 setattr(owner, self._cache, dependency)
                 return dependency
+
+        try:
+            values = instance.__dict__
+        except AttributeError:  # __slots__
+            return self.retrieve(instance)
+
+        # Only needed when called directly, from LazyConst typically.
+        try:
+            return values[self.name]
+        except KeyError:
+            pass
+
+        if self.bulk is not None and _BULK_LOADED not in values:
+            self.bulk.load(instance, values)
+            try:
+                return values[self.name]
+            except KeyError:
+                pass
+
+        value = self.retrieve(instance)
+        values[self.name] = value
+        return value
+
+    def retrieve(self, instance: object) -> object:
+        # TODO: Waiting for a fix: https://github.com/python/mypy/issues/6910
         _cast = cast(Cast, getattr(self, 'cast'))
         try:
             return _cast(getattr(instance, self.method_name)(self.key))
@@ -141,6 +181,34 @@ class LazyConstDescriptor(FinalImmutable):
             raise
 
 
+_BULK_LOADED = '__antidote_constants_loaded__'
+
+
+@API.private
+@final
+class ConstantsBulk:
+    """
+    Constants of a class loaded at once, with a single call to :code:`get_all()`, when
+    the first one is retrieved.
+    """
+    __slots__ = ('method_name', 'descriptors')
+
+    def __init__(self, method_name: str) -> None:
+        self.method_name = method_name
+        self.descriptors: List[LazyConstDescriptor] = []
+
+    def load(self, instance: object, values: Dict[str, object]) -> None:
+        keys = [descriptor.key for descriptor in self.descriptors]
+        loaded = getattr(instance, self.method_name)(keys)
+        for descriptor in self.descriptors:
+            # Missing keys are left to get().
+            if descriptor.name not in values and descriptor.key in loaded:
+                # TODO: Waiting for a fix: https://github.com/python/mypy/issues/6910
+                _cast = cast(Cast, getattr(descriptor, 'cast'))
+                values[descriptor.name] = _cast(loaded[descriptor.key])
+        values[_BULK_LOADED] = True
+
+
 @API.private
 @final
 class LazyConst(FinalImmutable, Lazy):
@@ -92,7 +92,9 @@ def _configure_factory(cls: FactoryMeta,
     factory_dependency = factory_provider.register(
         output=output,
         scope=conf.scope,
-        factory=Dependency(service(cls, singleton=True))
+        factory=Dependency(service(cls, singleton=True)),
+        pool=conf.pool,
+        dispose=conf.dispose
     )
 
     if conf.tags:
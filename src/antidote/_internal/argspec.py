@@ -1,8 +1,15 @@
+import builtins
+import functools
 import inspect
-from typing import (Any, Callable, Dict, Iterator, List, Sequence, Set, Union)
+import sys
+import threading
+from types import CodeType, FunctionType, ModuleType
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple,
+                    Union)
+from weakref import WeakKeyDictionary
 
 from .utils import FinalImmutable
-from .._compatibility.typing import get_type_hints
+from .._compatibility.typing import get_type_hints, strip_annotated
 
 
 class Argument(FinalImmutable):
@@ -48,8 +55,9 @@ class Arguments:
         has_var_keyword = False
 
         # typing is used, as lazy evaluation is not done properly with Signature.
-        type_hints = get_type_hints(func)
-        extra_type_hints = get_type_hints(func, include_extras=True)
+        extra_type_hints = get_type_hints(_with_evaluated_annotations(func),
+                                          include_extras=True)
+        type_hints = strip_annotated(extra_type_hints)
 
         for name, parameter in inspect.signature(func).parameters.items():
             if parameter.kind is parameter.VAR_POSITIONAL:
@@ -143,3 +151,91 @@ def is_unbound_method(func: Union[Callable[..., object], staticmethod, classmeth
             and not inspect.ismethod(func)
             # not nested function
             and not func.__qualname__[:-len(func.__name__)].endswith("<locals>."))
+
+
+# annotation -> (names used by the annotation and their value, result)
+Evaluations = Dict[str, Tuple[Tuple[Tuple[str, object], ...], object]]
+# Evaluations of each module, dropped with the module itself.
+__annotations_cache: 'WeakKeyDictionary[ModuleType, Evaluations]' = WeakKeyDictionary()
+__annotations_lock = threading.Lock()
+_MISSING = object()
+
+
+def _with_evaluated_annotations(func: Callable[..., object]) -> Callable[..., object]:
+    """
+    Evaluating string annotations (PEP-563 and forward references) is the most costly
+    part of get_type_hints(). As the same annotations are often used across a whole
+    module, evaluations are memoized for each module namespace. A copy of the function
+    with the evaluated annotations is returned which can be safely used with
+    get_type_hints(), keeping its exact semantics.
+
+    Only annotations evaluated in the namespace of an actual module are memoized.
+    """
+    annotations = getattr(func, '__annotations__', None)
+    if not (inspect.isfunction(func)
+            and annotations
+            and any(isinstance(a, str) for a in annotations.values())):
+        return func
+
+    # Same namespace as get_type_hints()
+    nsobj: Any = func
+    while hasattr(nsobj, '__wrapped__'):
+        nsobj = nsobj.__wrapped__
+    globalns = getattr(nsobj, '__globals__', {})
+    module = sys.modules.get(getattr(nsobj, '__module__', None) or '')
+    evaluations: Optional[Evaluations] = None
+    if module is not None and vars(module) is globalns:
+        with __annotations_lock:
+            evaluations = __annotations_cache.setdefault(module, dict())
+
+    try:
+        evaluated = {name: _evaluate(annotation, globalns, evaluations)
+                     if isinstance(annotation, str) else annotation
+                     for name, annotation in annotations.items()}
+    except Exception:
+        # Let get_type_hints() raise a proper error.
+        return func
+
+    assert isinstance(func, FunctionType)
+    copy = FunctionType(func.__code__, globalns, func.__name__, func.__defaults__,
+                        func.__closure__)
+    copy.__kwdefaults__ = func.__kwdefaults__
+    copy.__annotations__ = evaluated
+    return copy
+
+
+def _evaluate(annotation: str,
+              globalns: Dict[str, Any],
+              evaluations: Optional[Evaluations]) -> object:
+    """
+    The result is only re-used if all the names referenced by the annotation are still
+    bound to the same objects.
+    """
+    if evaluations is not None:
+        cached = evaluations.get(annotation)
+        if cached is not None:
+            bindings, value = cached
+            if all(_lookup(globalns, name) is obj for name, obj in bindings):
+                return value
+
+    code = _compile_annotation(annotation)
+    value = eval(code, globalns, globalns)
+    if evaluations is not None:
+        evaluations[annotation] = (
+            tuple((name, _lookup(globalns, name)) for name in code.co_names),
+            value
+        )
+    return value
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_annotation(annotation: str) -> CodeType:
+    code: CodeType = compile(annotation, '<annotation>', 'eval')
+    return code
+
+
+def _lookup(globalns: Dict[str, Any], name: str) -> object:
+    try:
+        return globalns[name]
+    except KeyError:
+        return getattr(builtins, name, _MISSING)
@@ -0,0 +1,147 @@
+"""
+Disposal of the dependency values discarded when their scope is reset. Disposers are
+declared by the providers, see :code:`Service.Conf(dispose=...)`, and all the values of
+a scope are disposed at once in a background thread, so resetting a scope stays cheap.
+Disposers may also be coroutine functions, those of a same reset are awaited
+concurrently in an event loop owned by the background thread. They cannot rely on objects
+bound to the event loop of the caller.
+
+asyncio and logging are only imported when actually needed, as this module is imported
+by the service and factory configurations.
+"""
+import atexit
+import inspect
+import queue
+import threading
+from typing import (Awaitable, Callable, Dict, List, Optional, Sequence, TYPE_CHECKING,
+                    Tuple)
+
+from . import API
+from ..core.container import Scope
+
+if TYPE_CHECKING:
+    import asyncio
+    from ..core.container import RawProvider
+
+Batch = Sequence[Tuple[Callable[[object], object], object]]
+
+
+@API.private
+def validated_dispose(dispose: Optional[Callable[[object], object]],
+                      scope: Optional[Scope]) -> Optional[Callable[[object], object]]:
+    if dispose is None:
+        return None
+    if not callable(dispose):
+        raise TypeError(f"dispose must be callable or None, not {type(dispose)}")
+    if scope is None or scope is Scope.singleton():
+        raise ValueError("Only dependencies with a scope can be disposed, singletons "
+                         "are never discarded.")
+    return dispose
+
+
+@API.private
+def dispose(providers: 'Sequence[RawProvider]',
+            values: Dict[object, object],
+            *,
+            wait: bool = False) -> None:
+    """
+    Disposes the values of a scope which has been reset with the disposer of their
+    provider, if any.
+
+    Args:
+        providers: Providers of the container.
+        values: Discarded dependency values of the scope.
+        wait: Whether to wait for the disposal to be done.
+    """
+    batch = []
+    for dependency, value in values.items():
+        for provider in providers:
+            disposer = provider.maybe_disposer(dependency)
+            if disposer is not None:
+                batch.append((disposer, value))
+                break
+
+    dispose_batch(batch, wait=wait)
+
+
+@API.private
+def dispose_batch(batch: Batch, *, wait: bool = False) -> None:
+    """
+    Disposes the values with their associated disposer.
+    """
+    if batch or wait:
+        _worker().submit(batch, wait)
+
+
+_worker_lock = threading.Lock()
+_worker_instance: 'Optional[_DisposalWorker]' = None
+
+
+def _worker() -> '_DisposalWorker':
+    global _worker_instance
+    with _worker_lock:
+        if _worker_instance is None:
+            _worker_instance = _DisposalWorker()
+            _worker_instance.start()
+            # Pending disposals are done before exiting.
+            atexit.register(_worker_instance.submit, (), True)
+        return _worker_instance
+
+
+class _DisposalWorker(threading.Thread):
+    def __init__(self) -> None:
+        super().__init__(name='antidote-disposal', daemon=True)
+        self.__queue: 'queue.Queue[Tuple[Batch, Optional[threading.Event]]]' = \
+            queue.Queue()
+        self.__loop: 'Optional[asyncio.AbstractEventLoop]' = None
+
+    def submit(self, batch: Batch, wait: bool) -> None:
+        if threading.current_thread() is self:
+            # Scope reset by a disposer, waiting would never end.
+            self.__dispose(batch)
+            return
+
+        done = threading.Event() if wait else None
+        self.__queue.put((batch, done))
+        if done is not None:
+            done.wait()
+
+    def run(self) -> None:
+        while True:
+            batch, done = self.__queue.get()
+            try:
+                self.__dispose(batch)
+            finally:
+                if done is not None:
+                    done.set()
+
+    def __dispose(self, batch: Batch) -> None:
+        awaitables: List[Tuple[Awaitable[object], object]] = []
+        for disposer, value in batch:
+            try:
+                result = disposer(value)
+            except Exception as error:
+                _log_failure(error, value)
+            else:
+                if inspect.isawaitable(result):
+                    awaitables.append((result, value))
+
+        if awaitables:
+            import asyncio
+            if self.__loop is None:
+                self.__loop = asyncio.new_event_loop()
+            self.__loop.run_until_complete(_await_all(awaitables))
+
+
+async def _await_all(awaitables: List[Tuple[Awaitable[object], object]]) -> None:
+    import asyncio
+    results = await asyncio.gather(*(awaitable for awaitable, _ in awaitables),
+                                   return_exceptions=True)
+    for result, (_, value) in zip(results, awaitables):
+        if isinstance(result, BaseException):
+            _log_failure(result, value)
+
+
+def _log_failure(error: BaseException, value: object) -> None:
+    import logging
+    logging.getLogger(__name__).error("Failed to dispose %r", value, exc_info=error)
@@ -0,0 +1,214 @@
+"""
+Pools of non-singleton dependencies, see :code:`Service.Conf(pool=...)`. Instances are
+borrowed by injected functions for the duration of the call and given back to their
+pool afterwards.
+
+Only plain functions borrow instances. Methods, constructors included, may store them
+on their instance or class, and the result of coroutines and generators is used after
+the call. Injected functions check at each call whether one of their dependencies is
+pooled, so other ones are left untouched. Only the instances acquired while the
+arguments are injected and passed on to the function are given back. Anything
+retrieved within the call itself, with world.get() for example, is kept by the caller.
+"""
+import inspect
+import threading
+from contextlib import contextmanager
+from typing import (Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set,
+                    Tuple)
+
+from . import API
+from ..core.container import Scope
+
+# Borrowed instances of each injection in progress in the current thread.
+_local = threading.local()
+# Dependencies which may be provided by a pool in the current world. Injected functions
+# keep a reference to it, so it is only ever modified in place.
+pooled_dependencies: Set[Hashable] = set()
+_MISSING = object()
+
+
+@API.private
+class Pool:
+    """
+    Lends at most :code:`size` instances, idle ones included, to injected functions.
+    Once all of them are borrowed, injected calls of other threads wait for one to be
+    given back. A thread which is already borrowing from the pool, through nested calls,
+    gets a new instance instead as it would wait for itself. Instances retrieved
+    outside of an injection, with world.get() for example, are kept by the caller and
+    do not count.
+    """
+    __slots__ = ('size', '__idle', '__borrowed', '__holders', '__condition')
+
+    def __init__(self, size: int) -> None:
+        assert isinstance(size, int) and size > 0
+        self.size = size
+        self.__idle: List[object] = []
+        self.__borrowed = 0
+        # Thread ident -> number of borrowed instances
+        self.__holders: Dict[int, int] = dict()
+        self.__condition = threading.Condition(threading.Lock())
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(size={self.size}, idle={len(self.__idle)}, "
+                f"borrowed={self.__borrowed})")
+
+    def clone(self) -> 'Pool':
+        return Pool(self.size)
+
+    def acquire(self, create: Callable[[], object]) -> object:
+        """
+        Returns an idle instance or a new one created with :code:`create`. It is given
+        back to the pool at the end of the current injected call if it has been
+        injected into it. Otherwise the caller simply keeps it.
+        """
+        frames: Optional[List[List[Tuple[Pool, object]]]] = getattr(_local, 'frames',
+                                                                    None)
+        # Transient dependencies are retrieved without the container lock.
+        with self.__condition:
+            if frames:
+                thread = threading.get_ident()
+                if thread not in self.__holders:
+                    self.__condition.wait_for(self.__available)
+                self.__borrowed += 1
+                self.__holders[thread] = self.__holders.get(thread, 0) + 1
+            instance = self.__idle.pop() if self.__idle else _MISSING
+
+        if instance is _MISSING:
+            try:
+                instance = create()
+            except BaseException:
+                if frames:
+                    self.forget()
+                raise
+
+        if frames:
+            frames[-1].append((self, instance))
+        return instance
+
+    def release(self, instance: object) -> None:
+        """
+        Gives back a borrowed instance.
+        """
+        with self.__condition:
+            self.__end_borrowing()
+            if len(self.__idle) + self.__borrowed < self.size:
+                self.__idle.append(instance)
+
+    def forget(self) -> None:
+        """
+        The borrowed instance will never be given back, the caller keeps it.
+        """
+        with self.__condition:
+            self.__end_borrowing()
+
+    def __available(self) -> bool:
+        return bool(self.__idle) or self.__borrowed < self.size
+
+    def __end_borrowing(self) -> None:
+        thread = threading.get_ident()
+        count = self.__holders[thread] - 1
+        if count:
+            self.__holders[thread] = count
+        else:
+            del self.__holders[thread]
+        self.__borrowed -= 1
+        self.__condition.notify()
+
+
+@API.private
+def validated_pool(pool: Optional[int], scope: Optional[Scope]) -> Optional[int]:
+    if pool is None:
+        return None
+    if not isinstance(pool, int) or isinstance(pool, bool):
+        raise TypeError(f"pool must be an int or None, not {type(pool)}")
+    if pool <= 0:
+        raise ValueError(f"pool must be strictly positive, not {pool}")
+    if scope is not None:
+        raise ValueError("A pooled dependency can neither be a singleton nor have a "
+                         "scope.")
+    return pool
+
+
+@API.private
+def declare_pooled(dependency: Hashable) -> None:
+    pooled_dependencies.add(dependency)
+
+
+@API.private
+@contextmanager
+def pooled_world(keep: bool) -> Iterator[None]:
+    """
+    Pooled dependencies of a test world, only those of the current world are kept if
+    specified.
+    """
+    previous = set(pooled_dependencies)
+    if not keep:
+        pooled_dependencies.clear()
+    try:
+        yield
+    finally:
+        pooled_dependencies.clear()
+        pooled_dependencies.update(previous)
+
+
+@API.private
+def may_borrow(func: object) -> bool:
+    """
+    Whether the injection of func may give back the instances it borrowed. Only plain
+    functions do, see the module documentation.
+    """
+    func = getattr(func, '__func__', func)  # classmethod / staticmethod
+    qualname = getattr(func, '__qualname__', None)
+    if not inspect.isfunction(func) or not isinstance(qualname, str):
+        return False
+    if '.' in qualname.rsplit('<locals>.', 1)[-1]:
+        # Defined in a class body
+        return False
+    return not (inspect.iscoroutinefunction(func)
+                or inspect.isgeneratorfunction(func)
+                or inspect.isasyncgenfunction(func))
+
+
+@API.private
+def open_borrowing() -> List[Tuple[Pool, object]]:
+    try:
+        frames = _local.frames
+    except AttributeError:
+        frames = _local.frames = []
+    frame: List[Tuple[Pool, object]] = []
+    frames.append(frame)
+    return frame
+
+
+@API.private
+def end_borrowing(frame: List[Tuple[Pool, object]], injected: Iterable[object]) -> None:
+    """
+    Stops tracking acquisitions once the arguments have been injected. Only the instances
+    actually passed on to the function are kept, other ones were acquired by nested
+    retrievals which keep them.
+    """
+    frames = _local.frames
+    assert frames[-1] is frame
+    frames.pop()
+    injected_ids = {id(value) for value in injected}
+    borrowed = []
+    for pool, instance in frame:
+        if id(instance) in injected_ids:
+            borrowed.append((pool, instance))
+        else:
+            pool.forget()
+    frame[:] = borrowed
+
+
+@API.private
+def close_borrowing(frame: List[Tuple[Pool, object]]) -> None:
+    frames = _local.frames
+    if frames and frames[-1] is frame:
+        # Injection failed, nothing was borrowed. Acquired instances may have been
+        # stored by other dependencies, so they are not given back.
+        frames.pop()
+        for pool, _ in frame:
+            pool.forget()
+        return
+    for pool, instance in frame:
+        pool.release(instance)
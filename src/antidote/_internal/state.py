@@ -12,16 +12,19 @@ __container_lock = threading.RLock()
 
 
 def current_container() -> RawContainer:
-    assert __container is not None
-    return __container
+    container = __container
+    if container is None:
+        # Created lazily to keep the import of antidote fast.
+        return init()
+    return container
 
 
 def current_overridable_container() -> OverridableRawContainer:
-    assert __container is not None
-    if not isinstance(__container, OverridableRawContainer):
+    container = current_container()
+    if not isinstance(container, OverridableRawContainer):
         raise RuntimeError("Current world does not support overrides. "
                            "Consider using world.test.clone(override=True)")
-    return __container
+    return container
 
 
 # Used only for tests
@@ -30,21 +33,20 @@ def reset() -> None:
     __container = None
 
 
-def init() -> None:
+def init() -> RawContainer:
     global __container
-    if __container is None:
-        with __container_lock:
-            if __container is None:
-                from antidote._internal.world import new_container
-                __container = new_container()
+    with __container_lock:
+        if __container is None:
+            from antidote._internal.world import new_container
+            __container = new_container()
+        return __container
 
 
 @contextmanager
 def override(create: Callable[[RawContainer], RawContainer]) -> Iterator[None]:
     global __container
     with __container_lock:
-        assert __container is not None
-        old = __container
+        old = current_container()
         try:
             __container = create(old)
             yield
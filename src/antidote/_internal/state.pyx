@@ -14,7 +14,9 @@ cdef:
     object __container_lock = threading.RLock()
 
 cdef RawContainer fast_get_container():
-    assert __container is not None
+    if __container is None:
+        # Created lazily to keep the import of antidote fast.
+        return init()
     return __container
 
 def current_container() -> RawContainer:
@@ -35,17 +37,17 @@ def reset():
 
 def init():
     global __container
-    if __container is None:
-        with __container_lock:
-            if __container is None:
-                from antidote._internal.world import new_container
-                __container = new_container()
+    with __container_lock:
+        if __container is None:
+            from antidote._internal.world import new_container
+            __container = new_container()
+        return __container
 
 @contextmanager
 def override(create: Callable[[RawContainer], RawContainer]):
     global __container
     with __container_lock:
-        old = __container
+        old = fast_get_container()
         try:
             __container = create(old)
             yield
@@ -1,4 +1,4 @@
-from typing import Dict, Tuple, Type, cast
+from typing import Callable, Dict, Optional, Tuple, Type, cast
 
 from .slots import SlotsRepr
 from .. import API
@@ -18,10 +18,75 @@ class ImmutableMeta(type):
 
         # TODO: Type ignore necessary when type checking with Python 3.6
         #       To be removed ASAP.
-        return cast(
+        cls = cast(
             ImmutableMeta,
             super().__new__(mcs, name, bases, namespace, **kwargs)  # type: ignore
         )
+        # Used by Immutable.__init__
+        setattr(cls, '_Immutable__initialize',
+                _create_initialize(cls) or _generic_initialize)
+        return cls
+
+
+_UNSET = object()
+
+
+def _generic_initialize(self: object, *args: object, **kwargs: object) -> None:
+    # quick way to initialize an Immutable through args. It won't take into
+    # account parent classes though.
+    if args:
+        attrs: Dict[str, object] = dict(zip(getattr(self, '__slots__'), args))
+        attrs.update(kwargs)
+        cls = type(self).__name__
+        attrs = {
+            (f'_{cls}{name}' if name.startswith('__') else name): attr
+            for name, attr in attrs.items()
+        }
+    else:
+        attrs = kwargs
+    for attr, value in attrs.items():
+        object.__setattr__(self, attr, value)
+
+
+def _create_initialize(cls: type) -> Optional[Callable[..., None]]:
+    """
+    Generates an initializer specialized for the slots of the class, setting them
+    directly through their descriptors. It behaves like the generic one, arguments are
+    matched with the slots in their declaration order, but is several times faster.
+    Classes inheriting slots from their parents keep the generic one.
+    """
+    slots = cls.__dict__['__slots__']
+    slots = (slots,) if isinstance(slots, str) else tuple(slots)
+    if not slots or any(b.__dict__.get('__slots__') for b in cls.__mro__[1:]):
+        return None
+
+    setters = []
+    for name in slots:
+        if name.startswith('__') and not name.endswith('__'):
+            attr = f"_{cls.__name__.lstrip('_')}{name}"
+        else:
+            attr = name
+        descriptor = cls.__dict__.get(attr)
+        if descriptor is None or not hasattr(descriptor, '__set__'):  # pragma: no cover
+            return None
+        setters.append(descriptor.__set__)
+
+    # Slots names are kept as arguments names, so they can also be used as keywords.
+    source = '\n'.join([
+        "def __create__(__antidote_unset, __antidote_setters):",
+        f"    {''.join(f'__antidote_set{i}, ' for i in range(len(slots)))}"
+        f"= __antidote_setters",
+        f"    def __init__(self, {', '.join(f'{n}=__antidote_unset' for n in slots)}):",
+        *[f"        if {n} is not __antidote_unset: __antidote_set{i}(self, {n})"
+          for i, n in enumerate(slots)],
+        "    return __init__"
+    ])
+    namespace: Dict[str, object] = {}
+    exec(source, {}, namespace)
+    initialize = cast(Callable[..., Callable[..., None]],
+                      namespace['__create__'])(_UNSET, setters)
+    setattr(initialize, '__qualname__', f"{cls.__qualname__}.__init__")
+    return initialize
 
 
 # TODO: remove after Python 3.6 support drops.
@@ -38,21 +103,10 @@ class Immutable(SlotsRepr, metaclass=ImmutableMeta):
     """
     __slots__ = ()
 
+    __initialize: Callable[..., None]  # Specialized for each class by ImmutableMeta
+
     def __init__(self, *args: object, **kwargs: object) -> None:
-        # quick way to initialize an Immutable through args. It won't take into
-        # account parent classes though.
-        if args:
-            attrs: Dict[str, object] = dict(zip(self.__slots__, args))
-            attrs.update(kwargs)
-            cls = type(self).__name__
-            attrs = {
-                (f'_{cls}{name}' if name.startswith('__') else name): attr
-                for name, attr in attrs.items()
-            }
-        else:
-            attrs = kwargs
-        for attr, value in attrs.items():
-            object.__setattr__(self, attr, value)
+        self.__initialize(*args, **kwargs)
 
     def __setattr__(self, name: str, value: object) -> None:
         raise AttributeError(f"{type(self)} is immutable")
@@ -70,7 +124,12 @@ class FinalImmutableMeta(ImmutableMeta):
             if isinstance(b, FinalImmutableMeta) and b.__module__ != __name__:
                 raise TypeError(f"Type '{b.__name__}' cannot be inherited by {name}.")
 
-        return cast(FinalImmutableMeta, super().__new__(mcs, name, bases, namespace))
+        cls = cast(FinalImmutableMeta, super().__new__(mcs, name, bases, namespace))
+        # As it cannot be subclassed, the specialized initializer can be used directly.
+        initialize = getattr(cls, '_Immutable__initialize')
+        if '__init__' not in namespace and initialize is not _generic_initialize:
+            setattr(cls, '__init__', initialize)
+        return cls
 
 
 @API.private
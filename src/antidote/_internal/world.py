@@ -1,9 +1,11 @@
 """
 Utilities used by world, mostly for syntactic sugar.
 """
-from typing import Any, Callable, Hashable, TYPE_CHECKING, Type, TypeVar, Union, cast
+from typing import (Any, Callable, Dict, Hashable, TYPE_CHECKING, Type, TypeVar, Union,
+                    cast)
 
 from . import API
+from .state import current_container
 from .utils import Default
 from .utils.meta import FinalMeta
 from .._compatibility.typing import final
@@ -21,11 +23,13 @@ if TYPE_CHECKING:
 @API.private
 @final
 class WorldGet(metaclass=FinalMeta):
+    def __init__(self) -> None:
+        # type -> typed getter, created only once for each type.
+        self.__typed: Dict[object, Callable[..., Any]] = dict()
+
     def __call__(self, __dependency: Hashable, *, default: Any = Default.sentinel) -> Any:
-        from .state import current_container
-        dependency = extract_annotated_dependency(__dependency)
         try:
-            return current_container().get(dependency)
+            return current_container().get(extract_annotated_dependency(__dependency))
         except DependencyNotFoundError:
             if default is not Default.sentinel:
                 return default
@@ -34,6 +38,18 @@ class WorldGet(metaclass=FinalMeta):
     def __getitem__(self,
                     tpe: Type[T]
                     ) -> 'Callable[[DefaultArg(object), DefaultNamedArg(T, name="default")], T]':  # noqa F821,E501
+        try:
+            return self.__typed[tpe]
+        except KeyError:
+            pass
+        except TypeError:  # not hashable
+            return self.__create_typed(tpe)
+
+        f = self.__create_typed(tpe)
+        self.__typed[tpe] = f
+        return f
+
+    def __create_typed(self, tpe: Type[T]) -> Callable[..., T]:
         def f(__dependency: Hashable = None,
               *,
               default: Union[T, Default] = Default.sentinel) -> T:
@@ -66,7 +82,7 @@ def new_container() -> RawContainer:
     """ default new container in Antidote """
 
     from .._providers import (LazyProvider, ServiceProvider, TagProvider,
-                              IndirectProvider, FactoryProvider)
+                              IndirectProvider, FactoryProvider, LazyImportProvider)
 
     container = RawContainer()
     container.add_provider(FactoryProvider)
@@ -74,5 +90,6 @@ def new_container() -> RawContainer:
     container.add_provider(IndirectProvider)
     container.add_provider(TagProvider)
     container.add_provider(ServiceProvider)
+    container.add_provider(LazyImportProvider)
 
     return container
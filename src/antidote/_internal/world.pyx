@@ -0,0 +1,117 @@
+"""
+Cython version of the world utilities, retrieving dependencies directly through
+fast_get() of the container.
+"""
+from typing import Any, Hashable
+
+# @formatter:off
+cimport cython
+from cpython.ref cimport PyObject, Py_XDECREF
+
+from antidote._internal.state cimport fast_get_container
+from antidote.core.container cimport DependencyResult
+from . import API
+from .utils import Default
+from ..core._annotations import _ANNOTATED_TYPE, extract_annotated_dependency
+from ..core.container import RawContainer
+from ..core.exceptions import DependencyNotFoundError
+from ..core.utils import Dependency
+
+# @formatter:on
+
+cdef object _SENTINEL = Default.sentinel
+
+
+cdef object world_get(object dependency, object default):
+    cdef:
+        DependencyResult result
+        object value
+
+    if isinstance(dependency, _ANNOTATED_TYPE):
+        dependency = extract_annotated_dependency(dependency)
+
+    fast_get_container().fast_get(<PyObject*> dependency, &result)
+    if result.value is not NULL:
+        value = <object> result.value
+        Py_XDECREF(result.value)
+        return value
+
+    if default is not _SENTINEL:
+        return default
+    raise DependencyNotFoundError(dependency)
+
+
+@cython.final
+cdef class WorldGet:
+    cdef:
+        dict __dict__  # for __doc__
+        dict __typed
+
+    def __init__(self):
+        # type -> typed getter, created only once for each type.
+        self.__typed = dict()
+
+    def __call__(self, __dependency: Hashable, *, default: Any = Default.sentinel) -> Any:
+        return world_get(__dependency, default)
+
+    def __getitem__(self, tpe):
+        try:
+            return self.__typed[tpe]
+        except KeyError:
+            pass
+        except TypeError:  # not hashable
+            return TypedWorldGet(tpe)
+
+        f = TypedWorldGet(tpe)
+        self.__typed[tpe] = f
+        return f
+
+
+@cython.final
+cdef class TypedWorldGet:
+    cdef:
+        object __tpe
+
+    def __init__(self, tpe):
+        self.__tpe = tpe
+
+    def __call__(self, __dependency: Hashable = None, *,
+                 default: Any = Default.sentinel) -> Any:
+        if __dependency is None:
+            __dependency = self.__tpe
+        return world_get(__dependency, default)
+
+
+@cython.final
+cdef class WorldLazy:
+    cdef:
+        dict __dict__  # for __doc__
+
+    def __call__(self, __dependency: Hashable) -> Dependency:
+        return Dependency(__dependency)
+
+    def __getitem__(self, tpe):
+        def f(__dependency: Hashable = None) -> Dependency:
+            if __dependency is None:
+                __dependency = tpe
+            return Dependency(__dependency)
+
+        return f
+
+
+@API.private
+def new_container() -> RawContainer:
+    """ default new container in Antidote """
+
+    from .._providers import (LazyProvider, ServiceProvider, TagProvider,
+                              IndirectProvider, FactoryProvider, LazyImportProvider)
+
+    container = RawContainer()
+    container.add_provider(FactoryProvider)
+    container.add_provider(LazyProvider)
+    container.add_provider(IndirectProvider)
+    container.add_provider(TagProvider)
+    container.add_provider(ServiceProvider)
+    container.add_provider(LazyImportProvider)
+
+    return container
@@ -1,7 +1,15 @@
 import functools
-from typing import Callable, Dict, Hashable, List, Sequence, Union
+import inspect
+import operator
+import threading
+from types import MethodType
+from typing import (Callable, Dict, Hashable, List, Optional, Sequence, Tuple,
+                    TYPE_CHECKING, Union)
 
 from . import API
+from .pool import (close_borrowing, end_borrowing, may_borrow, open_borrowing,
+                   pooled_dependencies)
+from .state import current_container
 from .utils import FinalImmutable
 from ..core.container import Container
 from ..core.exceptions import DependencyNotFoundError
@@ -43,16 +51,40 @@ def build_wrapper(blueprint: InjectionBlueprint,
     return InjectedWrapper(blueprint, wrapped, skip_self)
 
 
+@API.private
+def build_lazy_wrapper(blueprint_factory: Callable[[], InjectionBlueprint],
+                       wrapped: AnyF,
+                       skip_self: bool = False) -> 'InjectedWrapper':
+    """
+    The blueprint will only be created, through blueprint_factory, on the first call.
+    """
+    return InjectedWrapper(blueprint_factory, wrapped, skip_self)
+
+
 @API.private
 def get_wrapper_dependencies(wrapper: Callable[..., object]) -> List[Hashable]:
+    if isinstance(wrapper, MethodType):
+        wrapper = wrapper.__func__
     if not isinstance(wrapper, InjectedWrapper):
         raise TypeError(f"Argument must be an {InjectedWrapper}")
 
-    blueprint: InjectionBlueprint = getattr(wrapper,
-                                            f"_{InjectedWrapper.__name__}__blueprint")
+    blueprint: InjectionBlueprint = getattr(
+        wrapper, f"_{InjectedWrapper.__name__}__get_blueprint")()
     return [inj.dependency for inj in blueprint.injections if inj.dependency is not None]
 
 
+@API.private
+def get_wrapper_injections(wrapper: Callable[..., object]) -> Sequence[Injection]:
+    if isinstance(wrapper, MethodType):
+        wrapper = wrapper.__func__
+    if not isinstance(wrapper, InjectedWrapper):
+        raise TypeError(f"Argument must be an {InjectedWrapper}")
+
+    blueprint: InjectionBlueprint = getattr(
+        wrapper, f"_{InjectedWrapper.__name__}__get_blueprint")()
+    return blueprint.injections
+
+
 @API.private
 def is_wrapper(x: object) -> bool:
     return isinstance(x, InjectedWrapper)
@@ -70,54 +102,297 @@ class InjectedWrapper:
     Wrapper which injects all the dependencies not supplied in the passed
     arguments. An InjectionBlueprint is used to store the mapping of the
     arguments to their dependency if any and if the injection is required.
+
+    The actual injection is done by a function generated specifically for the
+    wrapped function, see build_injector().
     """
 
     def __init__(self,
-                 blueprint: InjectionBlueprint,
+                 blueprint: Union[InjectionBlueprint, Callable[[], InjectionBlueprint]],
                  wrapped: AnyF,
                  skip_self: bool = False):
         """
         Args:
-            blueprint: Injection blueprint for the underlying function
+            blueprint: Injection blueprint for the underlying function or a function
+                creating it which will be only be called on first use.
             wrapped:  real function to be called
             skip_self:  whether the first argument must be skipped. Used internally
         """
-        self.__blueprint = blueprint
         self.__wrapped__ = wrapped
-        self.__injection_offset = 1 if skip_self else 0
+        self.__bind_owner = isinstance(wrapped, classmethod)
+        self.__is_static = isinstance(wrapped, staticmethod)
+        self.__offset = 1 if skip_self else 0
+        self.__blueprint: Optional[InjectionBlueprint] = None
+        if isinstance(blueprint, InjectionBlueprint):
+            self.__set_blueprint(blueprint)
+        else:
+            self.__blueprint_factory = blueprint
+            # The blueprint is only built once, on first use.
+            self.__blueprint_lock = threading.RLock()
+            self.__injector = self.__lazy_injector
         functools.wraps(wrapped, updated=())(self)  # type: ignore
 
-    def __call__(self, *args: object, **kwargs: object) -> object:
-        from .state import current_container
-        kwargs = _inject_kwargs(
-            current_container(),
-            self.__blueprint,
-            self.__injection_offset + len(args),
-            kwargs
-        )
-        return self.__wrapped__(*args, **kwargs)  # type: ignore
-
-    def __get__(self, instance: object, owner: type) -> object:
-        return InjectedBoundWrapper(
-            self.__blueprint,
-            self.__wrapped__.__get__(instance, owner),  # type: ignore
-            isinstance(self.__wrapped__, classmethod)
-            or (not isinstance(self.__wrapped__, staticmethod) and instance is not None)
-        )
+    def __set_blueprint(self, blueprint: InjectionBlueprint) -> None:
+        wrapped = self.__wrapped__
+        func = (wrapped.__func__
+                if isinstance(wrapped, (staticmethod, classmethod)) else
+                wrapped)
+        self.__injector = (func
+                           if blueprint.is_empty() else
+                           build_injector(blueprint, func, offset=self.__offset))
+        self.__blueprint = blueprint
+
+    def __get_blueprint(self) -> InjectionBlueprint:
+        blueprint = self.__blueprint
+        if blueprint is None:
+            with self.__blueprint_lock:
+                if self.__blueprint is None:
+                    self.__set_blueprint(self.__blueprint_factory())
+                    del self.__blueprint_factory
+                blueprint = self.__blueprint
+                assert blueprint is not None
+        return blueprint
+
+    def __lazy_injector(self, *args: object, **kwargs: object) -> object:
+        self.__get_blueprint()
+        return self.__injector(*args, **kwargs)
+
+    # Python looks up __call__ on the type, but still honors descriptors. Retrieving the
+    # injector through a C-level getter avoids the additional Python frame (and the
+    # arguments re-packing) a regular method would have.
+    if TYPE_CHECKING:
+        def __call__(self, *args: object, **kwargs: object) -> object:
+            ...
+    else:
+        __call__ = property(operator.attrgetter('_InjectedWrapper__injector'))
+
+    def __get__(self, instance: object, owner: Optional[type] = None) -> object:
+        # Behaves like the wrapped function or (class/static) method would, a bound
+        # method is only a lightweight (func, self) pair so nothing else needs to be
+        # created. Injection is done by __call__ anyway.
+        if self.__bind_owner:
+            return MethodType(self, owner if owner is not None else type(instance))
+        if instance is None or self.__is_static:
+            return self
+        return MethodType(self, instance)
 
     def __getattr__(self, item: str) -> object:
         return getattr(self.__wrapped__, item)
 
 
 @API.private
-class InjectedBoundWrapper(InjectedWrapper):
+def build_injector(blueprint: InjectionBlueprint,
+                   func: Callable[..., object],
+                   *,
+                   offset: int = 0) -> Callable[..., object]:
+    """
+    Creates the function doing the actual injection. Whenever possible, the generated
+    function has the exact same signature as the wrapped one, except that injected
+    arguments default to a sentinel. Python binds the arguments itself, so only missing
+    dependencies are retrieved and all of them are passed on positionally when possible.
+
+    If the signature cannot be reproduced, typically because func was decorated with
+    another decorator, injection falls back to _inject_kwargs().
+
+    If func may borrow pooled dependencies, see may_borrow(), it checks at each call
+    whether one of its dependencies is pooled. If so, the borrowed instances which were
+    injected are given back at the end of the call.
+    """
+    dependencies = tuple(injection.dependency
+                         for injection in blueprint.injections[offset:]
+                         if injection.dependency is not None)
+    borrowing = may_borrow(func)
+    source_and_values = _injector_source(blueprint, func, offset,
+                                         dependencies if borrowing else None)
+    if source_and_values is None:
+        def injector(*args: object, **kwargs: object) -> object:
+            kwargs = _inject_kwargs(current_container(),
+                                    blueprint,
+                                    offset + len(args),
+                                    kwargs)
+            return func(*args, **kwargs)
+
+        if borrowing:
+            def borrowing_injector(*args: object, **kwargs: object) -> object:
+                if not (pooled_dependencies
+                        and not pooled_dependencies.isdisjoint(dependencies)):
+                    return injector(*args, **kwargs)
+                frame = open_borrowing()
+                try:
+                    kwargs = _inject_kwargs(current_container(),
+                                            blueprint,
+                                            offset + len(args),
+                                            kwargs)
+                    end_borrowing(frame, kwargs.values())
+                    return func(*args, **kwargs)
+                finally:
+                    close_borrowing(frame)
+
+            return borrowing_injector
+        return injector
+
+    source, values = source_and_values
+    return _compile_injector_factory(source)(func, current_container,
+                                             DependencyNotFoundError, *values)
+
+
+@API.private
+@functools.lru_cache(maxsize=None)
+def _compile_injector_factory(source: str) -> Callable[..., Callable[..., object]]:
     """
-    Behaves like Python bound methods. Unsure whether this is really necessary
-    or not.
+    Functions with similar signatures and injections, such as all methods having
+    only their first argument injected, share the same source. Compiling is done only
+    once for those, only the closure changes.
     """
+    namespace: Dict[str, object] = {}
+    exec(source, {}, namespace)
+    return namespace['__create_injector__']  # type: ignore
+
+
+# Names used by the generated code. Any argument starting with the same prefix will
+# force the fallback.
+_PREFIX = '_antidote_'
+
+
+@API.private
+def _injector_source(blueprint: InjectionBlueprint,
+                     func: Callable[..., object],
+                     offset: int,
+                     pooled: Optional[Tuple[Hashable, ...]] = None
+                     ) -> Optional[Tuple[str, List[object]]]:
+    code = getattr(func, '__code__', None)
+    if not inspect.isfunction(func) or code is None:
+        return None
+
+    n_positional = code.co_argcount
+    n_pos_only = getattr(code, 'co_posonlyargcount', 0)
+    n_kw_only = code.co_kwonlyargcount
+    arg_names = code.co_varnames[:n_positional + n_kw_only]
+    var_args_name = var_kwargs_name = None
+    i = n_positional + n_kw_only
+    if code.co_flags & inspect.CO_VARARGS:
+        var_args_name = code.co_varnames[i]
+        i += 1
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        var_kwargs_name = code.co_varnames[i]
+
+    injections = blueprint.injections
+    if (tuple(injection.arg_name for injection in injections) != arg_names
+            or any(name.startswith(_PREFIX) for name in code.co_varnames)):
+        return None
+
+    defaults = func.__defaults__ or ()
+    kw_defaults = func.__kwdefaults__ or {}
+    first_positional_default = n_positional - len(defaults)
+
+    values: List[object] = []  # passed on to __create_injector__
+
+    value_names: List[str] = []
+
+    def value(obj: object) -> str:
+        value_names.append(f"{_PREFIX}{len(values)}")
+        values.append(obj)
+        return value_names[-1]
+
+    parameters: List[str] = []
+    call_args: List[str] = []
+    # (argument name, dependency, default if any)
+    to_inject: List[Tuple[str, str, Optional[str]]] = []
+    has_default = False
+    for i, (name, injection) in enumerate(zip(arg_names, injections)):
+        if i == n_pos_only and n_pos_only > 0:
+            parameters.append('/')
+        if i == n_positional:
+            parameters.append(f'*{var_args_name}' if var_args_name else '*')
+
+        if i < n_positional:
+            default: Optional[str] = (value(defaults[i - first_positional_default])
+                                      if i >= first_positional_default else
+                                      None)
+            call_args.append(name)
+        else:
+            default = value(kw_defaults[name]) if name in kw_defaults else None
+            call_args.append(f'{name}={name}')
+
+        if i >= offset and injection.dependency is not None:
+            if not injection.required and default is None:
+                return None
+            to_inject.append((name,
+                              value(injection.dependency),
+                              None if injection.required else default))
+            parameters.append(f'{name}={_PREFIX}missing')
+            has_default = has_default or i < n_positional
+        elif default is not None:
+            parameters.append(f'{name}={default}')
+            has_default = has_default or i < n_positional
+        elif has_default and i < n_positional:
+            # A positional argument without default cannot follow an injected one.
+            return None
+        else:
+            parameters.append(name)
+
+    if n_positional == len(arg_names) and n_pos_only == n_positional and n_pos_only:
+        parameters.append('/')
+    if var_args_name is not None:
+        if n_positional == len(arg_names):
+            parameters.append(f'*{var_args_name}')
+        call_args.insert(n_positional, f'*{var_args_name}')
+    if var_kwargs_name is not None:
+        parameters.append(f'**{var_kwargs_name}')
+        call_args.append(f'**{var_kwargs_name}')
+
+    if pooled is not None:
+        pooled_candidates = value(pooled)
+        pooled_set = value(pooled_dependencies)
+        open_frame = value(open_borrowing)
+        end_frame = value(end_borrowing)
+        close_frame = value(close_borrowing)
+
+    header = [f"def __create_injector__({_PREFIX}wrapped, {_PREFIX}container, "
+              f"{_PREFIX}not_found, *{_PREFIX}values):",
+              f"    {', '.join(value_names)}, = {_PREFIX}values" if values else "",
+              f"    {_PREFIX}missing = object()",
+              f"    def injector({', '.join(parameters)}):"]
+    lines: List[str] = []
+    if len(to_inject) > 1:
+        condition = ' or '.join(f'{name} is {_PREFIX}missing' for name, _, _ in to_inject)
+        lines.append(f"        if {condition}:")
+        lines.append(f"            {_PREFIX}c = {_PREFIX}container()")
+        indent = ' ' * 12
+        get = f'{_PREFIX}c.get'
+    else:
+        indent = ' ' * 8
+        get = f'{_PREFIX}container().get'
+
+    for name, dependency, default in to_inject:
+        lines.append(f"{indent}if {name} is {_PREFIX}missing:")
+        if default is None:
+            lines.append(f"{indent}    {name} = {get}({dependency})")
+        else:
+            lines.append(f"{indent}    try:")
+            lines.append(f"{indent}        {name} = {get}({dependency})")
+            lines.append(f"{indent}    except {_PREFIX}not_found:")
+            lines.append(f"{indent}        {name} = {default}")
 
-    def __get__(self, instance: object, owner: type) -> object:
-        return self  # pragma: no cover
+    call = f"        return {_PREFIX}wrapped({', '.join(call_args)})"
+    if pooled is not None:
+        injected = ''.join(f'{name}, ' for name, _, _ in to_inject)
+        # Nothing to give back unless one of the dependencies is pooled.
+        lines = [f"        if not ({pooled_set} "
+                 f"and not {pooled_set}.isdisjoint({pooled_candidates})):",
+                 *(f"    {line}" for line in lines),
+                 f"    {call}",
+                 f"        {_PREFIX}frame = {open_frame}()",
+                 "        try:",
+                 *(f"    {line}" for line in lines),
+                 f"            {end_frame}({_PREFIX}frame, ({injected}))",
+                 f"    {call}",
+                 "        finally:",
+                 f"            {close_frame}({_PREFIX}frame)"]
+    else:
+        lines.append(call)
+    lines.append("    return injector")
+    return '\n'.join(header + lines), values
 
 
 @API.private
@@ -126,7 +401,8 @@ def _inject_kwargs(container: Container,
                    offset: int,
                    kwargs: Dict[str, object]) -> Dict[str, object]:
     """
-    Does the actual injection of the dependencies. Used by InjectedCallableWrapper.
+    Does the actual injection of the dependencies. Used by the injector whenever the
+    signature of the wrapped function could not be reproduced.
     """
     dirty_kwargs = False
     for injection in blueprint.injections[offset:]:
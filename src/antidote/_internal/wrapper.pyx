@@ -4,29 +4,95 @@ Cython version of the wrapper, doing the same thing but faster.
 # @formatter:off
 cimport cython
 from cpython.dict cimport PyDict_Copy, PyDict_New
-from cpython.object cimport PyObject_Call, PyObject_CallMethodObjArgs
-from cpython.ref cimport PyObject, Py_XDECREF
+from cpython.object cimport PyObject_Call
+from cpython.ref cimport PyObject, Py_XDECREF, Py_XINCREF
+from cpython.tuple cimport PyTuple_New
 
 from antidote._internal.state cimport fast_get_container
 from antidote.core.container cimport (DependencyResult, RawContainer)
 from ..core.exceptions import DependencyNotFoundError
+from .pool import (close_borrowing, end_borrowing, may_borrow, open_borrowing,
+                   pooled_dependencies)
+
+import threading
+from types import MethodType
 
 # @formatter:on
 
+cdef:
+    # Only ever modified in place.
+    set _pooled = pooled_dependencies
+
 cdef extern from "Python.h":
     PyObject*PyTuple_GET_ITEM(PyObject *p, Py_ssize_t pos)
     Py_ssize_t PyTuple_GET_SIZE(PyObject *p)
     int PyDict_Contains(PyObject *p, PyObject *key) except -1
     int PyDict_SetItem(PyObject *p, PyObject *key, PyObject *val) except -1
+    object PyMethod_New(object func, object self)
+    void PyTuple_SET_ITEM(PyObject *p, Py_ssize_t pos, PyObject *o)
+
+cdef extern from *:
+    """
+    #if PY_VERSION_HEX >= 0x03080000
+        #define ANTIDOTE_HAS_VECTORCALL 1
+        typedef vectorcallfunc antidote_vectorcallfunc;
+        #if PY_VERSION_HEX >= 0x03090000
+            #define antidote_Vectorcall PyObject_Vectorcall
+            #define ANTIDOTE_TPFLAGS_HAVE_VECTORCALL Py_TPFLAGS_HAVE_VECTORCALL
+        #else
+            #define antidote_Vectorcall _PyObject_Vectorcall
+            #define ANTIDOTE_TPFLAGS_HAVE_VECTORCALL _Py_TPFLAGS_HAVE_VECTORCALL
+        #endif
+        #define antidote_vectorcall_nargs(n) PyVectorcall_NARGS(n)
+    #else
+        #define ANTIDOTE_HAS_VECTORCALL 0
+        typedef void *antidote_vectorcallfunc;
+        #define antidote_Vectorcall(f, args, n, kwnames) _PyObject_FastCall(f, args, n)
+        #define antidote_vectorcall_nargs(n) ((Py_ssize_t) (n))
+    #endif
+
+    /* Since Python 3.8 the interpreter does not create bound methods for
+     * obj.method(...) when the type of the method has this flag. It calls it directly
+     * with obj as first argument instead, just like for functions. */
+    static void antidote_set_method_descriptor_flag(PyObject *type) {
+    #if ANTIDOTE_HAS_VECTORCALL
+        ((PyTypeObject *) type)->tp_flags |= Py_TPFLAGS_METHOD_DESCRIPTOR;
+        PyType_Modified((PyTypeObject *) type);
+    #endif
+    }
+
+    /* Instances of the type store their vectorcall function at the given offset. */
+    static void antidote_set_vectorcall_offset(PyObject *type, Py_ssize_t offset) {
+    #if ANTIDOTE_HAS_VECTORCALL
+        ((PyTypeObject *) type)->tp_vectorcall_offset = offset;
+        ((PyTypeObject *) type)->tp_flags |= ANTIDOTE_TPFLAGS_HAVE_VECTORCALL;
+        PyType_Modified((PyTypeObject *) type);
+    #endif
+    }
+    """
+    ctypedef void*antidote_vectorcallfunc
+    object antidote_Vectorcall(object func,
+                               PyObject **args,
+                               Py_ssize_t nargs,
+                               PyObject *kwnames)
+    Py_ssize_t antidote_vectorcall_nargs(size_t nargsf)
+    void antidote_set_method_descriptor_flag(object type)
+    void antidote_set_vectorcall_offset(object type, Py_ssize_t offset)
+
+# Maximum number of arguments passed through the stack (vectorcall), beyond which the
+# arguments tuple and keyword arguments dict are used.
+DEF MAX_VECTORCALL_ARGS = 16
+
+cdef dict _EMPTY_KWARGS = dict()
 
 
 compiled = True
 
 cdef class Injection:
     cdef:
-        str arg_name
-        bint required
-        object dependency
+        readonly str arg_name
+        readonly bint required
+        readonly object dependency
 
     def __repr__(self):
         return f"{type(self).__name__}(arg_name={self.arg_name!r}, " \
@@ -39,7 +105,7 @@ cdef class Injection:
 
 cdef class InjectionBlueprint:
     cdef:
-        tuple injections
+        readonly tuple injections
 
     def __init__(self, tuple injections):
         self.injections = injections
@@ -56,25 +122,76 @@ def build_wrapper(InjectionBlueprint blueprint,
                   object wrapped,
                   bint skip_first = False):
     """
-    Not relying on __init__ neither __cinit__ makes initialization faster which
-    is especially important during __get__ as a InjectedBoundWrapper needs to
-    be created *every* time.
+    Not relying on __init__ neither __cinit__ makes initialization faster.
     """
     cdef:
-        InjectedWrapper wrapper = InjectedWrapper.__new__(InjectedWrapper)
+        InjectedWrapper wrapper = _new_wrapper(wrapped, skip_first)
+    wrapper.set_blueprint(blueprint)
+    return wrapper
+
+def build_lazy_wrapper(object blueprint_factory,
+                       object wrapped,
+                       bint skip_first = False):
+    """
+    The blueprint will only be created, through blueprint_factory, on the first call.
+    """
+    cdef:
+        InjectedWrapper wrapper = _new_wrapper(wrapped, skip_first)
+    wrapper.__blueprint_factory = blueprint_factory
+    # The blueprint is only built once, on first use.
+    wrapper.__blueprint_lock = threading.RLock()
+    return wrapper
+
+cdef InjectedWrapper _new_wrapper(object wrapped, bint skip_first):
+    cdef:
+        InjectedWrapper wrapper
+        bint is_classmethod = isinstance(wrapped, classmethod)
+
+    if is_classmethod or isinstance(wrapped, staticmethod):
+        wrapper = InjectedDescriptorWrapper.__new__(InjectedDescriptorWrapper)
+        (<InjectedDescriptorWrapper> wrapper).__is_classmethod = is_classmethod
+        wrapper.__func = wrapped.__func__
+    else:
+        wrapper = InjectedWrapper.__new__(InjectedWrapper)
+        wrapper.__func = wrapped
     wrapper.__wrapped__ = wrapped
-    wrapper.__blueprint = blueprint
     wrapper.__injection_offset = 1 if skip_first else 0
-    wrapper.__is_classmethod = isinstance(wrapped, classmethod)
-    wrapper.__is_staticmethod = isinstance(wrapped, staticmethod)
+    wrapper.__vectorcall = <antidote_vectorcallfunc> injected_wrapper_vectorcall
     return wrapper
 
+cdef Py_ssize_t _positional_injections_end(InjectionBlueprint blueprint, object func):
+    """
+    Injections which can be safely passed on positionally to func, meaning that they're
+    positional-or-keyword arguments matching the actual signature of func.
+    """
+    cdef:
+        Injection injection
+        Py_ssize_t i = 0
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return 0
+    for injection in blueprint.injections[:code.co_argcount]:
+        if injection.arg_name != code.co_varnames[i]:
+            break
+        i += 1
+    return i
+
 def get_wrapper_dependencies(wrapper):
+    if isinstance(wrapper, MethodType):
+        wrapper = wrapper.__func__
     if not isinstance(wrapper, InjectedWrapper):
         raise TypeError(f"Argument must be an {InjectedWrapper}")
 
     return (<InjectedWrapper> wrapper).get_injections()
 
+def get_wrapper_injections(wrapper):
+    if isinstance(wrapper, MethodType):
+        wrapper = wrapper.__func__
+    if not isinstance(wrapper, InjectedWrapper):
+        raise TypeError(f"Argument must be an {InjectedWrapper}")
+
+    return (<InjectedWrapper> wrapper).get_blueprint().injections
+
 def is_wrapper(x):
     return isinstance(x, InjectedWrapper)
 
@@ -87,19 +204,87 @@ cdef class InjectedWrapper:
     cdef:
         dict __dict__
         readonly object __wrapped__
+        object __func
+        # None until the blueprint_factory of lazy wrappers is called.
         InjectionBlueprint __blueprint
+        object __blueprint_factory
+        object __blueprint_lock
         int __injection_offset
-        bint __is_classmethod
-        bint __is_staticmethod
+        # Injections before this index can be passed on positionally.
+        Py_ssize_t __positional_injections_end
+        # No injection beyond this index.
+        Py_ssize_t __injections_end
+        # Dependencies which may be borrowed from a pool, None if nothing is ever
+        # given back after the call.
+        tuple __borrowable
+        antidote_vectorcallfunc __vectorcall
 
     cdef list get_injections(self):
         cdef:
             Injection inj
+        if self.__blueprint is None:
+            self.initialize()
         return [inj.dependency
                 for inj in self.__blueprint.injections
                 if inj.dependency is not None]
 
+    cdef InjectionBlueprint get_blueprint(self):
+        if self.__blueprint is None:
+            self.initialize()
+        return self.__blueprint
+
+    cdef set_blueprint(self, InjectionBlueprint blueprint):
+        cdef:
+            Injection injection
+            Py_ssize_t i
+        self.__positional_injections_end = _positional_injections_end(blueprint,
+                                                                      self.__func)
+        self.__injections_end = 0
+        for i, injection in enumerate(blueprint.injections):
+            if injection.dependency is not None:
+                self.__injections_end = i + 1
+        self.__borrowable = (tuple(injection.dependency
+                                   for injection in
+                                   blueprint.injections[self.__injection_offset:]
+                                   if injection.dependency is not None)
+                             if may_borrow(self.__func) else None)
+        self.__blueprint = blueprint
+
+    cdef initialize(self):
+        with self.__blueprint_lock:
+            if self.__blueprint is None:
+                self.set_blueprint(self.__blueprint_factory())
+                self.__blueprint_factory = None
+
     def __call__(self, *args, **kwargs):
+        if self.__blueprint is None:
+            self.initialize()
+        if self.__borrows():
+            return self.__borrow_inject_and_call(args, kwargs)
+        return self.__inject_and_call(args, kwargs)
+
+    cdef bint __borrows(self):
+        # Pooled dependencies may be declared after the function.
+        return (self.__borrowable is not None
+                and _pooled
+                and not _pooled.isdisjoint(self.__borrowable))
+
+    cdef object __borrow_inject_and_call(self, tuple args, dict kwargs):
+        frame = open_borrowing()
+        try:
+            kwargs = self.__inject(args, kwargs)
+            end_borrowing(frame, kwargs.values())
+            return PyObject_Call(self.__func, args, kwargs)
+        finally:
+            close_borrowing(frame)
+
+    cdef object __inject_and_call(self, tuple args, dict kwargs):
+        return PyObject_Call(self.__func, args, self.__inject(args, kwargs))
+
+    cdef dict __inject(self, tuple args, dict kwargs):
+        if self.__blueprint is None:
+            self.initialize()
+
         cdef:
             RawContainer container = fast_get_container()
             DependencyResult result
@@ -152,30 +337,129 @@ cdef class InjectedWrapper:
                     elif (<Injection> injection).required:
                         raise DependencyNotFoundError((<Injection> injection).dependency)
 
-        return PyObject_Call(self.__wrapped__, args, kwargs)
+        return kwargs
 
     def __get__(self, instance, owner):
-        cdef:
-            InjectedBoundWrapper wrapper = InjectedBoundWrapper.__new__(
-                InjectedBoundWrapper)
-        wrapper.__wrapped__ = PyObject_CallMethodObjArgs(self.__wrapped__,
-                                                         "__get__",
-                                                         <PyObject*> instance,
-                                                         <PyObject*> owner,
-                                                         NULL)
-        wrapper.__blueprint = self.__blueprint
-        if self.__is_classmethod or (not self.__is_staticmethod and instance is not None):
-            wrapper.__injection_offset = 1
-        else:
-            wrapper.__injection_offset = 0
-        wrapper.__is_classmethod = False
-        wrapper.__is_staticmethod = False
-
-        return wrapper
+        # Behaves like a function. Most of the time this is not even called, see
+        # antidote_set_method_descriptor_flag().
+        if instance is None:
+            return self
+        return PyMethod_New(self, instance)
 
     def __getattr__(self, name):
         return getattr(self.__wrapped__, name)
 
-cdef class InjectedBoundWrapper(InjectedWrapper):
+cdef object injected_wrapper_vectorcall(InjectedWrapper self,
+                                        PyObject **args,
+                                        size_t nargsf,
+                                        PyObject *kwnames):
+    """
+    Positional arguments are passed on as is to the wrapped function with the injected
+    dependencies appended to them, without creating any tuple nor dict. If not possible,
+    typically because some dependencies can only be passed by name or because the caller
+    used keyword arguments, it falls back to the arguments tuple and keyword arguments
+    dict.
+    """
+    cdef:
+        RawContainer container
+        DependencyResult result
+        PyObject *stack[MAX_VECTORCALL_ARGS]
+        PyObject *injection
+        PyObject *injections
+        Py_ssize_t nargs = antidote_vectorcall_nargs(nargsf)
+        Py_ssize_t i = self.__injection_offset + nargs
+        Py_ssize_t end
+        Py_ssize_t n = nargs
+        Py_ssize_t j
+
+    if self.__blueprint is None:
+        self.initialize()
+    if self.__borrows():
+        return _inject_and_call_from_vector(self, args, nargs, kwnames)
+    injections = <PyObject*> self.__blueprint.injections
+    end = min(self.__positional_injections_end, self.__injections_end)
+
+    if kwnames != NULL:
+        return _inject_and_call_from_vector(self, args, nargs, kwnames)
+
+    if i >= self.__injections_end:
+        return antidote_Vectorcall(self.__func, args, nargs, NULL)
+
+    # Both the positional arguments and the injected dependencies must fit in the stack.
+    if nargs + max(<Py_ssize_t> 0, end - i) > MAX_VECTORCALL_ARGS:
+        return _inject_and_call_from_vector(self, args, nargs, NULL)
+
+    for j in range(nargs):
+        stack[j] = args[j]
+
+    container = fast_get_container()
+    result.value = NULL
+    try:
+        while i < end:
+            injection = PyTuple_GET_ITEM(injections, i)
+            if (<Injection> injection).dependency is None:
+                break
+            container.fast_get(<PyObject*> (<Injection> injection).dependency, &result)
+            if result.value == NULL:
+                if (<Injection> injection).required:
+                    raise DependencyNotFoundError((<Injection> injection).dependency)
+                i += 1
+                break
+            stack[n] = result.value
+            n += 1
+            i += 1
+
+        if i < self.__injections_end:
+            # Remaining injections must be passed by name.
+            return _inject_and_call_from_vector(self, stack, n, NULL)
+        return antidote_Vectorcall(self.__func, stack, n, NULL)
+    finally:
+        for j in range(nargs, n):
+            Py_XDECREF(stack[j])
+
+cdef object _inject_and_call_from_vector(InjectedWrapper self,
+                                         PyObject **args,
+                                         Py_ssize_t nargs,
+                                         PyObject *kwnames):
+    cdef:
+        tuple args_tuple = PyTuple_New(nargs)
+        dict kwargs = _EMPTY_KWARGS
+        Py_ssize_t i
+
+    for i in range(nargs):
+        Py_XINCREF(args[i])
+        PyTuple_SET_ITEM(<PyObject*> args_tuple, i, args[i])
+
+    if kwnames != NULL:
+        kwargs = PyDict_New()
+        for i in range(PyTuple_GET_SIZE(kwnames)):
+            PyDict_SetItem(<PyObject*> kwargs,
+                           PyTuple_GET_ITEM(kwnames, i),
+                           args[nargs + i])
+
+    if self.__borrows():
+        return self.__borrow_inject_and_call(args_tuple, kwargs)
+    return self.__inject_and_call(args_tuple, kwargs)
+
+cdef Py_ssize_t _vectorcall_offset():
+    cdef:
+        InjectedWrapper wrapper = InjectedWrapper.__new__(InjectedWrapper)
+    return <char*> &wrapper.__vectorcall - <char*> <PyObject*> wrapper
+
+antidote_set_method_descriptor_flag(InjectedWrapper)
+antidote_set_vectorcall_offset(InjectedWrapper, _vectorcall_offset())
+
+cdef class InjectedDescriptorWrapper(InjectedWrapper):
+    """
+    Wrapper of a classmethod or a staticmethod, which cannot be called directly with
+    the instance as first argument.
+    """
+    cdef:
+        bint __is_classmethod
+
     def __get__(self, instance, owner):
+        if self.__is_classmethod:
+            return PyMethod_New(self, owner if owner is not None else type(instance))
         return self
+
+antidote_set_vectorcall_offset(InjectedDescriptorWrapper, _vectorcall_offset())
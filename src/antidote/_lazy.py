@@ -1,5 +1,6 @@
 import weakref
-from typing import Callable, Dict, Optional, TYPE_CHECKING, Tuple, Union, cast
+from typing import (Callable, Dict, Hashable, Iterator, Optional, TYPE_CHECKING, Tuple,
+                    Union, cast)
 
 from ._compatibility.typing import final
 from ._internal import API
@@ -36,7 +37,8 @@ class LazyCallWithArgsKwargs(FinalImmutable, Lazy):
 
     def lazy_get(self, container: Container) -> DependencyValue:
         return DependencyValue(self.func(*self._args, **self._kwargs),
-                               scope=self._scope)
+                               scope=self._scope,
+                               cacheable=True)
 
 
 @API.private
@@ -102,4 +104,121 @@ class LazyMethodCallDependency(FinalImmutable, Lazy):
         assert owner is not None
         descriptor = cast('LazyMethodCall', self.__descriptor)
         return DependencyValue(descriptor.__get__(container.get(owner), owner),
-                               scope=descriptor._scope)
+                               scope=descriptor._scope,
+                               cacheable=True)
+
+
+@API.private
+@final
+class LazyProxyDependency(FinalImmutable, Lazy):
+    """
+    Injected instead of the dependency with :py:obj:`.LazyProvide`.
+
+    :meta private:
+    """
+    __slots__ = ('dependency',)
+    dependency: Hashable
+
+    def __antidote_debug_repr__(self) -> str:
+        return f"Lazy proxy: {debug_repr(self.dependency)}"
+
+    def debug_info(self) -> DependencyDebug:
+        return DependencyDebug(self.__antidote_debug_repr__(),
+                               dependencies=[self.dependency])
+
+    def lazy_get(self, container: Container) -> DependencyValue:
+        return DependencyValue(LazyProxy(self.dependency, container))
+
+
+_UNRESOLVED = object()
+
+
+@API.private
+@final
+class LazyProxy:
+    """
+    Retrieves the dependency on first use and forwards everything to it afterwards.
+
+    :meta private:
+    """
+    __slots__ = ('__dependency', '__container', '__instance')
+    __dependency: Hashable
+    __container: Container
+    __instance: object
+
+    def __init__(self, dependency: Hashable, container: Container) -> None:
+        object.__setattr__(self, '_LazyProxy__dependency', dependency)
+        object.__setattr__(self, '_LazyProxy__container', container)
+        object.__setattr__(self, '_LazyProxy__instance', _UNRESOLVED)
+
+    def __resolve(self) -> object:
+        instance = self.__instance
+        if instance is _UNRESOLVED:
+            instance = self.__container.get(self.__dependency)
+            # Another thread may have been faster.
+            if self.__instance is _UNRESOLVED:
+                object.__setattr__(self, '_LazyProxy__instance', instance)
+            else:
+                instance = self.__instance
+        return instance
+
+    @property  # type: ignore
+    def __class__(self) -> type:
+        return type(self.__resolve())
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.__resolve(), name)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        setattr(self.__resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self.__resolve(), name)
+
+    def __dir__(self) -> Iterator[str]:
+        return iter(dir(self.__resolve()))
+
+    def __repr__(self) -> str:
+        return repr(self.__resolve())
+
+    def __str__(self) -> str:
+        return str(self.__resolve())
+
+    def __bool__(self) -> bool:
+        return bool(self.__resolve())
+
+    def __eq__(self, other: object) -> bool:
+        return self.__resolve() == other
+
+    def __ne__(self, other: object) -> bool:
+        return self.__resolve() != other
+
+    def __hash__(self) -> int:
+        return hash(self.__resolve())
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        return self.__resolve()(*args, **kwargs)  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self.__resolve())  # type: ignore
+
+    def __iter__(self) -> Iterator[object]:
+        return iter(self.__resolve())  # type: ignore
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.__resolve()  # type: ignore
+
+    def __getitem__(self, key: object) -> object:
+        return self.__resolve()[key]  # type: ignore
+
+    def __setitem__(self, key: object, value: object) -> None:
+        self.__resolve()[key] = value  # type: ignore
+
+    def __delitem__(self, key: object) -> None:
+        del self.__resolve()[key]  # type: ignore
+
+    def __enter__(self) -> object:
+        return self.__resolve().__enter__()  # type: ignore
+
+    def __exit__(self, *args: object) -> object:
+        return self.__resolve().__exit__(*args)  # type: ignore
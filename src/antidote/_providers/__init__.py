@@ -1,8 +1,10 @@
 from .factory import FactoryProvider
 from .indirect import IndirectProvider
 from .lazy import Lazy, LazyProvider
+from .lazy_import import LazyImportProvider
 from .service import ServiceProvider
 from .tag import DuplicateTagError, Tag, TagProvider, Tagged
 
 __all__ = ['FactoryProvider', 'IndirectProvider', 'Lazy', 'LazyProvider',
-           'ServiceProvider', 'DuplicateTagError', 'Tag', 'Tagged', 'TagProvider']
+           'LazyImportProvider', 'ServiceProvider', 'DuplicateTagError', 'Tag', 'Tagged',
+           'TagProvider']
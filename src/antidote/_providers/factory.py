@@ -3,6 +3,7 @@ from typing import Callable, Dict, Hashable, Optional, Union
 
 from .service import Build
 from .._internal import API
+from .._internal.pool import Pool, declare_pooled
 from .._internal.utils import FinalImmutable, SlotRecord, debug_repr
 from ..core import (Container, Dependency, DependencyDebug, DependencyValue, Provider,
                     Scope)
@@ -13,6 +14,7 @@ class FactoryProvider(Provider[Hashable]):
     def __init__(self) -> None:
         super().__init__()
         self.__factories: Dict[FactoryDependency, Factory] = dict()
+        self.__disposers: Dict[FactoryDependency, Callable[[object], object]] = dict()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(factories={list(self.__factories.keys())})"
@@ -30,6 +32,7 @@ class FactoryProvider(Provider[Hashable]):
                 for k, f in self.__factories.items()
             }
         p.__factories = factories
+        p.__disposers = self.__disposers.copy()
         return p
 
     def exists(self, dependency: Hashable) -> bool:
@@ -67,6 +70,12 @@ class FactoryProvider(Provider[Hashable]):
                                wired=wired,
                                dependencies=dependencies)
 
+    def maybe_disposer(self, build: Hashable) -> Optional[Callable[[object], object]]:
+        dependency_factory = build.dependency if isinstance(build, Build) else build
+        if not isinstance(dependency_factory, FactoryDependency):
+            return None
+        return self.__disposers.get(dependency_factory)
+
     def maybe_provide(self, build: Hashable, container: Container
                       ) -> Optional[DependencyValue]:
         dependency_factory = build.dependency if isinstance(build, Build) else build
@@ -83,30 +92,43 @@ class FactoryProvider(Provider[Hashable]):
             assert f.is_singleton(), "factory dependency is expected to be a singleton"
             factory.function = f.unwrapped
 
-        instance = (factory.function(**build.kwargs)
-                    if isinstance(build, Build) and build.kwargs
-                    else factory.function())
+        if isinstance(build, Build) and build.kwargs:
+            instance = factory.function(**build.kwargs)
+        elif factory.pool is not None:
+            instance = factory.pool.acquire(factory.function)
+        else:
+            instance = factory.function()
 
-        return DependencyValue(instance, scope=factory.scope)
+        return DependencyValue(instance, scope=factory.scope, cacheable=True)
 
     def register(self,
                  output: type,
                  *,
                  factory: Union[Callable[..., object], Dependency[Hashable]],
-                 scope: Optional[Scope]
+                 scope: Optional[Scope],
+                 pool: Optional[int] = None,
+                 dispose: Optional[Callable[[object], object]] = None
                  ) -> 'FactoryDependency':
         assert inspect.isclass(output) \
                and (callable(factory) or isinstance(factory, Dependency)) \
-               and (isinstance(scope, Scope) or scope is None)
+               and (isinstance(scope, Scope) or scope is None) \
+               and (pool is None or scope is None)
         factory_dependency = FactoryDependency(output, factory)
         self._assert_not_duplicate(factory_dependency)
 
+        factory_pool: Optional[Pool] = Pool(pool) if pool is not None else None
         if isinstance(factory, Dependency):
             self.__factories[factory_dependency] = Factory(scope,
-                                                           dependency=factory.unwrapped)
+                                                           dependency=factory.unwrapped,
+                                                           pool=factory_pool)
         else:
             self.__factories[factory_dependency] = Factory(scope,
-                                                           function=factory)
+                                                           function=factory,
+                                                           pool=factory_pool)
+        if pool is not None:
+            declare_pooled(factory_dependency)
+        if dispose is not None:
+            self.__disposers[factory_dependency] = dispose
 
         return factory_dependency
 
@@ -147,19 +169,22 @@ class FactoryDependency(FinalImmutable):
 
 @API.private
 class Factory(SlotRecord):
-    __slots__ = ('scope', 'function', 'dependency')
+    __slots__ = ('scope', 'function', 'dependency', 'pool')
     scope: Optional[Scope]
     function: Callable[..., object]
     dependency: Hashable
+    pool: Optional[Pool]
 
     def __init__(self,
                  scope: Optional[Scope],
                  function: Callable[..., object] = None,
-                 dependency: Hashable = None):
+                 dependency: Hashable = None,
+                 pool: Optional[Pool] = None):
         assert function is not None or dependency is not None
-        super().__init__(scope, function, dependency)
+        super().__init__(scope, function, dependency, pool)
 
     def copy(self, keep_function: bool = True) -> 'Factory':
         return Factory(self.scope,
                        self.function if keep_function else None,
-                       self.dependency)
+                       self.dependency,
+                       self.pool.clone() if self.pool is not None else None)
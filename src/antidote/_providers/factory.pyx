@@ -3,12 +3,14 @@ from typing import Callable, Dict, Hashable, Optional, Union
 
 # @formatter:off
 cimport cython
-from cpython.ref cimport PyObject, Py_XDECREF
+from cpython.ref cimport PyObject, Py_XDECREF, Py_XINCREF
 
 from antidote._providers.service cimport Build
 from antidote.core.container cimport (DependencyResult, FastProvider, Header,
                                       HeaderObject, header_is_singleton, Scope,
-                                      RawContainer, header_flag_cacheable)
+                                      RawContainer, header_flag_cacheable,
+                                      header_flag_callable, header_flag_no_scope)
+from .._internal.pool import Pool, declare_pooled
 from .._internal.utils import debug_repr
 from ..core import Dependency, DependencyDebug
 from ..core.exceptions import DependencyNotFoundError
@@ -26,12 +28,14 @@ cdef extern from "Python.h":
 cdef class FactoryProvider(FastProvider):
     cdef:
         dict __factories
+        dict __disposers
         tuple __empty_tuple
         object __weakref__
 
     def __init__(self):
         super().__init__()
         self.__factories = dict()  # type: Dict[FactoryDependency, Factory]
+        self.__disposers = dict()  # type: Dict[FactoryDependency, Callable]
         self.__empty_tuple = tuple()
 
     def __repr__(self):
@@ -54,6 +58,7 @@ cdef class FactoryProvider(FastProvider):
                 for k, f in self.__factories.items()
             }
         p.__factories = factories
+        p.__disposers = self.__disposers.copy()
         return p
 
     def exists(self, dependency: Hashable) -> bool:
@@ -92,12 +97,17 @@ cdef class FactoryProvider(FastProvider):
             wired=wired,
             dependencies=dependencies)
 
+    def maybe_disposer(self, build: Hashable):
+        dependency_factory = build.dependency if isinstance(build, Build) else build
+        return self.__disposers.get(dependency_factory)
+
     cdef fast_provide(self,
                       PyObject*dependency,
                       PyObject*container,
                       DependencyResult*result):
         cdef:
             PyObject*factory
+            object instance
             bint is_build_dependency = PyObject_IsInstance(dependency, <PyObject*> Build)
             PyObject*dependency_factory = (<PyObject*> (<Build> dependency).dependency
                                            if is_build_dependency else
@@ -128,8 +138,17 @@ cdef class FactoryProvider(FastProvider):
                 <PyObject*> self.__empty_tuple,
                 <PyObject*> (<Build> dependency).kwargs
             )
+        elif (<Factory> factory).pool is not None:
+            result.header = (<Factory> factory).header | header_flag_cacheable()
+            instance = (<Factory> factory).pool.acquire((<Factory> factory).function)
+            result.value = <PyObject*> instance
+            Py_XINCREF(result.value)
         else:
             result.header = (<Factory> factory).header | header_flag_cacheable()
+            if (<Factory> factory).header == header_flag_no_scope():
+                # The container can call the factory directly from now on.
+                result.header |= header_flag_callable()
+                result.callable = <PyObject*> (<Factory> factory).function
             result.value = PyObject_CallObject(
                 <PyObject*> (<Factory> factory).function,
                 NULL
@@ -139,12 +158,16 @@ cdef class FactoryProvider(FastProvider):
                  output: type,
                  *,
                  factory: Union[Callable, Dependency],
-                 Scope scope) -> FactoryDependency:
+                 Scope scope,
+                 pool: Optional[int] = None,
+                 dispose: Optional[Callable] = None) -> FactoryDependency:
         cdef:
             Header header
+            object factory_pool = Pool(pool) if pool is not None else None
         assert inspect.isclass(output) \
                and (callable(factory) or isinstance(factory, Dependency)) \
-               and (isinstance(scope, Scope) or scope is None)
+               and (isinstance(scope, Scope) or scope is None) \
+               and (pool is None or scope is None)
         with self._bound_container_ensure_not_frozen():
             factory_dependency = FactoryDependency(output, factory)
             self._bound_container_raise_if_exists(factory_dependency)
@@ -154,14 +177,20 @@ cdef class FactoryProvider(FastProvider):
                 self.__factories[factory_dependency] = Factory.__new__(
                     Factory,
                     header,
-                    dependency=factory.unwrapped
+                    dependency=factory.unwrapped,
+                    pool=factory_pool
                 )
             else:
                 self.__factories[factory_dependency] = Factory.__new__(
                     Factory,
                     header,
-                    function=factory
+                    function=factory,
+                    pool=factory_pool
                 )
+            if pool is not None:
+                declare_pooled(factory_dependency)
+            if dispose is not None:
+                self.__disposers[factory_dependency] = dispose
 
             return factory_dependency
 
@@ -209,23 +238,29 @@ cdef class Factory:
         Header header
         object function
         object dependency
+        object pool
 
     def __cinit__(self,
                   Header header,
                   function: Callable = None,
-                  dependency: Hashable = None):
+                  dependency: Hashable = None,
+                  pool: Optional[Pool] = None):
         assert function is not None or dependency is not None
         self.header = header
         self.function = function
         self.dependency = dependency
+        self.pool = pool
 
     def __repr__(self):
         return (f"{type(self).__name__}(function={self.function}, "
                 f"dependency={self.dependency})")
 
     def copy(self):
-        return Factory(self.header, self.function, self.dependency)
+        return Factory(self.header, self.function, self.dependency, self.__clone_pool())
 
     def copy_without_function(self):
         assert self.dependency is not None
-        return Factory(self.header, None, self.dependency)
+        return Factory(self.header, None, self.dependency, self.__clone_pool())
+
+    cdef object __clone_pool(self):
+        return self.pool.clone() if self.pool is not None else None
@@ -0,0 +1,122 @@
+"""
+Compilation of object graphs of non-singleton services. Every time such a service is
+retrieved, all of its non-singleton service dependencies must be created again, each
+one going through the container and its own injection. Once the world is frozen, the
+graph cannot change anymore, so it can be compiled into a single function calling all
+the constructors in topological order and passing the arguments directly.
+"""
+import inspect
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from .._internal import API
+from .._internal.state import current_container
+from .._internal.wrapper import get_wrapper_injections, is_wrapper
+
+# Names used by the generated code.
+_PREFIX = '_antidote_'
+
+
+@API.private
+def compile_graphs(transients: Set[Hashable]) -> Dict[Hashable, Callable[[], object]]:
+    """
+    Args:
+        transients: Non-singleton services without scope. Those are the only ones which
+            can be created directly, any other dependency is retrieved from the
+            container.
+
+    Returns:
+        Mapping of the services to the function creating them. Only services which
+        have at least one dependency in :code:`transients` are compiled.
+    """
+    builders: Dict[Hashable, Callable[[], object]] = dict()
+    for klass in transients:
+        source_and_values = _builder_source(klass, transients)
+        if source_and_values is not None:
+            source, values = source_and_values
+            namespace: Dict[str, object] = {}
+            exec(source, {}, namespace)
+            builders[klass] = namespace['__create_builder__'](  # type: ignore
+                current_container, *values)
+    return builders
+
+
+def _builder_source(klass: Hashable,
+                    transients: Set[Hashable]) -> Optional[Tuple[str, List[object]]]:
+    values: List[object] = []  # passed on to __create_builder__
+    lines: List[str] = []
+    stack: List[Hashable] = []
+
+    def value(obj: object) -> str:
+        values.append(obj)
+        return f"{_PREFIX}{len(values) - 1}"
+
+    def node(dependency: Hashable) -> str:
+        """Adds the statement creating the dependency, returns its variable name."""
+        if dependency in stack:
+            raise _Cycle()
+        stack.append(dependency)
+        args = []
+        for name, arg in _arguments(dependency):
+            expr = node(arg) if arg in transients else f"{_PREFIX}get({value(arg)})"
+            args.append(f"{name}={expr}" if name else expr)
+        stack.pop()
+        lines.append(f"        {_PREFIX}n{len(lines)} = "
+                     f"{value(dependency)}({', '.join(args)})")
+        return f"{_PREFIX}n{len(lines) - 1}"
+
+    try:
+        result = node(klass)
+    except _Cycle:
+        return None
+
+    if len(lines) == 1:
+        return None
+
+    header = [f"def __create_builder__({_PREFIX}container, *{_PREFIX}values):",
+              f"    {''.join(f'{_PREFIX}{i}, ' for i in range(len(values)))}"
+              f"= {_PREFIX}values",
+              "    def build():"]
+    if any(f"{_PREFIX}get(" in line for line in lines):
+        header.append(f"        {_PREFIX}get = {_PREFIX}container().get")
+    lines.append(f"        return {result}")
+    lines.append("    return build")
+    return '\n'.join(header + lines), values
+
+
+class _Cycle(Exception):
+    pass
+
+
+def _arguments(klass: Hashable) -> List[Tuple[Optional[str], Hashable]]:
+    """
+    Injected arguments of the constructor which can be passed explicitly, with their
+    name or None if passed positionally. Optional dependencies are left to the
+    injection.
+    """
+    init = getattr(klass, '__init__', None)
+    if not is_wrapper(init):
+        return []
+
+    try:
+        parameters = inspect.signature(init.__wrapped__).parameters  # type: ignore
+    except (TypeError, ValueError):  # pragma: no cover
+        return []
+
+    arguments: List[Tuple[Optional[str], Hashable]] = []
+    # Positional arguments are usually faster, but can only be used as long as all
+    # the previous ones have also been passed.
+    positional = True
+    for i, injection in enumerate(get_wrapper_injections(init)):  # type: ignore
+        if i == 0:  # self
+            continue
+        if injection.dependency is None or not injection.required:
+            positional = False
+            continue
+        parameter = parameters.get(injection.arg_name)
+        if parameter is None or parameter.kind not in {parameter.POSITIONAL_OR_KEYWORD,
+                                                       parameter.KEYWORD_ONLY}:
+            return []
+        positional = positional and parameter.kind == parameter.POSITIONAL_OR_KEYWORD
+        arguments.append((None if positional else injection.arg_name,
+                          injection.dependency))
+    return arguments
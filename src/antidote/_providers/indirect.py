@@ -4,6 +4,7 @@ from typing import Callable, Dict, Hashable, Optional
 from .._internal import API
 from .._internal.utils import debug_repr, FinalImmutable
 from ..core import Container, DependencyDebug, DependencyValue, Provider, Scope
+from ..core.container import RawContainer
 
 
 @API.private
@@ -22,10 +23,20 @@ class IndirectProvider(Provider[Hashable]):
         return p
 
     def exists(self, dependency: Hashable) -> bool:
+        if isinstance(dependency, ImplementationTarget):
+            dependency = dependency.implementation_dependency
         return (isinstance(dependency, ImplementationDependency)
                 and dependency in self.__implementations)
 
     def maybe_debug(self, dependency: Hashable) -> Optional[DependencyDebug]:
+        if isinstance(dependency, ImplementationTarget):
+            impl = dependency.implementation_dependency
+            if impl not in self.__implementations:
+                return None
+            return DependencyDebug(debug_repr(dependency),
+                                   scope=impl.scope,
+                                   wired=[impl.implementation])
+
         if not isinstance(dependency, ImplementationDependency):
             return None
 
@@ -38,12 +49,18 @@ class IndirectProvider(Provider[Hashable]):
             target = dependency.implementation()
 
         return DependencyDebug(debug_repr(dependency),
-                               scope=Scope.singleton() if dependency.permanent else None,
+                               scope=dependency.scope,
                                wired=[dependency.implementation],  # type: ignore
                                dependencies=[target])
 
     def maybe_provide(self, dependency: Hashable, container: Container
                       ) -> Optional[DependencyValue]:
+        if isinstance(dependency, ImplementationTarget):
+            impl = dependency.implementation_dependency
+            if impl not in self.__implementations:
+                return None
+            return DependencyValue(impl.implementation(), scope=impl.scope)
+
         if not isinstance(dependency, ImplementationDependency):
             return None
 
@@ -53,12 +70,23 @@ class IndirectProvider(Provider[Hashable]):
             return None
 
         if target is not None:
+            _add_alias(self, container, dependency, target)
             return container.provide(target)
+        elif dependency.target is not None:
+            # The target itself is kept by the container within the scope.
+            value = container.provide(container.get(dependency.target))
+            return DependencyValue(
+                value.unwrapped,
+                scope=(dependency.scope
+                       if value.is_singleton() or value.scope is dependency.scope
+                       else None)
+            )
         else:
             # Mypy treats linker as a method
             target = dependency.implementation()
             if dependency.permanent:
                 self.__implementations[dependency] = target
+                _add_alias(self, container, dependency, target)
             value = container.provide(target)
             return DependencyValue(
                 value.unwrapped,
@@ -69,32 +97,53 @@ class IndirectProvider(Provider[Hashable]):
                                 interface: type,
                                 implementation: Callable[[], Hashable],
                                 *,
-                                permanent: bool
+                                permanent: bool,
+                                scope: Optional[Scope] = None
                                 ) -> 'ImplementationDependency':
         assert callable(implementation) \
                and inspect.isclass(interface) \
-               and isinstance(permanent, bool)
-        impl = ImplementationDependency(interface, implementation, permanent)
+               and isinstance(permanent, bool) \
+               and (scope is None or (isinstance(scope, Scope) and not permanent))
+        impl = ImplementationDependency(interface, implementation, permanent, scope)
         self._assert_not_duplicate(impl)
         self.__implementations[impl] = None
         return impl
 
 
+@API.private
+def _add_alias(provider: IndirectProvider,
+               container: Container,
+               dependency: Hashable,
+               target: Hashable) -> None:
+    # The container will directly retrieve the target from now on.
+    if provider.is_registered and isinstance(container, RawContainer):
+        container.add_alias(dependency, target)
+
+
 @API.private
 class ImplementationDependency(FinalImmutable):
-    __slots__ = ('interface', 'implementation', 'permanent', '__hash')
+    __slots__ = ('interface', 'implementation', 'permanent', 'scope', 'target', '__hash')
     interface: type
     implementation: Callable[[], Hashable]
     permanent: bool
+    scope: Optional[Scope]
+    target: 'Optional[ImplementationTarget]'
     __hash: int
 
     def __init__(self,
                  interface: Hashable,
                  implementation: Callable[[], Hashable],
-                 permanent: bool):
+                 permanent: bool,
+                 scope: Optional[Scope] = None):
+        """
+        Non-permanent implementations with a scope keep their target as the dependency
+        :code:`target` within the scope.
+        """
         super().__init__(interface,
                          implementation,
                          permanent,
+                         Scope.singleton() if permanent else scope,
+                         ImplementationTarget(self) if scope is not None else None,
                          hash((interface, implementation)))
 
     def __repr__(self) -> str:
@@ -103,6 +152,8 @@ class ImplementationDependency(FinalImmutable):
     def __antidote_debug_repr__(self) -> str:
         if self.permanent:
             return f"Permanent implementation: {self}"
+        elif self.scope is not None:
+            return f"Implementation (scope={self.scope.name}): {self}"
         else:
             return f"Implementation: {self}"
 
@@ -122,3 +173,18 @@ class ImplementationDependency(FinalImmutable):
                 and (self.implementation is other.implementation  # type: ignore
                      or self.implementation == other.implementation)  # type: ignore
                 )  # noqa
+
+
+@API.private
+class ImplementationTarget(FinalImmutable):
+    """
+    Dependency of the target chosen by a non-permanent implementation with a scope.
+    """
+    __slots__ = ('implementation_dependency',)
+    implementation_dependency: ImplementationDependency
+
+    def __repr__(self) -> str:
+        return f"ImplementationTarget({self.implementation_dependency})"
+
+    def __antidote_debug_repr__(self) -> str:
+        return f"Target of {self.implementation_dependency}"
@@ -5,10 +5,11 @@ from typing import Callable, Dict, Hashable, Optional
 cimport cython
 from cpython.ref cimport PyObject, Py_XDECREF
 
-from antidote.core.container cimport (DependencyResult, FastProvider, RawContainer,
-                                     header_flag_cacheable)
+from antidote.core.container cimport (DependencyResult, FastProvider, Header, HeaderObject,
+                                     RawContainer, Scope, header_flag_cacheable,
+                                     header_is_singleton)
 from .._internal.utils import debug_repr
-from ..core import DependencyDebug, Scope
+from ..core import DependencyDebug
 from ..core.exceptions import DependencyNotFoundError
 
 # @formatter:on
@@ -19,6 +20,7 @@ cdef extern from "Python.h":
     PyObject*PyDict_GetItem(PyObject *p, PyObject *key)
     PyObject*PyObject_CallObject(PyObject *callable, PyObject *args) except NULL
     int PySet_Contains(PyObject *anyset, PyObject *key) except -1
+    int PyObject_IsInstance(PyObject *inst, PyObject *cls) except -1
 
 
 @cython.final
@@ -40,6 +42,8 @@ cdef class IndirectProvider(FastProvider):
         return p
 
     def exists(self, dependency: Hashable) -> bool:
+        if isinstance(dependency, ImplementationTarget):
+            dependency = dependency.implementation_dependency
         return (isinstance(dependency, ImplementationDependency)
                 and dependency in self.__implementations)
 
@@ -47,6 +51,14 @@ cdef class IndirectProvider(FastProvider):
         cdef:
             ImplementationDependency impl
 
+        if isinstance(dependency, ImplementationTarget):
+            impl = (<ImplementationTarget> dependency).implementation_dependency
+            if impl not in self.__implementations:
+                return None
+            return DependencyDebug(debug_repr(dependency),
+                                   scope=impl.scope,
+                                   wired=[impl.implementation])  # type: ignore
+
         if not isinstance(dependency, ImplementationDependency):
             return None
 
@@ -60,7 +72,7 @@ cdef class IndirectProvider(FastProvider):
             target = impl.implementation()
 
         return DependencyDebug(debug_repr(impl),
-                               scope=Scope.singleton() if impl.permanent else None,
+                               scope=impl.scope,
                                wired=[impl.implementation],  # type: ignore
                                dependencies=[target])
 
@@ -71,15 +83,42 @@ cdef class IndirectProvider(FastProvider):
         cdef:
             PyObject*ptr
             PyObject*target
+            ImplementationDependency impl
+            Header scope_header
 
         ptr = PyDict_GetItem(<PyObject*> self.__implementations, dependency)
         if ptr is NULL:
+            if PyObject_IsInstance(dependency, <PyObject*> ImplementationTarget):
+                self.__provide_target(
+                    (<ImplementationTarget> dependency).implementation_dependency,
+                    result
+                )
             return
         elif ptr is not Py_None:
             (<RawContainer> container).fast_get(ptr, result)
-            result.header |= header_flag_cacheable()
             if result.value is NULL:
                 raise DependencyNotFoundError(<object> ptr)
+            self.__add_alias(container, dependency, ptr, result)
+        elif (<ImplementationDependency> dependency).target is not None:
+            # The target itself is kept by the container within the scope.
+            impl = <ImplementationDependency> dependency
+            (<RawContainer> container).fast_get(<PyObject*> impl.target, result)
+            if result.value is NULL:
+                raise DependencyNotFoundError(impl.target)
+            target = result.value
+            (<RawContainer> container).fast_get(target, result)
+            if result.value is NULL:
+                error = DependencyNotFoundError(<object> target)
+                Py_XDECREF(target)
+                raise error
+            Py_XDECREF(target)
+
+            scope_header = HeaderObject.from_scope(impl.scope).header
+            if header_is_singleton(result.header) \
+                    or (result.header & ~header_flag_cacheable()) == scope_header:
+                result.header = scope_header
+            else:
+                result.header = 0
         else:
             target = PyObject_CallObject(
                 <PyObject*> (<ImplementationDependency> dependency).implementation,
@@ -92,25 +131,46 @@ cdef class IndirectProvider(FastProvider):
                 raise error
 
             if (<ImplementationDependency> dependency).permanent:
-                result.header |= header_flag_cacheable()
                 PyDict_SetItem(<PyObject*> self.__implementations,
                                dependency,
                                target)
+                self.__add_alias(container, dependency, target, result)
             else:
                 result.header = 0
 
             Py_XDECREF(target)
 
+    cdef __provide_target(self,
+                          ImplementationDependency impl,
+                          DependencyResult*result):
+        if PyDict_GetItem(<PyObject*> self.__implementations, <PyObject*> impl) is NULL:
+            return
+        result.value = PyObject_CallObject(<PyObject*> impl.implementation, NULL)
+        result.header = HeaderObject.from_scope(impl.scope).header
+
+    cdef __add_alias(self,
+                     PyObject*container,
+                     PyObject*dependency,
+                     PyObject*target,
+                     DependencyResult*result):
+        # The container will directly retrieve the target from now on. So the result
+        # must not be cacheable, the container would replace the alias otherwise.
+        if self._container_ref is not None:
+            (<RawContainer> container).add_alias(<object> dependency, <object> target)
+            result.header &= ~header_flag_cacheable()
+
     def register_implementation(self,
                                 interface: type,
                                 implementation: Callable[[], Hashable],
                                 *,
-                                permanent: bool
+                                permanent: bool,
+                                scope: Optional[Scope] = None
                                 ) -> 'ImplementationDependency':
         assert callable(implementation) \
                and inspect.isclass(interface) \
-               and isinstance(permanent, bool)
-        impl = ImplementationDependency(interface, implementation, permanent)
+               and isinstance(permanent, bool) \
+               and (scope is None or (isinstance(scope, Scope) and not permanent))
+        impl = ImplementationDependency(interface, implementation, permanent, scope)
         with self._bound_container_ensure_not_frozen():
             self._bound_container_raise_if_exists(impl)
             self.__implementations[impl] = None
@@ -122,15 +182,20 @@ cdef class ImplementationDependency:
         readonly object interface
         readonly object implementation
         readonly bint permanent
+        readonly Scope scope
+        readonly object target
         int _hash
 
     def __init__(self,
                  interface: Hashable,
                  implementation: Callable[[], Hashable],
-                 permanent: bool):
+                 permanent: bool,
+                 Scope scope = None):
         self.interface = interface
         self.implementation = implementation
         self.permanent = permanent
+        self.scope = Scope.singleton() if permanent else scope
+        self.target = ImplementationTarget(self) if scope is not None else None
         self._hash = hash((interface, implementation))
 
     def __repr__(self) -> str:
@@ -139,6 +204,8 @@ cdef class ImplementationDependency:
     def __antidote_debug_repr__(self) -> str:
         if self.permanent:
             return f"Permanent implementation: {self}"
+        elif self.scope is not None:
+            return f"Implementation (scope={self.scope.name}): {self}"
         else:
             return f"Implementation: {self}"
 
@@ -164,3 +231,21 @@ cdef class ImplementationDependency:
                 and (self.implementation is imd.implementation  # type: ignore
                      or self.implementation == imd.implementation)  # type: ignore
                 )  # noqa
+
+
+@cython.final
+cdef class ImplementationTarget:
+    """
+    Dependency of the target chosen by a non-permanent implementation with a scope.
+    """
+    cdef:
+        readonly ImplementationDependency implementation_dependency
+
+    def __init__(self, ImplementationDependency implementation_dependency):
+        self.implementation_dependency = implementation_dependency
+
+    def __repr__(self) -> str:
+        return f"ImplementationTarget({self.implementation_dependency})"
+
+    def __antidote_debug_repr__(self) -> str:
+        return f"Target of {self.implementation_dependency}"
@@ -0,0 +1,88 @@
+from typing import Dict, Hashable, Optional, cast
+
+from .._internal import API
+from ..core import Container, DependencyDebug, DependencyValue, Provider
+
+
+@API.private
+class LazyImportProvider(Provider[str]):
+    """
+    Provides dependencies declared through their import path, such as
+    :code:`'pkg.db:Database'`. The module is only imported on the first lookup and
+    the actual dependency, typically a service, is then retrieved from the container.
+
+    Modules are imported before the container takes its instantiation lock, so they
+    can retrieve dependencies from other threads while being imported. This isn't
+    possible if the first lookup happens while another dependency is instantiated.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # import path -> imported dependency, None until imported.
+        self.__paths: Dict[str, Optional[Hashable]] = dict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(paths={list(self.__paths.keys())})"
+
+    def clone(self, keep_singletons_cache: bool) -> 'LazyImportProvider':
+        p = LazyImportProvider()
+        p.__paths = self.__paths.copy()
+        return p
+
+    def exists(self, dependency: Hashable) -> bool:
+        return isinstance(dependency, str) and dependency in self.__paths
+
+    def maybe_debug(self, dependency: Hashable) -> Optional[DependencyDebug]:
+        if not isinstance(dependency, str):
+            return None
+
+        try:
+            target = self.__paths[dependency]
+        except KeyError:
+            return None
+
+        if target is None:
+            target = import_path(dependency)
+
+        return DependencyDebug(f"Lazy import: {dependency!r}", dependencies=[target])
+
+    def maybe_prepare(self, dependency: Hashable) -> None:
+        if isinstance(dependency, str) \
+                and dependency in self.__paths \
+                and self.__paths[dependency] is None:
+            try:
+                self.__paths[dependency] = import_path(dependency)
+            except Exception:
+                pass  # Raised again by maybe_provide() with the dependency stack.
+
+    def maybe_provide(self, dependency: Hashable, container: Container
+                      ) -> Optional[DependencyValue]:
+        if not isinstance(dependency, str):
+            return None
+
+        try:
+            target = self.__paths[dependency]
+        except KeyError:
+            return None
+
+        if target is None:
+            target = import_path(dependency)
+            self.__paths[dependency] = target
+
+        return container.provide(target)
+
+    def register(self, path: str) -> None:
+        assert isinstance(path, str) and ':' in path
+        self._assert_not_duplicate(path)
+        self.__paths[path] = None
+
+
+@API.private
+def import_path(path: str) -> Hashable:
+    import importlib
+
+    module_name, qualname = path.split(':', 1)
+    obj: object = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return cast(Hashable, obj)
@@ -1,9 +1,11 @@
 import inspect
-from typing import Dict, Hashable, Optional, cast
+from typing import Callable, Dict, Hashable, Optional, cast
 
 from .._internal import API
+from .._internal.pool import Pool, declare_pooled
 from .._internal.utils import FinalImmutable, debug_repr
-from ..core import Container, DependencyDebug, DependencyValue, Provider, Scope
+from ..core import (Container, DependencyDebug, DependencyValue, Provider, Scope,
+                    does_not_freeze)
 
 
 @API.private
@@ -47,6 +49,10 @@ class ServiceProvider(Provider[Hashable]):
     def __init__(self) -> None:
         super().__init__()
         self.__services: Dict[Hashable, Optional[Scope]] = dict()
+        # Compiled object graphs of non-singleton services, see compile_graphs()
+        self.__builders: Dict[Hashable, Callable[[], object]] = dict()
+        self.__pools: Dict[Hashable, Pool] = dict()
+        self.__disposers: Dict[Hashable, Callable[[object], object]] = dict()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(services={list(self.__services.items())!r})"
@@ -59,6 +65,8 @@ class ServiceProvider(Provider[Hashable]):
     def clone(self, keep_singletons_cache: bool) -> 'ServiceProvider':
         p = ServiceProvider()
         p.__services = self.__services.copy()
+        p.__pools = {klass: pool.clone() for klass, pool in self.__pools.items()}
+        p.__disposers = self.__disposers.copy()
         return p
 
     def maybe_debug(self, build: Hashable) -> Optional[DependencyDebug]:
@@ -71,6 +79,10 @@ class ServiceProvider(Provider[Hashable]):
                                scope=scope,
                                wired=[klass])
 
+    def maybe_disposer(self, build: Hashable) -> Optional[Callable[[object], object]]:
+        klass = build.dependency if isinstance(build, Build) else build
+        return self.__disposers.get(klass)
+
     def maybe_provide(self, build: Hashable, container: Container
                       ) -> Optional[DependencyValue]:
         dependency = build.dependency if isinstance(build, Build) else build
@@ -82,17 +94,40 @@ class ServiceProvider(Provider[Hashable]):
         klass = cast(type, dependency)
         if isinstance(build, Build) and build.kwargs:
             instance = klass(**build.kwargs)
+        elif klass in self.__pools:
+            instance = self.__pools[klass].acquire(klass)
         else:
-            instance = klass()
+            instance = self.__builders.get(klass, klass)()
 
-        return DependencyValue(instance, scope=scope)
+        return DependencyValue(instance, scope=scope, cacheable=True)
 
     def register(self,
                  klass: type,
                  *,
-                 scope: Optional[Scope]
+                 scope: Optional[Scope],
+                 pool: Optional[int] = None,
+                 dispose: Optional[Callable[[object], object]] = None
                  ) -> None:
         assert inspect.isclass(klass) \
-               and (isinstance(scope, Scope) or scope is None)
-        self._assert_not_duplicate(klass)
-        self.__services[klass] = scope
+               and (isinstance(scope, Scope) or scope is None) \
+               and (pool is None or scope is None)
+        dependency = cast(Hashable, klass)
+        self._assert_not_duplicate(dependency)
+        self.__services[dependency] = scope
+        if pool is not None:
+            self.__pools[dependency] = Pool(pool)
+            declare_pooled(dependency)
+        if dispose is not None:
+            self.__disposers[dependency] = dispose
+
+    @does_not_freeze
+    def compile_graphs(self) -> None:
+        """
+        Compiles the object graphs of non-singleton services. Must only be called once
+        the world is frozen, as the graph is expected to not change anymore. Clones
+        do not keep them.
+        """
+        from .graph import compile_graphs
+        self.__builders = compile_graphs({klass
+                                          for klass, scope in self.__services.items()
+                                          if scope is None and klass not in self.__pools})
@@ -1,12 +1,14 @@
 import inspect
-from typing import Dict, Hashable
+from typing import Callable, Dict, Hashable, Optional
 
 # @formatter:off
 cimport cython
-from cpython.ref cimport PyObject
+from cpython.ref cimport PyObject, Py_XINCREF
 
 from antidote.core.container cimport (DependencyResult, FastProvider, Header, HeaderObject,
-                                      Scope, header_flag_cacheable)
+                                      RawContainer, Scope, header_flag_cacheable,
+                                      header_flag_callable, header_flag_no_scope)
+from .._internal.pool import Pool, declare_pooled
 from .._internal.utils import debug_repr
 # @formatter:on
 from ..core import DependencyDebug
@@ -56,12 +58,19 @@ cdef class ServiceProvider(FastProvider):
     """
     cdef:
         dict __services
+        dict __builders
+        dict __pools
+        dict __disposers
         tuple __empty_tuple
 
     def __init__(self):
         super().__init__()
         self.__empty_tuple = tuple()
         self.__services = dict()  # type: Dict[Hashable, HeaderObject]
+        # Compiled object graphs of non-singleton services, see compile_graphs()
+        self.__builders = dict()  # type: Dict[Hashable, Callable[[], object]]
+        self.__pools = dict()  # type: Dict[Hashable, Pool]
+        self.__disposers = dict()  # type: Dict[Hashable, Callable[[object], object]]
 
     def __repr__(self):
         return f"{type(self).__name__}(services={list(self.__services.items())!r})"
@@ -74,6 +83,8 @@ cdef class ServiceProvider(FastProvider):
     def clone(self, keep_singletons_cache: bool) -> ServiceProvider:
         p = ServiceProvider()
         p.__services = self.__services.copy()
+        p.__pools = {klass: pool.clone() for klass, pool in self.__pools.items()}
+        p.__disposers = self.__disposers.copy()
         return p
 
     def maybe_debug(self, build: Hashable):
@@ -86,6 +97,10 @@ cdef class ServiceProvider(FastProvider):
                                scope=header.to_scope(self._bound_container()),
                                wired=[klass])
 
+    def maybe_disposer(self, build: Hashable):
+        klass = build.dependency if isinstance(build, Build) else build
+        return self.__disposers.get(klass)
+
     cdef fast_provide(self,
                       PyObject*dependency,
                       PyObject*container,
@@ -93,6 +108,8 @@ cdef class ServiceProvider(FastProvider):
         cdef:
             PyObject*service
             PyObject*ptr
+            PyObject*pool
+            object instance
             tuple args
             object factory
             int scope_or_singleton
@@ -111,14 +128,58 @@ cdef class ServiceProvider(FastProvider):
             ptr = PyDict_GetItem(<PyObject*> self.__services, dependency)
             if ptr:
                 result.header = (<HeaderObject> ptr).header | header_flag_cacheable()
-                result.value = PyObject_CallObject( dependency, NULL)
-
-
-    def register(self, klass: type, *, Scope scope):
+                pool = PyDict_GetItem(<PyObject*> self.__pools, dependency)
+                if pool:
+                    instance = (<object> pool).acquire(<object> dependency)
+                    result.value = <PyObject*> instance
+                    Py_XINCREF(result.value)
+                elif (<HeaderObject> ptr).header == header_flag_no_scope():
+                    # The container can call the class directly from now on.
+                    result.header |= header_flag_callable()
+                    result.callable = PyDict_GetItem(<PyObject*> self.__builders,
+                                                     dependency)
+                    if result.callable is NULL:
+                        result.callable = dependency
+                    result.value = PyObject_CallObject(result.callable, NULL)
+                else:
+                    result.value = PyObject_CallObject(dependency, NULL)
+
+
+    def register(self,
+                 klass: type,
+                 *,
+                 Scope scope,
+                 pool: Optional[int] = None,
+                 dispose: Optional[Callable[[object], object]] = None):
         cdef:
             Header header
         assert inspect.isclass(klass) \
-               and (isinstance(scope, Scope) or scope is None)
+               and (isinstance(scope, Scope) or scope is None) \
+               and (pool is None or scope is None)
         with self._bound_container_ensure_not_frozen():
             self._bound_container_raise_if_exists(klass)
             self.__services[klass] = HeaderObject.from_scope(scope)
+            if pool is not None:
+                self.__pools[klass] = Pool(pool)
+                declare_pooled(klass)
+            if dispose is not None:
+                self.__disposers[klass] = dispose
+
+    def compile_graphs(self):
+        """
+        Compiles the object graphs of non-singleton services. Must only be called once
+        the world is frozen, as the graph is expected to not change anymore. Clones
+        do not keep them.
+        """
+        cdef:
+            RawContainer container = self._bound_container()
+        from .graph import compile_graphs
+        self.__builders = compile_graphs({
+            klass
+            for klass, header in self.__services.items()
+            if (<HeaderObject> header).header == header_flag_no_scope()
+            and klass not in self.__pools
+        })
+        if container is not None:
+            for klass, builder in self.__builders.items():
+                container.update_callable(<PyObject*> klass, <PyObject*> builder)
@@ -1,12 +1,14 @@
 import threading
 from typing import (Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Sequence,
-                    Set, TypeVar, cast)
+                    Tuple, TypeVar, cast)
 
 from .._compatibility.typing import final
 from .._internal import API
 from .._internal.utils import debug_repr, short_id
 from .._internal.utils.immutable import FinalImmutable, Immutable, ImmutableGenericMeta
-from ..core import Container, DependencyDebug, DependencyValue, Provider
+from ..core import (Container, DependencyDebug, DependencyValue, Provider,
+                    does_not_freeze)
+from ..core.container import OverridableRawContainer
 from ..core.exceptions import AntidoteError
 
 
@@ -68,15 +70,17 @@ D = TypeVar('D')
 @final
 class Tagged(Immutable, Generic[D], metaclass=ImmutableGenericMeta):
     """
-    Collection containing all tagged dependencies with the specified tag.
-    Dependencies are lazily instantiated.
+    Collection containing all tagged dependencies with the specified tag, in their
+    registration order. Dependencies are lazily instantiated.
     """
-    __slots__ = ('tag', '__lock', '__container', '__dependencies', '__instances')
+    __slots__ = ('tag', '__lock', '__container', '__dependencies', '__instances',
+                 '__singletons')
     tag: Tag
     __lock: threading.RLock
     __container: Container
-    __dependencies: List[object]
+    __dependencies: Tuple[Hashable, ...]
     __instances: List[D]
+    __singletons: List[object]
 
     @staticmethod
     def with_(tag: Tag) -> object:
@@ -87,13 +91,23 @@ class Tagged(Immutable, Generic[D], metaclass=ImmutableGenericMeta):
                  *,
                  tag: Tag,
                  container: Container,
-                 dependencies: Sequence[Hashable]):
+                 dependencies: Sequence[Hashable],
+                 singletons: List[object] = None):
+        """
+        singletons is shared between all Tagged of the same tag and container. It
+        holds the singletons already retrieved, _UNRESOLVED otherwise.
+        """
+        dependencies = tuple(dependencies)
+        if singletons is None:
+            singletons = [_UNRESOLVED] * len(dependencies)
+        assert len(singletons) == len(dependencies)
         super().__init__(
             tag,
             threading.RLock(),
             container,
-            list(dependencies),
-            []
+            dependencies,
+            [],
+            singletons
         )
 
     def __len__(self) -> int:
@@ -113,12 +127,52 @@ class Tagged(Immutable, Generic[D], metaclass=ImmutableGenericMeta):
                 with self.__lock:
                     # If not other thread has already added the instance.
                     if i == len(self.__instances):
-                        self.__instances.append(
-                            cast(D, self.__container.get(self.__dependencies[i]))
-                        )
+                        self.__instances.append(self.__retrieve(i))
                 yield self.__instances[i]
             i += 1
 
+    def __retrieve(self, i: int) -> D:
+        instance = self.__singletons[i]
+        if instance is _UNRESOLVED:
+            value = self.__container.provide(self.__dependencies[i])
+            instance = value.unwrapped
+            if value.is_singleton():
+                self.__singletons[i] = instance
+        return cast(D, instance)
+
+
+_UNRESOLVED = object()
+
+
+@API.private
+class TaggedCache:
+    """
+    Tagged state shared for a tag and container. Once all tagged dependencies are
+    known to be singletons, the same fully resolved Tagged is always returned.
+    """
+    __slots__ = ('container', 'dependencies', 'singletons', 'tagged')
+
+    def __init__(self, container: Container, dependencies: Sequence[Hashable]) -> None:
+        self.container = container
+        self.dependencies = tuple(dependencies)
+        self.singletons: List[object] = [_UNRESOLVED] * len(dependencies)
+        self.tagged: Optional[Tagged[object]] = None
+
+    def get(self, tag: Tag) -> 'Tagged[object]':
+        if self.tagged is not None:
+            return self.tagged
+
+        tagged: Tagged[object] = Tagged(tag=tag,
+                                        container=self.container,
+                                        dependencies=self.dependencies,
+                                        singletons=self.singletons)
+        if all(s is not _UNRESOLVED for s in self.singletons):
+            # Nothing left to retrieve, so it can be shared.
+            for _ in tagged.values():
+                pass
+            self.tagged = tagged
+        return tagged
+
 
 @API.private
 class TagDependency(FinalImmutable):
@@ -128,19 +182,34 @@ class TagDependency(FinalImmutable):
     def __antidote_debug_repr__(self) -> str:
         return f"Tagged with {self.tag}"
 
+    def __hash__(self) -> int:
+        return hash(self.tag)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TagDependency) and self.tag is other.tag
+
 
 @API.private
 class TagProvider(Provider[TagDependency]):
     def __init__(self) -> None:
         super().__init__()
-        self.__tag_to_tagged: Dict[Tag, Set[Hashable]] = {}
+        # Dependencies are kept in their registration order.
+        self.__tag_to_tagged: Dict[Tag, List[Hashable]] = {}
+        self.__dependency_to_tags: Dict[Hashable, List[Tag]] = {}
+        # Invalidated whenever a new dependency is tagged.
+        self.__cache: Dict[Tag, TaggedCache] = {}
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(tagged_dependencies={self.__tag_to_tagged})"
 
     def clone(self, keep_singletons_cache: bool) -> 'TagProvider':
         p = TagProvider()
-        p.__tag_to_tagged = self.__tag_to_tagged.copy()
+        p.__tag_to_tagged = {tag: dependencies.copy()
+                             for tag, dependencies in self.__tag_to_tagged.items()}
+        p.__dependency_to_tags = {
+            dependency: tags.copy()
+            for dependency, tags in self.__dependency_to_tags.items()
+        }
         return p
 
     def exists(self, dependency: Hashable) -> bool:
@@ -160,27 +229,53 @@ class TagProvider(Provider[TagDependency]):
         if not isinstance(dependency, TagDependency):
             return None
 
+        if isinstance(container, OverridableRawContainer):
+            # Overrides may change the tagged dependencies at any time.
+            try:
+                dependencies = self.__tag_to_tagged[dependency.tag]
+            except KeyError:
+                return None
+            return DependencyValue(Tagged(tag=dependency.tag,
+                                          container=container,
+                                          dependencies=dependencies))
+
+        try:
+            cache = self.__cache[dependency.tag]
+        except KeyError:
+            pass
+        else:
+            if cache.container is container:
+                return DependencyValue(cache.get(dependency.tag), cacheable=True)
+
         try:
-            tagged = self.__tag_to_tagged[dependency.tag]
+            dependencies = self.__tag_to_tagged[dependency.tag]
         except KeyError:
             return None
 
+        cache = TaggedCache(container, dependencies)
+        self.__cache[dependency.tag] = cache
         return DependencyValue(
-            Tagged(
-                tag=dependency.tag,
-                container=container,
-                dependencies=list(tagged)
-            ),
+            cache.get(dependency.tag),
             # Whether the returned dependencies are singletons or not is
             # our decision to take.
-            scope=None
+            scope=None,
+            cacheable=True
         )
 
+    @does_not_freeze
+    def tags(self, dependency: Hashable) -> Sequence[Tag]:
+        """Tags of the dependency, in their registration order."""
+        return tuple(self.__dependency_to_tags.get(dependency, ()))
+
     def register(self, dependency: Hashable, *, tags: Iterable[Tag]) -> None:
         tags = list(tags)
+        dependency_tags = set(self.__dependency_to_tags.get(dependency, ()))
         for tag in tags:
             if not isinstance(tag, Tag):
                 raise TypeError(f"Expecting tag of type Tag, not {type(tag)}")
+            if tag in dependency_tags:
+                raise DuplicateTagError(tag, dependency)
+            dependency_tags.add(tag)
             if tag not in self.__tag_to_tagged:
                 self._assert_not_duplicate(tag)
             # else:
@@ -189,9 +284,6 @@ class TagProvider(Provider[TagDependency]):
             #   enforced @does_not_freeze)
 
         for tag in tags:
-            if tag not in self.__tag_to_tagged:
-                self.__tag_to_tagged[tag] = {dependency}
-            elif dependency not in self.__tag_to_tagged[tag]:
-                self.__tag_to_tagged[tag].add(dependency)
-            else:
-                raise DuplicateTagError(tag, dependency)
+            self.__dependency_to_tags.setdefault(dependency, []).append(tag)
+            self.__tag_to_tagged.setdefault(tag, []).append(dependency)
+            self.__cache.pop(tag, None)
@@ -0,0 +1,361 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence
+
+# @formatter:off
+cimport cython
+from cpython.ref cimport PyObject, Py_XDECREF, Py_XINCREF
+from fastrlock.rlock cimport create_fastrlock, lock_fastrlock, unlock_fastrlock
+
+from antidote.core.container cimport (DependencyResult, FastProvider, RawContainer,
+                                     header_flag_cacheable, header_flag_no_scope,
+                                     header_is_singleton)
+from .._internal import API
+from .._internal.utils import debug_repr, short_id
+from .._internal.utils.immutable import FinalImmutable
+from ..core import DependencyDebug
+from ..core.container import OverridableRawContainer
+from ..core.provider import does_not_freeze
+from ..core.exceptions import AntidoteError, DependencyNotFoundError
+
+# @formatter:on
+
+cdef extern from "Python.h":
+    PyObject*PyDict_GetItem(PyObject *p, PyObject *key)
+    PyObject*PyList_GET_ITEM(PyObject *list, Py_ssize_t i)
+    Py_ssize_t PyList_GET_SIZE(PyObject *list)
+    int PyObject_IsInstance(PyObject *inst, PyObject *cls) except -1
+
+
+@API.public
+class Tag(FinalImmutable):
+    """
+    Tags are a way to expose a dependency indirectly. Instead of explicitly
+    defining a list of dependencies to retrieve, one can just mark those with
+    tags and retrieve them. Typically used to support plugins or similar patterns where
+    you allow others to add functionnality.
+
+    .. doctest:: providers_tag_Tag
+
+        >>> from antidote import Tag, Service, world, Tagged
+        >>> tag = Tag()
+        >>> class Plugin(Service):
+        ...     __antidote__ = Service.Conf(tags=[tag])
+        >>> tagged = world.get[Tagged[Plugin]](Tagged.with_(tag))
+        >>> list(tagged.values()) == [world.get(Plugin)]
+        True
+
+    """
+    __slots__ = ('name',)
+    name: str
+
+    def __init__(self, name: str = ''):
+        """
+        Args:
+            name: friendly name for easier debugging. Not used for anything else.
+        """
+        if not isinstance(name, str):
+            raise TypeError(f"name must be a str, not {type(name)}")
+        super().__init__(name)
+
+    def __repr__(self) -> str:
+        if self.name:
+            return f"Tag({self.name!r})#{short_id(self)}"
+        else:
+            return f"Tag#{short_id(self)}"
+
+
+@API.public
+class DuplicateTagError(AntidoteError):
+    """
+    The same tag is used twice on the same dependency.
+    """
+
+    def __init__(self, tag: Tag, dependency: Hashable) -> None:
+        super().__init__(f"Dependency {dependency} already has the tag {tag}")
+
+
+@cython.final
+cdef class Tagged:
+    """
+    Collection containing all tagged dependencies with the specified tag, in their
+    registration order. Dependencies are lazily instantiated.
+    """
+    cdef:
+        readonly object tag
+        object __lock
+        RawContainer __container
+        tuple __dependencies
+        list __instances
+        list __singletons
+
+    @staticmethod
+    def with_(tag: Tag) -> object:
+        return TagDependency(tag)
+
+    @classmethod
+    def __class_getitem__(cls, item):
+        return cls
+
+    def __init__(self,
+                 *,
+                 tag: Tag,
+                 RawContainer container,
+                 dependencies: Sequence[Hashable],
+                 list singletons = None):
+        self.tag = tag
+        self.__lock = create_fastrlock()
+        self.__container = container
+        self.__dependencies = tuple(dependencies)
+        self.__instances = []
+        if singletons is None:
+            singletons = [_UNRESOLVED] * len(self.__dependencies)
+        assert len(singletons) == len(self.__dependencies)
+        self.__singletons = singletons
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(tag={self.tag!r}, " \
+               f"dependencies={list(self.__dependencies)!r})"
+
+    def __len__(self) -> int:
+        return len(self.__dependencies)
+
+    cdef Py_ssize_t size(self):
+        return len(self.__dependencies)
+
+    def values(self) -> TaggedIterator:
+        """Retrieved dependencies, lazily instantiated."""
+        cdef:
+            TaggedIterator iterator = TaggedIterator.__new__(TaggedIterator)
+        iterator.tagged = self
+        iterator.index = 0
+        return iterator
+
+    cdef object instance(self, Py_ssize_t i):
+        cdef:
+            object lock
+        if i < PyList_GET_SIZE(<PyObject*> self.__instances):
+            return <object> PyList_GET_ITEM(<PyObject*> self.__instances, i)
+
+        lock = self.__lock
+        lock_fastrlock(lock, -1, True)
+        try:
+            # If not other thread has already added the instance.
+            if i == PyList_GET_SIZE(<PyObject*> self.__instances):
+                self.__instances.append(self.__retrieve(i))
+        finally:
+            unlock_fastrlock(lock)
+        return <object> PyList_GET_ITEM(<PyObject*> self.__instances, i)
+
+    cdef object __retrieve(self, Py_ssize_t i):
+        cdef:
+            DependencyResult result
+            PyObject*dependency
+            PyObject*ptr = PyList_GET_ITEM(<PyObject*> self.__singletons, i)
+
+        if ptr is not <PyObject*> _UNRESOLVED:
+            return <object> ptr
+
+        dependency = <PyObject*> self.__dependencies[i]
+        self.__container.fast_get(dependency, &result)
+        if result.value is NULL:
+            raise DependencyNotFoundError(<object> dependency)
+        instance = <object> result.value
+        Py_XDECREF(result.value)
+        if header_is_singleton(result.header):
+            self.__singletons[i] = instance
+        return instance
+
+
+@cython.final
+cdef class TaggedIterator:
+    cdef:
+        Tagged tagged
+        Py_ssize_t index
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            Py_ssize_t i = self.index
+        if i >= self.tagged.size():
+            raise StopIteration()
+        self.index = i + 1
+        return self.tagged.instance(i)
+
+
+cdef object _UNRESOLVED = object()
+
+
+@cython.final
+cdef class TaggedCache:
+    """
+    Tagged state shared for a tag and container. Once all tagged dependencies are
+    known to be singletons, the same fully resolved Tagged is always returned.
+    """
+    cdef:
+        RawContainer container
+        tuple dependencies
+        list singletons
+        Tagged tagged
+
+    def __init__(self, RawContainer container, dependencies: Sequence[Hashable]):
+        self.container = container
+        self.dependencies = tuple(dependencies)
+        self.singletons = [_UNRESOLVED] * len(self.dependencies)
+        self.tagged = None
+
+    cdef Tagged get(self, tag: Tag):
+        cdef:
+            Tagged tagged
+            Py_ssize_t i
+
+        if self.tagged is not None:
+            return self.tagged
+
+        tagged = Tagged(tag=tag,
+                        container=self.container,
+                        dependencies=self.dependencies,
+                        singletons=self.singletons)
+        for i in range(PyList_GET_SIZE(<PyObject*> self.singletons)):
+            if PyList_GET_ITEM(<PyObject*> self.singletons, i) \
+                    is <PyObject*> _UNRESOLVED:
+                return tagged
+
+        # Nothing left to retrieve, so it can be shared.
+        for i in range(PyList_GET_SIZE(<PyObject*> self.singletons)):
+            tagged.instance(i)
+        self.tagged = tagged
+        return tagged
+
+
+@cython.final
+cdef class TagDependency:
+    cdef:
+        readonly object tag
+
+    def __init__(self, tag: Tag):
+        self.tag = tag
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(tag={self.tag!r})"
+
+    def __antidote_debug_repr__(self) -> str:
+        return f"Tagged with {self.tag}"
+
+    def __hash__(self) -> int:
+        return hash(self.tag)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TagDependency) \
+               and self.tag is (<TagDependency> other).tag
+
+
+@cython.final
+cdef class TagProvider(FastProvider):
+    cdef:
+        dict __tag_to_tagged
+        dict __dependency_to_tags
+        dict __cache
+
+    def __init__(self):
+        super().__init__()
+        # Dependencies are kept in their registration order.
+        self.__tag_to_tagged = dict()  # type: Dict[Tag, List[Hashable]]
+        self.__dependency_to_tags = dict()  # type: Dict[Hashable, List[Tag]]
+        # Invalidated whenever a new dependency is tagged.
+        self.__cache = dict()  # type: Dict[Tag, TaggedCache]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(tagged_dependencies={self.__tag_to_tagged})"
+
+    @cython.always_allow_keywords(True)
+    def clone(self, keep_singletons_cache: bool) -> TagProvider:
+        p = TagProvider()
+        p.__tag_to_tagged = {tag: dependencies.copy()
+                             for tag, dependencies in self.__tag_to_tagged.items()}
+        p.__dependency_to_tags = {
+            dependency: tags.copy()
+            for dependency, tags in self.__dependency_to_tags.items()
+        }
+        return p
+
+    def exists(self, dependency: Hashable) -> bool:
+        return (isinstance(dependency, TagDependency)
+                and dependency.tag in self.__tag_to_tagged)
+
+    def maybe_debug(self, dependency: Hashable) -> Optional[DependencyDebug]:
+        if not self.exists(dependency):
+            return None
+        return DependencyDebug(
+            debug_repr(dependency),
+            scope=None,
+            # Deterministic order for tests.
+            dependencies=list(sorted(self.__tag_to_tagged[dependency.tag], key=repr))
+        )
+
+    cdef fast_provide(self,
+                      PyObject*dependency,
+                      PyObject*container,
+                      DependencyResult*result):
+        cdef:
+            PyObject*ptr
+            TaggedCache cache
+            Tagged tagged
+
+        if not PyObject_IsInstance(dependency, <PyObject*> TagDependency):
+            return
+
+        tag = (<TagDependency> dependency).tag
+        if PyObject_IsInstance(container, <PyObject*> OverridableRawContainer):
+            # Overrides may change the tagged dependencies at any time.
+            ptr = PyDict_GetItem(<PyObject*> self.__tag_to_tagged, <PyObject*> tag)
+            if ptr is NULL:
+                return
+            tagged = Tagged(tag=tag,
+                            container=<RawContainer> container,
+                            dependencies=<list> ptr)
+            result.header = header_flag_no_scope()
+            result.value = <PyObject*> tagged
+            Py_XINCREF(result.value)
+            return
+
+        ptr = PyDict_GetItem(<PyObject*> self.__cache, <PyObject*> tag)
+        if ptr is not NULL and (<TaggedCache> ptr).container is <object> container:
+            tagged = (<TaggedCache> ptr).get(tag)
+        else:
+            ptr = PyDict_GetItem(<PyObject*> self.__tag_to_tagged, <PyObject*> tag)
+            if ptr is NULL:
+                return
+            cache = TaggedCache(<RawContainer> container, <list> ptr)
+            self.__cache[tag] = cache
+            tagged = cache.get(tag)
+
+        # Whether the returned dependencies are singletons or not is
+        # our decision to take.
+        result.header = header_flag_no_scope() | header_flag_cacheable()
+        result.value = <PyObject*> tagged
+        Py_XINCREF(result.value)
+
+    @does_not_freeze
+    @cython.binding(True)
+    def tags(self, dependency: Hashable) -> Sequence[Tag]:
+        """Tags of the dependency, in their registration order."""
+        return tuple(self.__dependency_to_tags.get(dependency, ()))
+
+    def register(self, dependency: Hashable, *, tags: Iterable[Tag]) -> None:
+        tags = list(tags)
+        with self._bound_container_ensure_not_frozen():
+            dependency_tags = set(self.__dependency_to_tags.get(dependency, ()))
+            for tag in tags:
+                if not isinstance(tag, Tag):
+                    raise TypeError(f"Expecting tag of type Tag, not {type(tag)}")
+                if tag in dependency_tags:
+                    raise DuplicateTagError(tag, dependency)
+                dependency_tags.add(tag)
+                if tag not in self.__tag_to_tagged:
+                    self._bound_container_raise_if_exists(tag)
+
+            for tag in tags:
+                self.__dependency_to_tags.setdefault(dependency, []).append(tag)
+                self.__tag_to_tagged.setdefault(tag, []).append(dependency)
+                self.__cache.pop(tag, None)
@@ -63,7 +63,8 @@ def _configure_service(cls: type,
     if wiring is not None:
         wiring.wire(cls)
 
-    service_provider.register(cls, scope=conf.scope)
+    service_provider.register(cls, scope=conf.scope, pool=conf.pool,
+                              dispose=conf.dispose)
     if conf.tags:
         assert tag_provider is not None  # for Mypy
         tag_provider.register(dependency=cls, tags=conf.tags)
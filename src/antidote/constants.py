@@ -45,6 +45,33 @@ class Constants(metaclass=ConstantsMeta, abstract=True):
         ... Config().DUMMY
         'dummy'
 
+    Values are only retrieved and cast once per instance. If the constants are better
+    loaded all at once, from a file or a remote store for example, you can define an
+    additional :code:`get_all()` method and enable :code:`bulk_load` in its
+    configuration. It'll be called with the keys of all the constants on the first
+    access and must return a mapping of those keys to their values. Missing ones are
+    still retrieved with :code:`get()`.
+
+    .. doctest:: helpers_Constants_get_all
+
+        >>> from antidote import Constants, const, world
+        >>> class Env(Constants):
+        ...     __antidote__ = Constants.Conf(bulk_load=True)
+        ...     HOST = const('host')
+        ...     PORT = const[int]('port')
+        ...
+        ...     def get_all(self, keys):
+        ...         print(f"Loading {keys}")
+        ...         return dict(host='localhost', port='80')
+        ...
+        ...     def get(self, key):
+        ...         raise KeyError(key)
+        >>> world.get[int](Env.PORT)
+        Loading ['host', 'port']
+        80
+        >>> world.get[str](Env.HOST)
+        'localhost'
+
     """
 
     @final
@@ -54,14 +81,16 @@ class Constants(metaclass=ConstantsMeta, abstract=True):
         use either method :py:meth:`.copy` or
         :py:meth:`~.core.wiring.WithWiringMixin.with_wiring`.
         """
-        __slots__ = ('wiring', 'auto_cast')
+        __slots__ = ('wiring', 'auto_cast', 'bulk_load')
         wiring: Optional[Wiring]
         auto_cast: FrozenSet[type]
+        bulk_load: bool
 
         def __init__(self,
                      *,
                      auto_cast: Union[Iterable[type], bool] = True,
-                     wiring: Optional[Wiring] = Wiring()):
+                     wiring: Optional[Wiring] = Wiring(),
+                     bulk_load: bool = False):
             """
             Args:
                 wiring: :py:class:`Wiring` used on the class. Defaults to wire only
@@ -72,6 +101,9 @@ class Constants(metaclass=ConstantsMeta, abstract=True):
                     default. You can disable this by specifying code:`auto_cast=False` or
                     change the types for which it's done by specifying explicitly those
                     types.
+                bulk_load: Whether all constants should be loaded at once with the
+                    :code:`get_all()` method of the class on first access. Defaults to
+                    :py:obj:`False`.
             """
             if not (wiring is None or isinstance(wiring, Wiring)):
                 raise TypeError(f"wiring can be None or a Wiring, "
@@ -89,18 +121,25 @@ class Constants(metaclass=ConstantsMeta, abstract=True):
             else:
                 raise TypeError("auto_cast must a boolean or a iterable of types")
 
-            super().__init__(wiring=wiring, auto_cast=auto_cast)
+            if not isinstance(bulk_load, bool):
+                raise TypeError(f"bulk_load must be a boolean, not a {type(bulk_load)}")
+
+            super().__init__(wiring=wiring, auto_cast=auto_cast, bulk_load=bulk_load)
 
         def copy(self,
                  *,
                  wiring: Union[Optional[Wiring], Copy] = Copy.IDENTICAL,
-                 auto_cast: Union[Union[Sequence[type], bool], Copy] = Copy.IDENTICAL
+                 auto_cast: Union[Union[Sequence[type], bool], Copy] = Copy.IDENTICAL,
+                 bulk_load: Union[bool, Copy] = Copy.IDENTICAL
                  ) -> 'Constants.Conf':
             """
             Copies current configuration and overrides only specified arguments.
             Accepts the same arguments as :py:meth:`.__init__`
             """
-            return Copy.immutable(self, wiring=wiring, auto_cast=auto_cast)
+            return Copy.immutable(self,
+                                  wiring=wiring,
+                                  auto_cast=auto_cast,
+                                  bulk_load=bulk_load)
 
     __antidote__: Conf = Conf()
 
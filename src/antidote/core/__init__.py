@@ -1,4 +1,5 @@
-from .annotations import From, FromArg, FromArgName, Get, Provide, ProvideArgName
+from .annotations import (From, FromArg, FromArgName, Get, LazyProvide, Provide,
+                          ProvideArgName)
 from .auto_provide import auto_provide
 from .container import Container, DependencyValue, Scope
 from .injection import DEPENDENCIES_TYPE, inject
@@ -6,7 +7,8 @@ from .provider import Provider, StatelessProvider, does_not_freeze
 from .utils import Dependency, DependencyDebug
 from .wiring import Wiring, WithWiringMixin, wire
 
-__all__ = ['Provide', 'Get', 'From', 'FromArg', 'FromArgName', 'ProvideArgName',
+__all__ = ['Provide', 'LazyProvide', 'Get', 'From', 'FromArg', 'FromArgName',
+           'ProvideArgName',
            'Container', 'DependencyValue', 'Scope', 'inject', 'auto_provide',
            'DEPENDENCIES_TYPE', 'does_not_freeze', 'Provider', 'StatelessProvider',
            'Dependency', 'DependencyDebug', 'wire', 'Wiring', 'WithWiringMixin']
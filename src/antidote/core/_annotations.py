@@ -1,17 +1,26 @@
 import builtins
+import functools
 import inspect
-from typing import Union
+from typing import Any, ForwardRef, Optional, Tuple, Union
 
 from .annotations import (AntidoteAnnotation, From, FromArg, FromArgName, Get,
-                          INJECT_SENTINEL)
+                          INJECT_SENTINEL, LAZY_INJECT_SENTINEL)
 from .injection import Arg
 from .._compatibility.typing import Annotated, get_args, get_origin
 from .._internal import API
 from .._internal.argspec import Argument
 
 
+# Type of Annotated[T, ...], checked first to skip the costly get_origin() for plain
+# dependencies.
+_ANNOTATED_TYPE = type(Annotated[object, object()])
+
+
 @API.private
 def extract_annotated_dependency(type_hint: object) -> object:
+    if not isinstance(type_hint, _ANNOTATED_TYPE):
+        return type_hint
+
     origin = get_origin(type_hint)
 
     # Dependency explicitly given through Annotated (PEP-593)
@@ -40,12 +49,63 @@ def extract_annotated_dependency(type_hint: object) -> object:
     return type_hint
 
 
+@API.private
+def may_be_injected(type_hint: object) -> bool:
+    """
+    Whether the type hint may define a dependency by itself, without evaluating it.
+    String annotations and forward references can only be known once evaluated.
+    """
+    if isinstance(type_hint, (str, ForwardRef)):
+        return True
+    origin = get_origin(type_hint)
+    if origin is Annotated:
+        return any(isinstance(a, AntidoteAnnotation)
+                   for a in getattr(type_hint, "__metadata__", tuple()))
+    if origin is Union:
+        return any(may_be_injected(arg) for arg in get_args(type_hint))
+    return False
+
+
 _BUILTINS_TYPES = {e for e in builtins.__dict__.values() if isinstance(e, type)}
 
 
+# Type hints are memoized in bounded caches, as they may reference classes and functions
+# which would never be freed otherwise.
+_CACHE_SIZE = 512
+
+
+def _is_hashable(type_hint: object) -> bool:
+    try:
+        hash(type_hint)
+    except TypeError:
+        return False
+    return True
+
+
 @API.private
 def extract_annotated_arg_dependency(argument: Argument) -> object:
+    """
+    The result is memoized for each type hint, except for annotations which depend on
+    the argument itself.
+    """
     type_hint = argument.type_hint_with_extras
+    if _is_hashable(type_hint):
+        dependency, annotation = _cached_annotated_arg_dependency(type_hint)
+    else:
+        dependency, annotation = _extract_annotated_arg_dependency(type_hint)
+
+    if isinstance(annotation, FromArg):
+        arg = Arg(argument.name,
+                  argument.type_hint,
+                  argument.type_hint_with_extras)
+        return annotation.function(arg)  # type: ignore
+    elif isinstance(annotation, FromArgName):
+        return annotation.template.format(arg_name=argument.name)
+    return dependency
+
+
+def _extract_annotated_arg_dependency(type_hint: Any
+                                      ) -> Tuple[object, Optional[AntidoteAnnotation]]:
     origin = get_origin(type_hint)
     args = get_args(type_hint)
 
@@ -70,27 +130,31 @@ def extract_annotated_arg_dependency(argument: Argument) -> object:
             # what was specified.
             annotation: AntidoteAnnotation = antidote_annotations[0]
             if annotation is INJECT_SENTINEL:
-                return args[0]
+                return args[0], None
+            elif annotation is LAZY_INJECT_SENTINEL:
+                from .._lazy import LazyProxyDependency
+                return LazyProxyDependency(args[0]), None
             elif isinstance(annotation, Get):
-                return annotation.dependency
+                return annotation.dependency, None
             elif isinstance(annotation, From):
-                return args[0] @ annotation.source
-            elif isinstance(annotation, FromArg):
-                arg = Arg(argument.name,
-                          argument.type_hint,
-                          argument.type_hint_with_extras)
-                return annotation.function(arg)  # type: ignore
-            elif isinstance(annotation, FromArgName):
-                return annotation.template.format(arg_name=argument.name)
+                return args[0] @ annotation.source, None
+            elif isinstance(annotation, (FromArg, FromArgName)):
+                return None, annotation
             else:
                 raise TypeError(f"Unsupported AntidoteAnnotation, {type(annotation)}")
 
-    return None
+    return None, None
 
 
 @API.private
 def extract_auto_provided_arg_dependency(argument: Argument) -> object:
     type_hint = argument.type_hint_with_extras
+    if _is_hashable(type_hint):
+        return _cached_auto_provided_arg_dependency(type_hint)
+    return _extract_auto_provided_arg_dependency(type_hint)
+
+
+def _extract_auto_provided_arg_dependency(type_hint: Any) -> object:
     origin = get_origin(type_hint)
     args = get_args(type_hint)
 
@@ -119,3 +183,9 @@ def extract_auto_provided_arg_dependency(argument: Argument) -> object:
         return dependency
 
     return None
+
+
+_cached_annotated_arg_dependency = functools.lru_cache(maxsize=_CACHE_SIZE)(
+    _extract_annotated_arg_dependency)
+_cached_auto_provided_arg_dependency = functools.lru_cache(maxsize=_CACHE_SIZE)(
+    _extract_auto_provided_arg_dependency)
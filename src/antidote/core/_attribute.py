@@ -0,0 +1,53 @@
+from typing import Hashable, Optional, Tuple
+
+from .container import OverridableRawContainer, RawContainer
+from .._compatibility.typing import final
+from .._internal import API
+from .._internal.state import current_container
+from .._internal.utils import debug_repr
+
+
+@API.private
+@final
+class InjectedAttribute:
+    """
+    Non-data descriptor retrieving its dependency on first access. The value is then
+    stored in the :code:`__dict__` of the instance, which takes precedence over the
+    descriptor afterwards. Singletons are also kept in the descriptor itself, so other
+    instances don't need to go through the container anymore.
+    """
+    __slots__ = ('dependency', 'name', '__singleton')
+
+    def __init__(self, dependency: Hashable) -> None:
+        self.dependency = dependency
+        self.name: Optional[str] = None
+        self.__singleton: Optional[Tuple[RawContainer, object]] = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(dependency={debug_repr(self.dependency)})"
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: object, owner: type) -> object:
+        if instance is None:
+            return self
+
+        container = current_container()
+        singleton = self.__singleton
+        if singleton is not None and singleton[0] is container:
+            value = singleton[1]
+        else:
+            dependency_value = container.provide(self.dependency)
+            value = dependency_value.unwrapped
+            # Overrides may change the singletons of the same container.
+            if dependency_value.is_singleton() \
+                    and not isinstance(container, OverridableRawContainer):
+                self.__singleton = (container, value)
+
+        if self.name is not None:
+            try:
+                instance.__dict__[self.name] = value
+            except AttributeError:  # __slots__
+                pass
+        return value
@@ -3,12 +3,13 @@ import inspect
 from typing import (Any, Callable, Dict, Hashable, Iterable, List, Mapping, Set,
                     TYPE_CHECKING, Union, cast)
 
+from ._injection_cache import cache_options, cached_blueprint
 from .exceptions import DoubleInjectionError
 from .._internal import API
 from .._internal.argspec import Arguments
 from .._internal.utils import YesSet
-from .._internal.wrapper import (Injection, InjectionBlueprint, build_wrapper,
-                                 get_wrapped, is_wrapper)
+from .._internal.wrapper import (Injection, InjectionBlueprint, build_lazy_wrapper,
+                                 build_wrapper, get_wrapped, is_wrapper)
 
 if TYPE_CHECKING:
     from .injection import DEPENDENCIES_TYPE
@@ -21,10 +22,13 @@ def raw_inject(f: AnyF,
                dependencies: 'DEPENDENCIES_TYPE',
                use_names: Union[bool, Iterable[str]],
                auto_provide: Union[bool, Iterable[Hashable]],
-               strict_validation: bool) -> AnyF:
+               strict_validation: bool,
+               lazy: bool = False) -> AnyF:
     if not isinstance(strict_validation, bool):
         raise TypeError(f"strict_validation must be a boolean, "
                         f"not {type(strict_validation)}")
+    if not isinstance(lazy, bool):
+        raise TypeError(f"lazy must be a boolean, not {type(lazy)}")
     if inspect.isclass(f):
         # User-friendlier error for classes.
         raise TypeError("Classes cannot be wrapped with @inject. "
@@ -39,19 +43,45 @@ def raw_inject(f: AnyF,
         raise TypeError(f"wrapped object {f} is neither a function "
                         f"nor a (class/static) method")
 
-    blueprint = _build_injection_blueprint(
-        arguments=Arguments.from_callable(f),
-        dependencies=dependencies,
-        use_names=use_names,
-        auto_provide=auto_provide,
-        strict_validation=strict_validation
-    )
-    # If nothing can be injected, just return the existing function without
-    # any overhead.
-    if blueprint.is_empty():
-        return f
-
-    wrapped_real_f = build_wrapper(blueprint=blueprint, wrapped=real_f)
+    def build_blueprint() -> InjectionBlueprint:
+        def build() -> InjectionBlueprint:
+            return _build_injection_blueprint(
+                arguments=Arguments.from_callable(f),
+                dependencies=dependencies,
+                use_names=use_names,
+                auto_provide=auto_provide,
+                strict_validation=strict_validation
+            )
+
+        options = cache_options(dependencies, use_names, auto_provide, strict_validation)
+        if options is None:
+            return build()
+        # Whether the first argument is injectable depends on f, not only real_f.
+        return cached_blueprint(real_f, options + (type(f).__name__,), build)
+
+    if lazy:
+        from ._annotations import may_be_injected
+        from .injection import validate_injection
+        validate_injection(dependencies, use_names, auto_provide)
+        # Without any annotated dependency nor any other source of dependencies,
+        # nothing can be injected. Checked beforehand to keep the same behavior as the
+        # eager mode.
+        if (dependencies is None
+                and use_names is False
+                and auto_provide is False
+                and not any(may_be_injected(type_hint)
+                            for name, type_hint in real_f.__annotations__.items()
+                            if name != 'return')):
+            return f
+        wrapped_real_f = build_lazy_wrapper(build_blueprint, wrapped=real_f)
+    else:
+        blueprint = build_blueprint()
+        # If nothing can be injected, just return the existing function without
+        # any overhead.
+        if blueprint.is_empty():
+            return f
+        wrapped_real_f = build_wrapper(blueprint=blueprint, wrapped=real_f)
+
     if isinstance(f, staticmethod):
         return staticmethod(wrapped_real_f)
     if isinstance(f, classmethod):
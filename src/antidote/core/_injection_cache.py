@@ -0,0 +1,292 @@
+"""
+Optional persistent cache of the injection blueprints, activated by setting the
+environment variable ANTIDOTE_INJECTION_CACHE_DIR to a directory. It avoids the
+analysis of the signature and type hints of injected functions on startup, which is
+mostly interesting for short-lived processes.
+
+Similar to .pyc files, there is one file per module which is invalidated whenever the
+source file changes. Blueprints also depend on other modules, those of the dependencies
+and of the objects used in the type hints, so each entry is invalidated whenever any of
+their source files changes. Dependencies are stored as their importable name, hence only
+classes, functions and strings can be cached. Functions defined within another function
+are never cached, as the same definition may be executed with different type hints.
+Whenever anything cannot be cached or retrieved, the blueprint is simply built as usual.
+"""
+import os
+import sys
+import threading
+from typing import (Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple,
+                    Union, cast)
+
+from .._internal import API
+from .._internal.wrapper import Injection, InjectionBlueprint
+
+_CACHE_DIR: Optional[str] = os.environ.get("ANTIDOTE_INJECTION_CACHE_DIR") or None
+# Changed whenever the file format or the way blueprints are built changes.
+_FORMAT = 2
+
+# Cache key of a function -> dict(injections=[[arg_name, required, dependency ref], ...],
+#                                 sources=[[filename, mtime, size], ...])
+Entries = Dict[str, Dict[str, List[List[object]]]]
+
+
+@API.private
+class ModuleCache:
+    __slots__ = ('path', 'stamp', 'entries', 'dirty')
+
+    def __init__(self, path: str, stamp: List[object]) -> None:
+        import json
+        self.path = path
+        self.stamp = stamp
+        self.entries: Entries = {}
+        self.dirty = False
+
+        try:
+            with open(path) as file:
+                content = json.load(file)
+            if content['stamp'] == stamp:
+                self.entries = content['entries']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def save(self) -> None:
+        import json
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as file:
+                json.dump(dict(stamp=self.stamp, entries=self.entries), file)
+            os.replace(tmp_path, self.path)
+        except OSError:  # pragma: no cover
+            pass
+        self.dirty = False
+
+
+__lock = threading.Lock()
+__modules: Dict[Tuple[str, str], Optional[ModuleCache]] = {}
+# filename -> [mtime, size], source files are only checked once per process.
+__sources: Dict[str, Optional[List[object]]] = {}
+
+
+@API.private
+def cached_blueprint(func: Callable[..., object],
+                     options: Tuple[object, ...],
+                     build: Callable[[], InjectionBlueprint]
+                     ) -> InjectionBlueprint:
+    """
+    Retrieves the blueprint from the cache if any or builds it. options must contain
+    all the parameters of build() besides func.
+    """
+    if _CACHE_DIR is None:
+        return build()
+
+    key = _function_key(func, options)
+    module = _module_cache(func) if key is not None else None
+    if module is None:
+        return build()
+    assert key is not None
+
+    entry = module.entries.get(key)
+    if entry is not None:
+        blueprint = _load_blueprint(entry)
+        if blueprint is not None:
+            return blueprint
+
+    blueprint = build()
+    entry = _dump_blueprint(func, blueprint)
+    if entry is not None:
+        with __lock:
+            module.entries[key] = entry
+            module.dirty = True
+    return blueprint
+
+
+@API.private
+def cache_options(dependencies: object,
+                  use_names: Union[bool, Iterable[str]],
+                  auto_provide: Union[bool, Iterable[Hashable]],
+                  strict_validation: bool) -> Optional[Tuple[object, ...]]:
+    """
+    Only parameters which can be safely used as part of a key are supported.
+    """
+    if not (dependencies is None or isinstance(dependencies, str)):
+        return None
+    if not isinstance(use_names, bool):
+        if not (isinstance(use_names, (list, tuple, set, frozenset))
+                and all(isinstance(name, str) for name in use_names)):
+            return None
+        use_names = sorted(use_names)
+    if not isinstance(auto_provide, bool):
+        return None
+    return dependencies, use_names, auto_provide, strict_validation
+
+
+def _function_key(func: Callable[..., object],
+                  options: Tuple[object, ...]) -> Optional[str]:
+    import json
+    try:
+        qualname = func.__qualname__
+        # Functions defined within another one may be created multiple times with
+        # different type hints at the same location.
+        if '<locals>' in qualname:
+            return None
+        return json.dumps([qualname, func.__code__.co_firstlineno, options])
+    except (AttributeError, TypeError):
+        return None
+
+
+def _module_cache(func: Callable[..., object]) -> Optional[ModuleCache]:
+    assert _CACHE_DIR is not None
+    module_name = func.__module__
+    filename = func.__code__.co_filename
+    with __lock:
+        try:
+            return __modules[(module_name, filename)]
+        except KeyError:
+            pass
+
+        module: Optional[ModuleCache] = None
+        source = _source_stamp(filename)
+        if source is not None:
+            stamp: List[object] = [_FORMAT, list(sys.version_info[:2]), *source]
+            if not __modules:
+                import atexit
+                atexit.register(save)
+            try:
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+            except OSError:  # pragma: no cover
+                pass
+            else:
+                module = ModuleCache(
+                    os.path.join(_CACHE_DIR,
+                                 f"{module_name}.{_digest(filename)}.json"),
+                    stamp)
+        __modules[(module_name, filename)] = module
+        return module
+
+
+def _source_stamp(filename: str) -> Optional[List[object]]:
+    try:
+        return __sources[filename]
+    except KeyError:
+        pass
+    source: Optional[List[object]] = None
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        pass
+    else:
+        source = [filename, stat.st_mtime_ns, stat.st_size]
+    __sources[filename] = source
+    return source
+
+
+def _referenced_sources(func: Callable[..., object],
+                        blueprint: InjectionBlueprint) -> Optional[List[List[object]]]:
+    """
+    Source files, besides the one of func, of the dependencies and of the objects used
+    in the type hints of func. None if any of them cannot be checked.
+    """
+    modules: Set[str] = set()
+    pending: List[object] = [injection.dependency for injection in blueprint.injections]
+    pending.extend(getattr(func, '__annotations__', {}).values())
+    seen: Set[int] = set()
+    while pending:
+        obj = pending.pop()
+        if obj is None or isinstance(obj, str) or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        module = getattr(obj, '__module__', None)
+        if isinstance(module, str):
+            modules.add(module)
+        for attr in ('__args__', '__metadata__'):
+            values = getattr(obj, attr, None)
+            if isinstance(values, tuple):
+                pending.extend(values)
+
+    modules.discard(func.__module__)
+    modules.discard('builtins')
+    sources: List[List[object]] = []
+    for name in sorted(modules):
+        filename = getattr(sys.modules.get(name), '__file__', None)
+        if not isinstance(filename, str):
+            return None
+        source = _source_stamp(filename)
+        if source is None:
+            return None
+        sources.append(source)
+    return sources
+
+
+def _digest(filename: str) -> str:
+    import hashlib
+    return hashlib.sha1(filename.encode()).hexdigest()[:16]
+
+
+def _dump_blueprint(func: Callable[..., object],
+                    blueprint: InjectionBlueprint
+                    ) -> Optional[Dict[str, List[List[object]]]]:
+    injections: List[List[object]] = []
+    for injection in blueprint.injections:
+        ref = _dump_dependency(injection.dependency)
+        if ref is None and injection.dependency is not None:
+            return None
+        injections.append([injection.arg_name, injection.required, ref])
+    sources = _referenced_sources(func, blueprint)
+    if sources is None:
+        return None
+    return dict(injections=injections, sources=sources)
+
+
+def _dump_dependency(dependency: object) -> Optional[Dict[str, str]]:
+    if isinstance(dependency, str):
+        return dict(str=dependency)
+    module = getattr(dependency, '__module__', None)
+    qualname = getattr(dependency, '__qualname__', None)
+    if not (isinstance(module, str) and isinstance(qualname, str)) \
+            or '<' in qualname:
+        return None
+    ref = dict(module=module, qualname=qualname)
+    try:
+        if _load_dependency(ref) is not dependency:
+            return None
+    except Exception:
+        return None
+    return ref
+
+
+def _load_blueprint(entry: Dict[str, List[List[object]]]
+                    ) -> Optional[InjectionBlueprint]:
+    try:
+        for source in entry['sources']:
+            if _source_stamp(cast(str, source[0])) != source:
+                return None
+        return InjectionBlueprint(tuple(
+            Injection(arg_name=cast(str, arg_name),
+                      required=cast(bool, required),
+                      dependency=(_load_dependency(cast(Dict[str, str], ref))
+                                  if ref is not None else None))
+            for arg_name, required, ref in entry['injections']
+        ))
+    except Exception:
+        # Moved or renamed dependency, partially imported module, etc.
+        return None
+
+
+def _load_dependency(ref: Dict[str, str]) -> Hashable:
+    if 'str' in ref:
+        return ref['str']
+    import importlib
+    obj: object = sys.modules.get(ref['module']) or importlib.import_module(
+        ref['module'])
+    for name in ref['qualname'].split('.'):
+        obj = getattr(obj, name)
+    return cast(Hashable, obj)
+
+
+@API.private
+def save() -> None:
+    """Registered with atexit whenever the cache is used."""
+    with __lock:
+        for module in __modules.values():
+            if module is not None and module.dirty:
+                module.save()
@@ -23,7 +23,7 @@ class ProviderMeta(GenericMeta):
         # Every method which does not the have the does_not_freeze decorator
         # is considered
         raw_methods = {"clone", "provide", "exists", "maybe_provide", "debug",
-                       "maybe_debug"}
+                       "maybe_debug", "maybe_disposer", "maybe_prepare"}
         attrs: Set[str] = {attr for attr in namespace.keys() if
                            not attr.startswith("__")}
         for attr in (attrs - raw_methods):
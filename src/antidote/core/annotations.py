@@ -165,6 +165,36 @@ Annotation specifying that the type hint itself is the dependency:
 
 """
 
+# API.private
+LAZY_INJECT_SENTINEL = AntidoteAnnotation()
+
+# API.public
+LazyProvide = Annotated[T, LAZY_INJECT_SENTINEL]
+LazyProvide.__doc__ = """
+Similar to :py:obj:`.Provide`, except that a lightweight proxy is injected instead. The
+dependency is only retrieved on first use of the proxy, which then forwards everything
+to it. Typically useful for costly dependencies which are rarely used. As the proxy is
+always injected, a missing dependency will only raise an error when first used.
+
+.. doctest:: core_annotation_lazy_provide
+
+    >>> from antidote import Service, world, inject, LazyProvide
+    >>> class Database(Service):
+    ...     def __init__(self):
+    ...         print("Connecting...")
+    ...
+    ...     def query(self):
+    ...         return "result"
+    >>> @inject
+    ... def load(db: LazyProvide[Database], use_db: bool = True):
+    ...     return db.query() if use_db else None
+    >>> load(use_db=False)
+    >>> load()
+    Connecting...
+    'result'
+
+"""
+
 # API.public
 ProvideArgName = Annotated[T, FromArgName("{arg_name}")]
 ProvideArgName.__doc__ = """
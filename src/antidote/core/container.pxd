@@ -12,6 +12,7 @@ cdef Header header_scope(ScopeId scope_id)
 cdef Header header_flag_singleton()
 cdef Header header_flag_no_scope()
 cdef Header header_flag_cacheable()
+cdef Header header_flag_callable()
 
 cdef class HeaderObject:
     cdef:
@@ -27,6 +28,9 @@ cdef struct DependencyResult:
     # Pointer to dependency value. Once done using the result, you MUST use Py_XDECREF
     # NULL if not found.
     PyObject *value
+    # Only valid if header has the callable flag. Borrowed reference to a callable
+    # creating a new value of the dependency, cached in place of the provider.
+    PyObject *callable
 
 cdef class Scope:
     cdef:
@@ -37,6 +41,7 @@ cdef class DependencyValue:
     cdef:
         readonly object unwrapped
         readonly Scope scope
+        readonly bint cacheable
 
     cdef to_result(self, DependencyResult *result)
 
@@ -63,21 +68,34 @@ cdef class RawContainer(Container):
     cdef:
         object __weakref__
 
-        DependencyStack _dependency_stack
         object _instantiation_lock
         object _registration_lock
 
         bint __frozen
         dict __singletons
         list __providers
+        list __preparing
         list __scopes
         list __scope_dependencies
+        object __thread_local
+        object __stacks
 
         unsigned long __singletons_clock
         object __cache
 
     cdef Scope get_scope(self, ScopeId scope_id)
+    cdef dict __thread_local_dependencies(self)
+    cdef dict __get_scope_dependencies(self, ScopeId scope_id)
+    cdef DependencyStack _dependency_stack(self)
+    cpdef add_alias(self, dependency, target)
+    cdef update_callable(self, PyObject *dependency, PyObject *callable)
     cdef fast_get(self, PyObject *dependency, DependencyResult *result)
+    cdef _prepare(self, object dependency)
+    cdef __provide_transient(self,
+                             PyObject *dependency,
+                             DependencyResult *result,
+                             Header header,
+                             PyObject *ptr)
     cdef __safe_cache_provide(self,
                               PyObject *dependency,
                               DependencyResult *result,
@@ -1,8 +1,8 @@
 import threading
-from collections import deque
+from collections import defaultdict, deque
 from contextlib import contextmanager
 from typing import (Callable, Deque, Dict, Hashable, Iterator, List, Mapping, Optional,
-                    Sequence, TYPE_CHECKING, Tuple, Type)
+                    Sequence, TYPE_CHECKING, Tuple, Type, cast)
 from weakref import ReferenceType, ref
 
 from .exceptions import (DependencyCycleError, DependencyInstantiationError,
@@ -58,6 +58,8 @@ class Scope(FinalImmutable):
         >>> dummy is world.get(Dummy)
         False
 
+    A built-in scope, :py:meth:`.Scope.thread_local`, also keeps a value for each thread.
+
     .. note::
 
         You probably noticed that dependencies supporting scopes always offer both
@@ -93,6 +95,28 @@ class Scope(FinalImmutable):
         """
         return _SCOPE_SINGLETON
 
+    @staticmethod
+    @API.public
+    def thread_local() -> 'Scope':
+        """
+        Each thread has its own dependency value, which is typically useful for clients
+        which aren't thread-safe. Values are discarded with their thread and retrieving
+        them doesn't require any lock. Contrary to other scopes it doesn't need to be
+        created, but it can still be reset with :py:func:`.world.scopes.reset`.
+
+        .. doctest:: core_container_scope_thread_local
+
+            >>> from antidote import Service, Scope, world
+            >>> class Session(Service):
+            ...     __antidote__ = Service.Conf(scope=Scope.thread_local())
+            >>> world.get(Session) is world.get(Session)
+            True
+
+        Returns:
+            Thread-local scope (unique object).
+        """
+        return _SCOPE_THREAD_LOCAL
+
     @staticmethod
     @API.public
     def sentinel() -> 'Scope':
@@ -111,7 +135,9 @@ class Scope(FinalImmutable):
 # Use Scope.singleton() instead.
 # API.private
 _SCOPE_SINGLETON = Scope('singleton')
+_SCOPE_THREAD_LOCAL = Scope('thread_local')
 _SCOPE_SENTINEL = Scope('__sentinel__')
+_NO_ALIAS = object()
 
 
 @API.public
@@ -121,23 +147,32 @@ class DependencyValue(FinalImmutable):
     Simple wrapper of the dependency value given by a
     :py:class:`~.provider.Provider`.
     """
-    __slots__ = ('unwrapped', 'scope')
+    __slots__ = ('unwrapped', 'scope', 'cacheable')
     unwrapped: object
     """Actual dependency value."""
     scope: Optional[Scope]
     """Scope of the dependency."""
+    cacheable: bool
+    """Whether the container can always retrieve the dependency from the same provider."""
 
     def __init__(self,
                  value: object,
                  *,
-                 scope: Optional[Scope] = None) -> None:
+                 scope: Optional[Scope] = None,
+                 cacheable: bool = False) -> None:
         """
         Args:
             value: Actual dependency value.
             scope: Scope of the dependency.
+            cacheable: Whether the provider will always provide this dependency with
+                the same scope. If so, the container remembers which provider provided
+                it and won't ask the others anymore. Only useful for non-singletons.
+                Defaults to :py:obj:`False`.
         """
         assert scope is not _SCOPE_SENTINEL
-        super().__init__(unwrapped=value, scope=scope)
+        if not isinstance(cacheable, bool):
+            raise TypeError(f"cacheable must be a boolean, not a {type(cacheable)}")
+        super().__init__(value, scope, cacheable)
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, DependencyValue) \
@@ -217,6 +252,20 @@ class RawProvider:
     def maybe_debug(self, dependency: Hashable) -> 'Optional[DependencyDebug]':
         raise NotImplementedError()  # pragma: no cover
 
+    def maybe_disposer(self, dependency: Hashable
+                       ) -> Optional[Callable[[object], object]]:
+        """
+        Function called with the value of the dependency when its scope is reset, if
+        any. It may return an awaitable.
+        """
+        return None
+
+    def maybe_prepare(self, dependency: Hashable) -> None:
+        """
+        Called before the instantiation lock is taken for dependencies which are not
+        cached yet, typically to import modules. Only called if overridden.
+        """
+
     @API.private
     @final
     @contextmanager
@@ -259,7 +308,6 @@ class RawProvider:
 @API.private  # Not meant for direct use. You MUST go through world to manipulate it.
 class RawContainer(Container):
     def __init__(self) -> None:
-        self._dependency_stack = DependencyStack()
         self._registration_lock = threading.RLock()
         self._instantiation_lock = threading.RLock()
 
@@ -267,6 +315,20 @@ class RawContainer(Container):
         self.__singletons: Dict[object, object] = dict()
         self.__scopes: Dict[Scope, Dict[object, object]] = dict()
         self.__providers: List[RawProvider] = list()
+        # Providers overriding RawProvider.maybe_prepare().
+        self.__preparing: List[RawProvider] = list()
+        # dependency -> dependency which will always provide the same value.
+        self.__aliases: Dict[object, object] = dict()
+        # dependency -> provider which will always provide it, see DependencyValue.
+        self.__routes: Dict[object, RawProvider] = dict()
+        # Same as routes, but for dependencies without any scope. As those are never
+        # stored, they're instantiated without the instantiation lock.
+        self.__transient_routes: Dict[object, RawProvider] = dict()
+        # Holds the DependencyStack of each thread, used to detect cycles.
+        self.__stacks = threading.local()
+        # Holds the dependencies of the thread-local scope of each thread. Replaced when
+        # reset.
+        self.__thread_local = threading.local()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(providers={', '.join(map(str, self.__providers))})"
@@ -307,6 +369,8 @@ class RawContainer(Container):
             provider = provider_cls()
             setattr(provider, _CONTAINER_REF_ATTR, ref(self))
             self.__providers.append(provider)
+            if _is_preparing(provider):
+                self.__preparing.append(provider)
             self.__singletons[provider_cls] = provider
 
     def add_singletons(self, dependencies: Mapping[Hashable, object]) -> None:
@@ -319,13 +383,53 @@ class RawContainer(Container):
         scope = Scope(name)  # Name is only a helper, not a identifier by itself.
         with self.locked(freezing=True):
             assert all(s.name != name for s in self.__scopes.keys())
-            assert len(self.__scopes) < 255  # Consistency with Cython.
+            assert len(self.__scopes) < 254  # Consistency with Cython.
             self.__scopes[scope] = dict()
         return scope
 
-    def reset_scope(self, scope: Scope) -> None:
+    def reset_scope(self, scope: Scope, *, wait: bool = False) -> None:
+        from .._internal.disposal import dispose
+
+        with self._instantiation_lock:
+            if scope is _SCOPE_THREAD_LOCAL:
+                # Other threads are not accessible, their values are left to the GC.
+                values = self._thread_local_dependencies()
+                self.__thread_local = threading.local()
+            else:
+                values = self.__scopes[scope]
+                self.__scopes[scope] = dict()
+            providers = self.__providers.copy()
+        dispose(providers, values, wait=wait)
+
+    def _thread_local_dependencies(self) -> Dict[object, object]:
+        local = self.__thread_local
+        try:
+            return cast(Dict[object, object], local.dependencies)
+        except AttributeError:
+            dependencies: Dict[object, object] = dict()
+            local.dependencies = dependencies
+            return dependencies
+
+    def _dependency_stack(self) -> DependencyStack:
+        stacks = self.__stacks
+        try:
+            return cast(DependencyStack, stacks.current)
+        except AttributeError:
+            stack = DependencyStack()
+            stacks.current = stack
+            return stack
+
+    def add_alias(self, dependency: Hashable, target: Hashable) -> None:
+        """
+        Declares that :code:`dependency` will always be provided by :code:`target`, so
+        that providers are not consulted for it anymore. Used by providers, like
+        permanent implementations, once the target is known.
+        """
         with self._instantiation_lock:
-            self.__scopes[scope].clear()
+            # Flattening alias chains.
+            target = self.__aliases.get(target, target)
+            assert target != dependency
+            self.__aliases[dependency] = target
 
     def raise_if_exists(self, dependency: Hashable) -> None:
         with self._registration_lock:
@@ -354,6 +458,9 @@ class RawContainer(Container):
             if keep_singletons:
                 clone.__singletons = self.__singletons.copy()
 
+            if keep_scopes:
+                clone._thread_local_dependencies().update(
+                    self._thread_local_dependencies())
             clone.__scopes = {
                 scope: dependencies.copy() if keep_scopes else dict()
                 for scope, dependencies in self.__scopes.items()
@@ -369,6 +476,8 @@ class RawContainer(Container):
 
                 setattr(p_clone, _CONTAINER_REF_ATTR, ref(clone))
                 clone.__providers.append(p_clone)
+                if _is_preparing(p_clone):
+                    clone.__preparing.append(p_clone)
                 clone.__singletons[type(p)] = p_clone
 
             return clone
@@ -396,7 +505,7 @@ class RawContainer(Container):
                                    scope=Scope.singleton())
         except KeyError:
             pass
-        return self._safe_provide(dependency)
+        return _not_cacheable(self._safe_provide(dependency))
 
     def get(self, dependency: Hashable) -> object:
         try:
@@ -406,59 +515,117 @@ class RawContainer(Container):
         return self._safe_provide(dependency).unwrapped
 
     def _safe_provide(self, dependency: Hashable) -> DependencyValue:
+        target = self.__aliases.get(dependency, _NO_ALIAS)
+        if target is not _NO_ALIAS:
+            # Through _safe_provide() to take into account overrides.
+            return self._safe_provide(target)
+
+        # Thread-local dependencies don't need any lock.
+        try:
+            return DependencyValue(self._thread_local_dependencies()[dependency],
+                                   scope=_SCOPE_THREAD_LOCAL)
+        except KeyError:
+            pass
+
+        # Transient dependencies are never stored, only the cycle detection needs to be
+        # taken care of and it relies on a stack per thread.
+        route = self.__transient_routes.get(dependency)
+        if route is not None:
+            return self.__instantiate(dependency, route)
+
+        if dependency not in self.__routes:
+            self._prepare(dependency)
+
         with self._instantiation_lock:
             try:
+                return DependencyValue(self.__singletons[dependency],
+                                       scope=Scope.singleton())
+            except KeyError:
+                pass
+
+            for scope, dependencies in self.__scopes.items():
                 try:
-                    return DependencyValue(self.__singletons[dependency],
-                                           scope=Scope.singleton())
+                    return DependencyValue(dependencies[dependency], scope=scope)
                 except KeyError:
                     pass
 
-                for scope, dependencies in self.__scopes.items():
-                    try:
-                        return DependencyValue(dependencies[dependency],
-                                               scope=scope)
-                    except KeyError:
-                        pass
-
-                with self._dependency_stack.instantiating(dependency):
-                    for provider in self.__providers:
-                        value = provider.maybe_provide(dependency, self)
-                        if value is not None:
-                            if value.is_singleton():
-                                self.__singletons[dependency] = value.unwrapped
-                            elif value.scope is not None:
-                                self.__scopes[value.scope][dependency] = value.unwrapped
+            return self.__instantiate(dependency, self.__routes.get(dependency))
 
-                            return value
+    def _prepare(self, dependency: Hashable) -> None:
+        for provider in self.__preparing:
+            provider.maybe_prepare(dependency)
 
-            except DependencyCycleError:
+    def __instantiate(self,
+                      dependency: Hashable,
+                      route: Optional[RawProvider]) -> DependencyValue:
+        stack = self._dependency_stack()
+        try:
+            with stack.instantiating(dependency):
+                providers = self.__providers if route is None else [route]
+                for provider in providers:
+                    value = provider.maybe_provide(dependency, self)
+                    if value is not None:
+                        if value.is_singleton():
+                            self.__singletons[dependency] = value.unwrapped
+                        else:
+                            if value.scope is None:
+                                if value.cacheable:
+                                    self.__transient_routes[dependency] = provider
+                            else:
+                                if value.cacheable:
+                                    self.__routes[dependency] = provider
+                                if value.scope is _SCOPE_THREAD_LOCAL:
+                                    self._thread_local_dependencies()[dependency] = \
+                                        value.unwrapped
+                                else:
+                                    self.__scopes[value.scope][dependency] = \
+                                        value.unwrapped
+
+                        return value
+                assert route is None, \
+                    "Once cached, a dependency must always be providable"
+
+        except DependencyCycleError:
+            raise
+
+        except DependencyInstantiationError as e:
+            if stack.depth == 0:
+                raise DependencyInstantiationError(dependency) from e
+            else:
                 raise
 
-            except DependencyInstantiationError as e:
-                if self._dependency_stack.depth == 0:
-                    raise DependencyInstantiationError(dependency) from e
-                else:
-                    raise
+        except Exception as e:
+            raise DependencyInstantiationError(dependency, stack.to_list()) from e
 
-            except Exception as e:
-                raise DependencyInstantiationError(
-                    dependency,
-                    self._dependency_stack.to_list()) from e
+        raise DependencyNotFoundError(dependency)
 
-            raise DependencyNotFoundError(dependency)
+
+def _is_preparing(provider: RawProvider) -> bool:
+    return type(provider).maybe_prepare is not RawProvider.maybe_prepare
+
+
+def _not_cacheable(value: DependencyValue) -> DependencyValue:
+    # Being cacheable is a commitment of the provider itself, it must not be forwarded
+    # by another provider returning the value of provide().
+    if value.cacheable:
+        return DependencyValue(value.unwrapped, scope=value.scope)
+    return value
 
 
 class OverridableRawContainer(RawContainer):
     def __init__(self) -> None:
-        from collections import defaultdict
         super().__init__()
         self.__override_lock = threading.RLock()
         # Used to differentiate singletons from the overrides and the "normal" ones.
         self.__singletons_override: Dict[Hashable, object] = dict()
         self.__scopes_override: Dict[Scope, Dict[Hashable, object]] = defaultdict(dict)
+        # Overrides of the thread-local scope are kept for each thread. Replaced when
+        # reset.
+        self.__thread_local_override = threading.local()
         self.__factory_overrides: Dict[
             Hashable, Tuple[Callable[[], object], Optional[Scope]]] = {}
+        # Only overridden values whose override declared a disposer are disposed.
+        self.__override_disposers: Dict[Hashable, Callable[[object], object]] = {}
         self.__provider_overrides: Deque[
             Callable[[Hashable], Optional[DependencyValue]]] = deque()
 
@@ -471,11 +638,14 @@ class OverridableRawContainer(RawContainer):
                                   keep_scopes=keep_scopes)
             if keep_singletons:
                 clone.__singletons_override = self.__singletons_override
-            clone.__scopes_override = {
+            clone.__scopes_override = defaultdict(dict, {
                 scope: dependencies.copy() if keep_scopes else dict()
                 for scope, dependencies in self.__scopes_override.items()
-            }
+            })
+            if keep_scopes:
+                clone._thread_local_overrides().update(self._thread_local_overrides())
             clone.__factory_overrides = self.__factory_overrides
+            clone.__override_disposers = self.__override_disposers
             clone.__provider_overrides = self.__provider_overrides
 
             return clone
@@ -488,7 +658,9 @@ class OverridableRawContainer(RawContainer):
                          dependency: Hashable,
                          *,
                          factory: Callable[[], object],
-                         scope: Optional[Scope]) -> None:
+                         scope: Optional[Scope],
+                         dispose: Optional[Callable[[object], object]] = None
+                         ) -> None:
         with self.__override_lock:
             try:
                 del self.__singletons_override[dependency]
@@ -499,7 +671,13 @@ class OverridableRawContainer(RawContainer):
                     del scope_dependencies[dependency]
                 except KeyError:
                     pass
+            # Values of other threads are not accessible.
+            self.__thread_local_override = threading.local()
             self.__factory_overrides[dependency] = (factory, scope)
+            if dispose is not None:
+                self.__override_disposers[dependency] = dispose
+            else:
+                self.__override_disposers.pop(dependency, None)
 
     def override_provider(self,
                           provider: Callable[[Hashable], Optional[DependencyValue]]
@@ -507,9 +685,40 @@ class OverridableRawContainer(RawContainer):
         with self.__override_lock:
             self.__provider_overrides.appendleft(provider)  # latest provider wins
 
-    def reset_scope(self, scope: Scope) -> None:
-        super().reset_scope(scope)
-        self.__scopes_override[scope] = dict()
+    def reset_scope(self, scope: Scope, *, wait: bool = False) -> None:
+        from .._internal.disposal import dispose_batch
+
+        with self.__override_lock:
+            if scope is _SCOPE_THREAD_LOCAL:
+                values = self._thread_local_overrides()
+                self.__thread_local_override = threading.local()
+            else:
+                values = self.__scopes_override.get(scope, dict())
+                self.__scopes_override[scope] = dict()
+            # Overridden values are only disposed if the override defined how, those
+            # may just be stubs.
+            batch = [(self.__override_disposers[dependency], value)
+                     for dependency, value in values.items()
+                     if dependency in self.__override_disposers]
+        super().reset_scope(scope, wait=wait)
+        if batch:
+            dispose_batch(batch, wait=wait)
+
+    def _thread_local_overrides(self) -> Dict[Hashable, object]:
+        local = self.__thread_local_override
+        try:
+            return cast(Dict[Hashable, object], local.dependencies)
+        except AttributeError:
+            dependencies: Dict[Hashable, object] = dict()
+            local.dependencies = dependencies
+            return dependencies
+
+    def __override_scoped(self, scope: Scope, dependency: Hashable, value: object
+                          ) -> None:
+        if scope is _SCOPE_THREAD_LOCAL:
+            self._thread_local_overrides()[dependency] = value
+        else:
+            self.__scopes_override[scope][dependency] = value
 
     def debug(self, dependency: Hashable) -> 'DependencyDebug':
         from .._internal.utils.debug import debug_repr
@@ -536,20 +745,27 @@ class OverridableRawContainer(RawContainer):
         return super().debug(dependency)
 
     def provide(self, dependency: Hashable) -> DependencyValue:
-        return self._safe_provide(dependency)
+        return _not_cacheable(self._safe_provide(dependency))
 
     def get(self, dependency: Hashable) -> object:
         return self._safe_provide(dependency).unwrapped
 
     def _safe_provide(self, dependency: Hashable) -> DependencyValue:
+        self._prepare(dependency)
         with self._instantiation_lock, self.__override_lock:
-            with self._dependency_stack.instantiating(dependency):
+            with self._dependency_stack().instantiating(dependency):
                 try:
                     return DependencyValue(self.__singletons_override[dependency],
                                            scope=Scope.singleton())
                 except KeyError:
                     pass
 
+                try:
+                    return DependencyValue(self._thread_local_overrides()[dependency],
+                                           scope=_SCOPE_THREAD_LOCAL)
+                except KeyError:
+                    pass
+
                 scope: Optional[Scope]
                 for scope, dependencies in self.__scopes_override.items():
                     try:
@@ -564,8 +780,8 @@ class OverridableRawContainer(RawContainer):
                             if value.scope is Scope.singleton():
                                 self.__singletons_override[dependency] = value.unwrapped
                             elif value.scope is not None:
-                                self.__scopes_override[value.scope][dependency] = \
-                                    value.unwrapped
+                                self.__override_scoped(value.scope, dependency,
+                                                       value.unwrapped)
                             return value
 
                     try:
@@ -577,7 +793,7 @@ class OverridableRawContainer(RawContainer):
                         if scope is Scope.singleton():
                             self.__singletons_override[dependency] = obj
                         elif scope is not None:
-                            self.__scopes_override[scope][dependency] = obj
+                            self.__override_scoped(scope, dependency, obj)
                         return DependencyValue(obj, scope=scope)
 
                 except DependencyCycleError:
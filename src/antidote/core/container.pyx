@@ -23,6 +23,7 @@ cdef extern from "Python.h":
     Py_ssize_t PyTuple_GET_SIZE(PyObject *p)
     int PyDict_SetItem(PyObject *p, PyObject *key, PyObject *val) except -1
     PyObject*PyDict_GetItem(PyObject *p, PyObject *key)
+    PyObject*PyObject_CallObject(PyObject *callable, PyObject *args) except NULL
 
 ##############
 # Dependency #
@@ -32,6 +33,14 @@ DEF HEADER_FLAG_NO_SCOPE = 0
 DEF HEADER_FLAG_SINGLETON = 1
 DEF HEADER_FLAG_HAS_SCOPE = 2
 DEF HEADER_FLAG_CACHEABLE = 4
+# Only used in the cache, the value is the dependency to retrieve instead.
+DEF HEADER_FLAG_ALIAS = 8
+# Cacheable dependency without scope which can be created by calling directly
+# DependencyResult.callable, typically the class of a non-singleton service.
+DEF HEADER_FLAG_CALLABLE = 16
+# Scope id reserved for Scope.thread_local(), its dependencies are not stored in
+# __scope_dependencies but in a threading.local().
+DEF SCOPE_ID_THREAD_LOCAL = 0xFF
 
 cdef inline ScopeId header_get_scope_id(Header header):
     return header >> 8
@@ -57,6 +66,9 @@ cdef Header header_flag_no_scope():
 cdef Header header_flag_cacheable():
     return HEADER_FLAG_CACHEABLE
 
+cdef Header header_flag_callable():
+    return HEADER_FLAG_CALLABLE
+
 @cython.final
 cdef class Scope:
     def __init__(self, str name):
@@ -69,11 +81,17 @@ cdef class Scope:
     def singleton():
         return _SCOPE_SINGLETON
 
+    @staticmethod
+    def thread_local():
+        return _SCOPE_THREAD_LOCAL
+
     @staticmethod
     def sentinel():
         return _SCOPE_SENTINEL
 
 _SCOPE_SINGLETON = Scope('singleton')
+_SCOPE_THREAD_LOCAL = Scope('thread_local')
+(<Scope> _SCOPE_THREAD_LOCAL).id = SCOPE_ID_THREAD_LOCAL
 _SCOPE_SENTINEL = Scope('__sentinel__')
 
 cdef class HeaderObject:
@@ -115,13 +133,17 @@ cdef class HeaderObject:
 @cython.freelist(64)
 @cython.final
 cdef class DependencyValue:
-    def __cinit__(self, value, *, Scope scope = None):
+    def __cinit__(self, value, *, Scope scope = None, cacheable = False):
         assert scope is not _SCOPE_SENTINEL
+        if not isinstance(cacheable, bool):
+            raise TypeError(f"cacheable must be a boolean, not a {type(cacheable)}")
         self.unwrapped = value
         self.scope = scope
+        self.cacheable = cacheable
 
     def __repr__(self):
-        return f"DependencyValue(unwrapped={self.unwrapped}, scope={self.scope})"
+        return f"DependencyValue(unwrapped={self.unwrapped}, scope={self.scope}, " \
+               f"cacheable={self.cacheable})"
 
     def __eq__(self, other):
         return isinstance(other, DependencyValue) \
@@ -133,6 +155,8 @@ cdef class DependencyValue:
 
     cdef to_result(self, DependencyResult *result):
         result.header = HeaderObject.from_scope(self.scope).header
+        if self.cacheable:
+            result.header |= HEADER_FLAG_CACHEABLE
         result.value = <PyObject*> self.unwrapped
         Py_XINCREF(result.value)
 
@@ -140,7 +164,6 @@ cdef class DependencyValue:
     cdef DependencyValue from_result(RawContainer container, DependencyResult *result):
         scope = HeaderObject(result.header).to_scope(container)
         value = <object> result.value
-        print(scope, value)
         Py_XDECREF(result.value)
         return DependencyValue.__new__(DependencyValue,
                                        value,
@@ -175,6 +198,15 @@ cdef class RawProvider:
     def maybe_debug(self, dependency: Hashable):
         raise NotImplementedError()  # pragma: no cover
 
+    def maybe_disposer(self, dependency: Hashable):
+        return None
+
+    def maybe_prepare(self, dependency: Hashable):
+        """
+        Called before the instantiation lock is taken for dependencies which are not
+        cached yet, typically to import modules. Only called if overridden.
+        """
+
     def maybe_provide(self,
                       dependency: Hashable,
                       container: Container) -> DependencyValue:
@@ -259,18 +291,25 @@ cdef class RawContainer(Container):
                         since the first check.
     - cache: Singletons are caching in simplified and faster hash map. For other
              dependencies, if the header specify cacheable, the provider and scope will
-             be cached.
+             be cached. If the provider also specifies a callable, it is cached instead
+             of the provider and called directly.
     """
 
     def __init__(self):
-        self._dependency_stack = DependencyStack()
         self._instantiation_lock = create_fastrlock()
         self._registration_lock = threading.RLock()
         self.__frozen = False
         self.__providers = list()  # type: List[RawProvider]
+        # Providers overriding RawProvider.maybe_prepare().
+        self.__preparing = list()  # type: List[RawProvider]
         self.__singletons = dict()  # type: dict
         self.__scopes = []
         self.__scope_dependencies = []  # type: List[dict]
+        # Holds the dependencies of the thread-local scope of each thread. Replaced when
+        # reset.
+        self.__thread_local = threading.local()
+        # Holds the DependencyStack of each thread, used to detect cycles.
+        self.__stacks = threading.local()
 
         # Cython optimizations
         self.__singletons_clock = 0
@@ -325,6 +364,8 @@ cdef class RawContainer(Container):
             provider = provider_cls()
             provider._container_ref = ref(self)
             self.__providers.append(provider)
+            if _is_preparing(provider):
+                self.__preparing.append(provider)
             (<DependencyCache> self.__cache).set(<PyObject*> provider_cls,
                                                  HEADER_FLAG_SINGLETON,
                                                  <PyObject*> provider)
@@ -346,19 +387,96 @@ cdef class RawContainer(Container):
             Scope s = Scope(name)
         with self.locked(freezing=True):
             s.id = <ScopeId> (1 + len(self.__scopes))
-            assert s.id <= 0xFF
+            assert s.id < SCOPE_ID_THREAD_LOCAL
             assert all(s.name != name for s in self.__scopes)
             self.__scopes.append(s)
             self.__scope_dependencies.append(dict())
         return s
 
-    def reset_scope(self, Scope scope):
+    def reset_scope(self, Scope scope, *, bint wait = False):
+        from .._internal.disposal import dispose
+
         with self._instantiation_lock:
-            self.__scope_dependencies[scope.id - 1] = dict()
+            if scope is _SCOPE_THREAD_LOCAL:
+                # Other threads are not accessible, their values are left to the GC.
+                values = self.__thread_local_dependencies()
+                self.__thread_local = threading.local()
+            else:
+                values = self.__scope_dependencies[scope.id - 1]
+                self.__scope_dependencies[scope.id - 1] = dict()
+            providers = self.__providers.copy()
+        dispose(providers, values, wait=wait)
 
     cdef Scope get_scope(self, ScopeId scope_id):
+        if scope_id == SCOPE_ID_THREAD_LOCAL:
+            return <Scope> _SCOPE_THREAD_LOCAL
         return <Scope> self.__scopes[scope_id - 1]
 
+    # A reference to the dictionary MUST be kept while using its values, a concurrent
+    # reset would free it otherwise.
+    cdef dict __thread_local_dependencies(self):
+        cdef:
+            object local = self.__thread_local
+            dict dependencies
+        try:
+            return <dict> local.dependencies
+        except AttributeError:
+            dependencies = dict()
+            local.dependencies = dependencies
+            return dependencies
+
+    cdef DependencyStack _dependency_stack(self):
+        cdef:
+            object stacks = self.__stacks
+            DependencyStack stack
+        try:
+            return <DependencyStack> stacks.current
+        except AttributeError:
+            stack = DependencyStack()
+            stacks.current = stack
+            return stack
+
+    cdef dict __get_scope_dependencies(self, ScopeId scope_id):
+        if scope_id == SCOPE_ID_THREAD_LOCAL:
+            return self.__thread_local_dependencies()
+        return <dict> PyList_GET_ITEM(<PyObject*> self.__scope_dependencies,
+                                      scope_id - 1)
+
+    cpdef add_alias(self, dependency: Hashable, target: Hashable):
+        """
+        Declares that :code:`dependency` will always be provided by :code:`target`, so
+        that providers are not consulted for it anymore. Used by providers, like
+        permanent implementations, once the target is known.
+        """
+        cdef:
+            CacheValue *cached
+        lock_fastrlock(self._instantiation_lock, -1, True)
+        try:
+            # Flattening alias chains.
+            cached = (<DependencyCache> self.__cache).get(<PyObject*> target)
+            if cached and cached.header & HEADER_FLAG_ALIAS:
+                target = <object> cached.ptr
+            assert target != dependency
+            (<DependencyCache> self.__cache).set(<PyObject*> dependency,
+                                                 HEADER_FLAG_ALIAS,
+                                                 <PyObject*> target)
+        finally:
+            unlock_fastrlock(self._instantiation_lock)
+
+    cdef update_callable(self, PyObject *dependency, PyObject *callable):
+        """
+        Replaces the callable creating the dependency if it has already been cached.
+        """
+        cdef:
+            CacheValue *cached
+        lock_fastrlock(self._instantiation_lock, -1, True)
+        try:
+            cached = (<DependencyCache> self.__cache).get(dependency)
+            if cached and cached.header & HEADER_FLAG_CALLABLE:
+                (<DependencyCache> self.__cache).set(dependency, cached.header, callable)
+        finally:
+            unlock_fastrlock(self._instantiation_lock)
+
     def raise_if_exists(self, dependency: Hashable):
         with self._registration_lock:
             if dependency in self.__singletons:
@@ -390,7 +508,9 @@ cdef class RawContainer(Container):
             if keep_singletons:
                 clone.__singletons = self.__singletons.copy()
 
-
+            if keep_scopes:
+                clone.__thread_local_dependencies().update(
+                    self.__thread_local_dependencies())
             clone.__scopes = self.__scopes
             clone.__scope_dependencies = [
                 d.copy() if keep_scopes else dict()
@@ -404,6 +524,8 @@ cdef class RawContainer(Container):
                                        "instance when copy() is called.")
                 p_clone._container_ref = ref(clone)
                 clone.__providers.append(p_clone)
+                if _is_preparing(p_clone):
+                    clone.__preparing.append(p_clone)
                 clone.__singletons[type(p)] = p_clone
 
             return clone
@@ -454,16 +576,46 @@ cdef class RawContainer(Container):
             CacheValue *value
             unsigned long clock
             PyObject *ptr
+            Header header
+            dict thread_local_dependencies
 
         result.value = NULL
         value = (<DependencyCache> self.__cache).get(dependency)
         if value:
-            if value.header & HEADER_FLAG_SINGLETON:
+            header = value.header
+            if header & HEADER_FLAG_SINGLETON:
                 result.header = value.header
                 result.value = value.ptr
                 Py_XINCREF(result.value)
-            else:
+            elif value.header & HEADER_FLAG_ALIAS:
+                # Through fast_get() to take into account overrides.
+                ptr = value.ptr
+                Py_XINCREF(ptr)
+                try:
+                    self.fast_get(ptr, result)
+                finally:
+                    Py_XDECREF(ptr)
+            elif header & HEADER_FLAG_HAS_SCOPE \
+                    and header_get_scope_id(header) == SCOPE_ID_THREAD_LOCAL:
+                # Only the current thread can access its dependencies, so no lock is
+                # needed.
+                thread_local_dependencies = self.__thread_local_dependencies()
+                ptr = PyDict_GetItem(<PyObject*> thread_local_dependencies, dependency)
+                if ptr:
+                    result.header = header
+                    result.value = ptr
+                    Py_XINCREF(result.value)
+                else:
+                    # The cache may have been resized in the meantime.
+                    self.__safe_cache_provide(
+                        dependency,
+                        result,
+                        (<DependencyCache> self.__cache).get(dependency)
+                    )
+            elif header & HEADER_FLAG_HAS_SCOPE:
                 self.__safe_cache_provide(dependency, result, value)
+            else:
+                self.__provide_transient(dependency, result, header, value.ptr)
         else:
             clock = self.__singletons_clock
             ptr = PyDict_GetItem(<PyObject*> self.__singletons, dependency)
@@ -472,27 +624,66 @@ cdef class RawContainer(Container):
                 result.value = ptr
                 Py_XINCREF(result.value)
             else:
+                if self.__preparing:
+                    self._prepare(<object> dependency)
                 self.__safe_provide(dependency, result, clock)
 
+    cdef _prepare(self, object dependency):
+        for provider in self.__preparing:
+            provider.maybe_prepare(dependency)
+
+    cdef __provide_transient(self,
+                             PyObject *dependency,
+                             DependencyResult *result,
+                             Header header,
+                             PyObject *ptr):
+        """
+        Transient dependencies are never stored, so they don't need the instantiation
+        lock. Only the cycle detection has to be taken care of, which relies on a stack
+        per thread.
+        """
+        cdef:
+            # Keeps a reference as the cache may change during the call.
+            object target = <object> ptr
+            DependencyStack stack = self._dependency_stack()
+
+        if 0 != stack.push(dependency):
+            raise stack.reset_with_error(dependency)
+
+        try:
+            if header & HEADER_FLAG_CALLABLE:
+                result.header = header & ~HEADER_FLAG_CALLABLE
+                result.value = PyObject_CallObject(<PyObject*> target, NULL)
+            else:
+                (<RawProvider> target).fast_provide(dependency, <PyObject*> self, result)
+                assert result.value, \
+                    "Once cached, a dependency must always be providable"
+        except Exception as error:
+            new_error = handle_error(dependency, <PyObject*> stack, error)
+            if new_error is not error:
+                raise new_error from error
+            else:
+                raise
+        finally:
+            stack.pop()
+
     cdef __safe_cache_provide(self,
                               PyObject *dependency,
                               DependencyResult *result,
                               CacheValue *cached):
         cdef:
-            ScopeId scope_id
             PyObject *value
             object lock = self._instantiation_lock
-            PyObject *stack = <PyObject*> self._dependency_stack
-            PyObject *scope_dependencies = <PyObject*> self.__scope_dependencies
+            DependencyStack stack_ref = self._dependency_stack()
+            PyObject *stack = <PyObject*> stack_ref
+            dict scope_dependencies
 
         lock_fastrlock(lock, -1, True)
 
         if cached.header & HEADER_FLAG_HAS_SCOPE:
-            scope_id = header_get_scope_id(cached.header)
-            value = PyDict_GetItem(
-                PyList_GET_ITEM(scope_dependencies, scope_id - 1),
-                dependency
-            )
+            scope_dependencies = self.__get_scope_dependencies(
+                header_get_scope_id(cached.header))
+            value = PyDict_GetItem(<PyObject*> scope_dependencies, dependency)
             if value:
                 unlock_fastrlock(lock)
                 result.header = cached.header
@@ -508,7 +699,9 @@ cdef class RawContainer(Container):
         try:
             (<RawProvider> cached.ptr).fast_provide(dependency, <PyObject*> self, result)
             assert result.value, "Once cached, a dependency must always be providable"
-            cached.header = result.header
+            # The cache may have been resized during the call.
+            cached = (<DependencyCache> self.__cache).get(dependency)
+            cached.header = result.header & ~HEADER_FLAG_CALLABLE
             if result.header & HEADER_FLAG_SINGLETON:
                 PyDict_SetItem(<PyObject*> self.__singletons, dependency, result.value)
                 self.__singletons_clock += 1
@@ -516,12 +709,9 @@ cdef class RawContainer(Container):
                 cached.ptr = result.value
                 Py_XINCREF(result.value)
             elif result.header & HEADER_FLAG_HAS_SCOPE:
-                scope_id = header_get_scope_id(result.header)
-                PyDict_SetItem(
-                    PyList_GET_ITEM(scope_dependencies, scope_id - 1),
-                    dependency,
-                    result.value
-                )
+                scope_dependencies = self.__get_scope_dependencies(
+                    header_get_scope_id(result.header))
+                PyDict_SetItem(<PyObject*> scope_dependencies, dependency, result.value)
         except Exception as error:
             new_error = handle_error(dependency, stack, error)
             if new_error is not error:
@@ -539,13 +729,14 @@ cdef class RawContainer(Container):
         cdef:
             PyObject *value
             PyObject *provider
-            ScopeId scope_id
             Exception error
             object lock = self._instantiation_lock
             PyObject *singletons = <PyObject*> self.__singletons
-            PyObject *stack = <PyObject*> self._dependency_stack
+            DependencyStack stack_ref = self._dependency_stack()
+            PyObject *stack = <PyObject*> stack_ref
             PyObject *providers
             PyObject *scope_dependencies
+            dict dependencies
             size_t i
 
         lock_fastrlock(lock, -1, True)
@@ -571,6 +762,15 @@ cdef class RawContainer(Container):
                 Py_XINCREF(result.value)
                 return
 
+        dependencies = self.__thread_local_dependencies()
+        value = PyDict_GetItem(<PyObject*> dependencies, dependency)
+        if value:
+            unlock_fastrlock(lock)
+            result.header = header_scope(SCOPE_ID_THREAD_LOCAL)
+            result.value = value
+            Py_XINCREF(result.value)
+            return
+
         if 0 != (<DependencyStack> stack).push(dependency):
             error = (<DependencyStack> stack).reset_with_error(dependency)
             unlock_fastrlock(lock)
@@ -594,16 +794,20 @@ cdef class RawContainer(Container):
                                                              result.value)
                     else:
                         if result.header & HEADER_FLAG_CACHEABLE:
-                            (<DependencyCache> self.__cache).set(dependency,
-                                                                 result.header,
-                                                                 provider)
+                            if result.header & HEADER_FLAG_CALLABLE:
+                                (<DependencyCache> self.__cache).set(dependency,
+                                                                     result.header,
+                                                                     result.callable)
+                            else:
+                                (<DependencyCache> self.__cache).set(dependency,
+                                                                     result.header,
+                                                                     provider)
                         if result.header & HEADER_FLAG_HAS_SCOPE:
-                            scope_id = header_get_scope_id(result.header)
-                            PyDict_SetItem(
-                                PyList_GET_ITEM(scope_dependencies, scope_id - 1),
-                                dependency,
-                                result.value
-                            )
+                            dependencies = self.__get_scope_dependencies(
+                                header_get_scope_id(result.header))
+                            PyDict_SetItem(<PyObject*> dependencies,
+                                           dependency,
+                                           result.value)
                     return
 
         except Exception as error:
@@ -616,6 +820,9 @@ cdef class RawContainer(Container):
             (<DependencyStack> stack).pop()
             unlock_fastrlock(lock)
 
+cdef bint _is_preparing(RawProvider provider):
+    return type(provider).maybe_prepare is not RawProvider.maybe_prepare
+
 cdef inline object handle_error(PyObject *dependency, PyObject *stack, object error):
     if isinstance(error, DependencyCycleError):
         return error
@@ -773,8 +980,10 @@ cdef class OverridableRawContainer(RawContainer):
     cdef:
         object __override_lock
         dict __scopes_override
+        object __thread_local_override
         dict __singletons_override
         dict __factory_overrides
+        dict __override_disposers
         object __provider_overrides
 
 
@@ -784,7 +993,12 @@ cdef class OverridableRawContainer(RawContainer):
         # Used to differentiate singletons from the overrides and the "normal" ones.
         self.__singletons_override = dict()
         self.__scopes_override = dict()  # type:  Dict[Scope, Dict[Hashable, object]]
+        # Overrides of the thread-local scope are kept for each thread. Replaced when
+        # reset.
+        self.__thread_local_override = threading.local()
         self.__factory_overrides = dict()  # type: Dict[Any, Tuple[Callable[[], Any], Optional[Scope]]]
+        # Only overridden values whose override declared a disposer are disposed.
+        self.__override_disposers = dict()  # type: Dict[Any, Callable[[Any], object]]
         self.__provider_overrides = deque()  # type: Deque[Callable[[Any], Optional[DependencyValue]]]
 
 
@@ -804,7 +1018,10 @@ cdef class OverridableRawContainer(RawContainer):
                 scope: dependencies.copy() if keep_scopes else dict()
                 for scope, dependencies in self.__scopes_override.items()
             }
+            if keep_scopes:
+                clone.__thread_local_overrides().update(self.__thread_local_overrides())
             clone.__factory_overrides = self.__factory_overrides
+            clone.__override_disposers = self.__override_disposers
             clone.__provider_overrides = self.__provider_overrides
 
             return clone
@@ -817,7 +1034,8 @@ cdef class OverridableRawContainer(RawContainer):
                          dependency: Hashable,
                          *,
                          factory: Callable[[], Any],
-                         scope: Optional[Scope]):
+                         scope: Optional[Scope],
+                         dispose: Optional[Callable[[Any], object]] = None):
         with self.__override_lock:
             try:
                 del self.__singletons_override[dependency]
@@ -828,16 +1046,54 @@ cdef class OverridableRawContainer(RawContainer):
                     del scope_dependencies[dependency]
                 except KeyError:
                     pass
+            # Values of other threads are not accessible.
+            self.__thread_local_override = threading.local()
             self.__factory_overrides[dependency] = (factory, scope)
+            if dispose is not None:
+                self.__override_disposers[dependency] = dispose
+            else:
+                self.__override_disposers.pop(dependency, None)
 
     def override_provider(self,
                           provider: Callable[[Any], Optional[DependencyValue]]):
         with self.__override_lock:
             self.__provider_overrides.appendleft(provider)  # latest provider wins
 
-    def reset_scope(self, scope: Scope) -> None:
-        super().reset_scope(scope)
-        self.__scopes_override[scope] = dict()
+    def reset_scope(self, scope: Scope, *, wait: bool = False) -> None:
+        from .._internal.disposal import dispose_batch
+
+        with self.__override_lock:
+            if scope is _SCOPE_THREAD_LOCAL:
+                values = self.__thread_local_overrides()
+                self.__thread_local_override = threading.local()
+            else:
+                values = self.__scopes_override.get(scope, dict())
+                self.__scopes_override[scope] = dict()
+            # Overridden values are only disposed if the override defined how, those
+            # may just be stubs.
+            batch = [(self.__override_disposers[dependency], value)
+                     for dependency, value in values.items()
+                     if dependency in self.__override_disposers]
+        super().reset_scope(scope, wait=wait)
+        if batch:
+            dispose_batch(batch, wait=wait)
+
+    cdef dict __thread_local_overrides(self):
+        cdef:
+            object local = self.__thread_local_override
+            dict dependencies
+        try:
+            return <dict> local.dependencies
+        except AttributeError:
+            dependencies = dict()
+            local.dependencies = dependencies
+            return dependencies
+
+    cdef __override_scoped(self, Scope scope, object dependency, object value):
+        if scope is _SCOPE_THREAD_LOCAL:
+            self.__thread_local_overrides()[dependency] = value
+        else:
+            self.__scopes_override.setdefault(scope, dict())[dependency] = value
 
     def clone(self,
               *,
@@ -855,7 +1111,11 @@ cdef class OverridableRawContainer(RawContainer):
                 scope: dependencies.copy() if keep_scopes else dict()
                 for scope, dependencies in self.__scopes_override.items()
             }
+            if keep_scopes:
+                container.__thread_local_overrides().update(
+                    self.__thread_local_overrides())
             container.__factory_overrides = self.__factory_overrides.copy()
+            container.__override_disposers = self.__override_disposers.copy()
             container.__provider_overrides = self.__provider_overrides.copy()
 
         return container
@@ -888,11 +1148,13 @@ cdef class OverridableRawContainer(RawContainer):
     cdef fast_get(self, PyObject *dependency, DependencyResult *result):
         cdef:
             PyObject *ptr
+            DependencyStack stack = self._dependency_stack()
 
         dep = <object> dependency
         result.value = NULL
+        self._prepare(dep)
         with self.__override_lock, self._instantiation_lock:
-            with self._dependency_stack.instantiating(dep):
+            with stack.instantiating(dep):
                 try:
                     obj = self.__singletons_override[dep]
                 except KeyError:
@@ -901,6 +1163,14 @@ cdef class OverridableRawContainer(RawContainer):
                     DependencyValue(obj, scope=_SCOPE_SINGLETON).to_result(result)
                     return
 
+                try:
+                    obj = self.__thread_local_overrides()[dep]
+                except KeyError:
+                    pass
+                else:
+                    DependencyValue(obj, scope=_SCOPE_THREAD_LOCAL).to_result(result)
+                    return
+
                 for scope, dependencies in self.__scopes_override.items():
                     try:
                         obj = dependencies[dep]
@@ -917,7 +1187,7 @@ cdef class OverridableRawContainer(RawContainer):
                             if value.scope is Scope.singleton():
                                 self.__singletons_override[dep] = value.unwrapped
                             elif value.scope is not None:
-                                self.__scopes_override[value.scope][dep] = value.unwrapped
+                                self.__override_scoped(value.scope, dep, value.unwrapped)
                             (<DependencyValue?> value).to_result(result)
                             return
 
@@ -930,14 +1200,12 @@ cdef class OverridableRawContainer(RawContainer):
                         if scope is Scope.singleton():
                             self.__singletons_override[dep] = value
                         elif scope is not None:
-                            self.__scopes_override[scope][dep] = value
+                            self.__override_scoped(scope, dep, value)
                         DependencyValue(value, scope=scope).to_result(result)
                         return
 
                 except Exception as error:
-                    new_error = handle_error(dependency,
-                                             <PyObject*> self._dependency_stack,
-                                             error)
+                    new_error = handle_error(dependency, <PyObject*> stack, error)
                     if new_error is not error:
                         raise new_error from error
                     else:
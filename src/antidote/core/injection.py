@@ -1,5 +1,6 @@
 import collections.abc as c_abc
 import inspect
+import os
 from typing import (Any, Callable, Hashable, Iterable, Mapping, Optional, Sequence,
                     TypeVar, Union, overload)
 
@@ -29,6 +30,9 @@ class Arg(FinalImmutable):
     """
 
 
+# Default of inject(lazy=...)
+_LAZY_INJECTION = os.environ.get("ANTIDOTE_LAZY_INJECTION") == "true"
+
 # API.experimental
 DEPENDENCIES_TYPE = Optional[Union[
     Mapping[str, Hashable],  # {arg_name: dependency, ...}
@@ -44,7 +48,8 @@ def inject(__func: staticmethod,  # noqa: E704  # pragma: no cover
            dependencies: DEPENDENCIES_TYPE = None,
            use_names: Union[bool, Iterable[str]] = None,
            auto_provide: Union[bool, Iterable[Hashable]] = None,
-           strict_validation: bool = True
+           strict_validation: bool = True,
+           lazy: bool = None
            ) -> staticmethod: ...
 
 
@@ -54,7 +59,8 @@ def inject(__func: classmethod,  # noqa: E704  # pragma: no cover
            dependencies: DEPENDENCIES_TYPE = None,
            use_names: Union[bool, Iterable[str]] = None,
            auto_provide: Union[bool, Iterable[Hashable]] = None,
-           strict_validation: bool = True
+           strict_validation: bool = True,
+           lazy: bool = None
            ) -> classmethod: ...
 
 
@@ -64,7 +70,8 @@ def inject(__func: F,  # noqa: E704  # pragma: no cover
            dependencies: DEPENDENCIES_TYPE = None,
            use_names: Union[bool, Iterable[str]] = None,
            auto_provide: Union[bool, Iterable[Hashable]] = None,
-           strict_validation: bool = True
+           strict_validation: bool = True,
+           lazy: bool = None
            ) -> F: ...
 
 
@@ -73,7 +80,8 @@ def inject(*,  # noqa: E704  # pragma: no cover
            dependencies: DEPENDENCIES_TYPE = None,
            use_names: Union[bool, Iterable[str]] = None,
            auto_provide: Union[bool, Iterable[Hashable]] = None,
-           strict_validation: bool = True
+           strict_validation: bool = True,
+           lazy: bool = None
            ) -> Callable[[F], F]: ...
 
 
@@ -83,7 +91,8 @@ def inject(__func: AnyF = None,
            dependencies: DEPENDENCIES_TYPE = None,
            use_names: Union[bool, Iterable[str]] = None,
            auto_provide: Union[bool, Iterable[Hashable]] = None,
-           strict_validation: bool = True
+           strict_validation: bool = True,
+           lazy: bool = None
            ) -> AnyF:
     """
     Inject the dependencies into the function lazily, they are only retrieved
@@ -165,6 +174,17 @@ def inject(__func: AnyF = None,
             this feature only for those. Any type hints from the builtins (str, int...)
             or the typing (except :py:class:`~typing.Optional`) are ignored. It overrides
             :code:`use_names`. Defaults to :code:`False`.
+        lazy: Whether the injection should only be resolved on the first call of the
+            function, analyzing its signature and type hints at that time. It'll
+            speed up the import of modules with a lot of injected functions and allows
+            forward references which can only be resolved later. However errors, such
+            as an unknown argument in :code:`dependencies`, will only be raised on the
+            first call. As for eager injection, the function is returned as is if it
+            has no dependencies. This is only known without resolving them if it has
+            no string annotations, those are always wrapped. Defaults to the
+            environment variable
+            :code:`ANTIDOTE_LAZY_INJECTION` being set to :code:`true`, hence
+            :code:`False` otherwise.
 
     Returns:
         The decorator to be applied or the injected function if the
@@ -180,11 +200,43 @@ def inject(__func: AnyF = None,
             dependencies=dependencies,
             use_names=use_names if use_names is not None else False,
             auto_provide=auto_provide if auto_provide is not None else False,
-            strict_validation=strict_validation)
+            strict_validation=strict_validation,
+            lazy=lazy if lazy is not None else _LAZY_INJECTION)
 
     return __func and decorate(__func) or decorate
 
 
+@API.public
+def _inject_attr(dependency: Hashable) -> Any:
+    """
+    Declares a class attribute which is only retrieved on first access, contrary to
+    injecting it in :code:`__init__()`. Creating instances has no overhead and unused
+    dependencies are never retrieved. The value is then stored on the instance and
+    singletons are shared by all instances. Available as :code:`inject.attr`.
+
+    .. doctest:: core_inject_attr
+
+        >>> from antidote import inject, Service, world
+        >>> class Database(Service):
+        ...     pass
+        >>> class Repository:
+        ...     db = inject.attr(Database)
+        >>> Repository().db is world.get(Database)
+        True
+
+    Args:
+        dependency: Dependency to retrieve.
+
+    Returns:
+        Descriptor retrieving the dependency.
+    """
+    from ._attribute import InjectedAttribute
+    return InjectedAttribute(dependency)
+
+
+inject.attr = _inject_attr  # type: ignore
+
+
 @API.public  # Function will be kept in sync with @inject, so you may use it.
 def validate_injection(dependencies: DEPENDENCIES_TYPE = None,
                        use_names: Union[bool, Iterable[str]] = None,
@@ -1,8 +1,10 @@
 from typing import Generic, Hashable, Optional, Sequence, TypeVar, cast
 
+from ._annotations import extract_annotated_dependency
 from .container import Scope
 from .._compatibility.typing import final
 from .._internal import API
+from .._internal import state
 from .._internal.utils import FinalImmutable, Immutable
 from .._internal.utils.immutable import ImmutableGenericMeta
 
@@ -46,8 +48,9 @@ class Dependency(Immutable, Generic[T], metaclass=ImmutableGenericMeta):
         Returns:
             dependency value retrieved from :py:mod:`~..world`.
         """
-        from antidote import world
-        return cast(T, world.get(self.unwrapped))
+        # Singletons are directly retrieved from the container cache.
+        return cast(T, state.current_container().get(
+            extract_annotated_dependency(self.unwrapped)))
 
     def __hash__(self) -> int:
         return hash(self.unwrapped)
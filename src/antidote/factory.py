@@ -1,9 +1,12 @@
 import inspect
-from typing import (Callable, Iterable, Optional, Tuple, TypeVar, Union, cast, overload)
+from typing import (Any, Callable, Iterable, Optional, Tuple, TypeVar, Union, cast,
+                    overload)
 
 from ._compatibility.typing import Protocol, final, get_type_hints
 from ._factory import FactoryMeta, FactoryWrapper, PreBuild
 from ._internal import API
+from ._internal.disposal import validated_dispose
+from ._internal.pool import validated_pool
 from ._internal.utils import Copy, FinalImmutable
 from ._internal.wrapper import is_wrapper
 from ._providers import FactoryProvider, Tag, TagProvider
@@ -117,10 +120,12 @@ class Factory(metaclass=FactoryMeta, abstract=True):
         either method :py:meth:`.copy` or
         :py:meth:`.core.wiring.WithWiringMixin.with_wiring`.
         """
-        __slots__ = ('wiring', 'scope', 'tags')
+        __slots__ = ('wiring', 'scope', 'tags', 'pool', 'dispose')
         wiring: Optional[Wiring]
         scope: Optional[Scope]
         tags: Optional[Tuple[Tag]]
+        pool: Optional[int]
+        dispose: Optional[Callable[[Any], object]]
 
         @property
         def singleton(self) -> bool:
@@ -131,7 +136,9 @@ class Factory(metaclass=FactoryMeta, abstract=True):
                      wiring: Optional[Wiring] = Wiring(),
                      singleton: bool = None,
                      scope: Optional[Scope] = Scope.sentinel(),
-                     tags: Iterable[Tag] = None):
+                     tags: Iterable[Tag] = None,
+                     pool: Optional[int] = None,
+                     dispose: Optional[Callable[[Any], object]] = None):
             """
 
             Args:
@@ -147,23 +154,40 @@ class Factory(metaclass=FactoryMeta, abstract=True):
                     Defaults to :py:meth:`~.core.container.Scope.singleton`.
                 tags: Iterable of :py:class:`~.._providers.tag.Tag` tagging to the
                       provided dependency.
+                pool: Maximum number of returned dependencies lent at once. Injected
+                    plain functions borrow one for the duration of the call and give it
+                    back afterwards, so it must not be kept beyond the call. Methods,
+                    coroutines and generators keep it. Once all are borrowed, injected
+                    calls of other threads wait for one to be given back. Only
+                    non-singleton dependencies without scope can be pooled, which is the
+                    default when specified. Defaults to :py:obj:`None`.
+                dispose: Function called with the returned dependency when its scope is
+                    reset, such as :code:`Connection.close`. It may be a coroutine
+                    function. Disposal is done in a background thread, see
+                    :py:func:`.world.scopes.reset`. Only dependencies with a scope can be
+                    disposed. Defaults to :py:obj:`None`.
             """
             if not (wiring is None or isinstance(wiring, Wiring)):
                 raise TypeError(f"wiring must be a Wiring or None, "
                                 f"not {type(wiring)}")
 
+            scope = validated_scope(scope,
+                                    singleton,
+                                    default=Scope.singleton() if pool is None else None)
             super().__init__(wiring=wiring,
-                             scope=validated_scope(scope,
-                                                   singleton,
-                                                   default=Scope.singleton()),
-                             tags=validated_tags(tags))
+                             scope=scope,
+                             tags=validated_tags(tags),
+                             pool=validated_pool(pool, scope),
+                             dispose=validated_dispose(dispose, scope))
 
         def copy(self,
                  *,
                  wiring: Union[Optional[Wiring], Copy] = Copy.IDENTICAL,
                  singleton: Union[bool, Copy] = Copy.IDENTICAL,
                  scope: Union[Optional[Scope], Copy] = Copy.IDENTICAL,
-                 tags: Union[Optional[Iterable[Tag]], Copy] = Copy.IDENTICAL
+                 tags: Union[Optional[Iterable[Tag]], Copy] = Copy.IDENTICAL,
+                 pool: Union[Optional[int], Copy] = Copy.IDENTICAL,
+                 dispose: Union[Optional[Callable[[Any], object]], Copy] = Copy.IDENTICAL
                  ) -> 'Factory.Conf':
             """
             Copies current configuration and overrides only specified arguments.
@@ -176,7 +200,9 @@ class Factory(metaclass=FactoryMeta, abstract=True):
             return Copy.immutable(self,
                                   wiring=wiring,
                                   scope=scope,
-                                  tags=tags)
+                                  tags=tags,
+                                  pool=pool,
+                                  dispose=dispose)
 
     __antidote__: Conf = Conf()
     """
@@ -1,14 +1,15 @@
 import functools
 import inspect
-from typing import Callable, TypeVar, cast
+from typing import Callable, Optional, TypeVar, cast
 
 from ._compatibility.typing import Protocol
 from ._implementation import ImplementationWrapper, validate_provided_class
 from ._internal import API
 from ._internal.wrapper import is_wrapper
 from ._providers import IndirectProvider
-from .core import inject, Provide
+from .core import inject, Provide, Scope
 from .core.exceptions import DoubleInjectionError
+from .utils import validated_scope
 
 F = TypeVar('F', bound=Callable[[], object])
 
@@ -28,7 +29,8 @@ class ImplementationProtocol(Protocol[F]):
 @API.public
 def implementation(interface: type,
                    *,
-                   permanent: bool = True
+                   permanent: Optional[bool] = None,
+                   scope: Optional[Scope] = Scope.sentinel()
                    ) -> Callable[[F], ImplementationProtocol[F]]:
     """
     Function decorator which decides which implementation should be used for
@@ -72,12 +74,20 @@ def implementation(interface: type,
         interface: Interface for which an implementation will be provided
         permanent: Whether the function should be called each time the interface is needed
             or not. Defaults to :py:obj:`True`.
+        scope: Scope for which the chosen implementation is kept. The function is only
+            called again once the scope has been reset with
+            :py:func:`.world.scopes.reset`. :py:obj:`None` is equivalent to
+            :code:`permanent=False`. Cannot be used together with :code:`permanent`.
 
     Returns:
         The decorated function, unmodified.
     """
-    if not isinstance(permanent, bool):
+    if not (permanent is None or isinstance(permanent, bool)):
         raise TypeError(f"permanent must be a bool, not {type(permanent)}")
+    if permanent is not None and scope is not Scope.sentinel():
+        raise TypeError("Use either permanent or scope argument, not both.")
+    scope = validated_scope(scope, permanent, default=Scope.singleton())
+    is_permanent = scope is Scope.singleton()
     if not inspect.isclass(interface):
         raise TypeError(f"interface must be a class, not {type(interface)}")
 
@@ -103,8 +113,12 @@ def implementation(interface: type,
             validate_provided_class(dep, expected=interface)
             return dep
 
-        dependency = indirect_provider.register_implementation(interface, impl,
-                                                               permanent=permanent)
+        dependency = indirect_provider.register_implementation(
+            interface,
+            impl,
+            permanent=is_permanent,
+            scope=None if is_permanent else scope
+        )
         return cast(ImplementationProtocol[F], ImplementationWrapper(func, dependency))
 
     return register
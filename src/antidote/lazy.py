@@ -81,7 +81,7 @@ class LazyCall(FinalImmutable, Lazy):
                                wired=[self.func])
 
     def lazy_get(self, container: Container) -> DependencyValue:
-        return DependencyValue(self.func(), scope=self._scope)
+        return DependencyValue(self.func(), scope=self._scope, cacheable=True)
 
 
 @API.public
@@ -1,7 +1,10 @@
-from typing import Callable, cast, Iterable, Optional, overload, Tuple, TypeVar, Union
+from typing import (Any, Callable, cast, Iterable, Optional, overload, Tuple, TypeVar,
+                    Union)
 
 from ._compatibility.typing import final
 from ._internal import API
+from ._internal.disposal import validated_dispose
+from ._internal.pool import validated_pool
 from ._internal.utils import Copy, FinalImmutable
 from ._providers import Tag
 from ._service import ServiceMeta
@@ -70,10 +73,12 @@ class Service(metaclass=ServiceMeta, abstract=True):
         either method :py:meth:`.copy` or
         :py:meth:`.core.wiring.WithWiringMixin.with_wiring`.
         """
-        __slots__ = ('wiring', 'scope', 'tags')
+        __slots__ = ('wiring', 'scope', 'tags', 'pool', 'dispose')
         wiring: Optional[Wiring]
         scope: Optional[Scope]
         tags: Optional[Tuple[Tag]]
+        pool: Optional[int]
+        dispose: Optional[Callable[[Any], object]]
 
         @property
         def singleton(self) -> bool:
@@ -84,7 +89,9 @@ class Service(metaclass=ServiceMeta, abstract=True):
                      wiring: Optional[Wiring] = Wiring(),
                      singleton: bool = None,
                      scope: Optional[Scope] = Scope.sentinel(),
-                     tags: Optional[Iterable[Tag]] = None):
+                     tags: Optional[Iterable[Tag]] = None,
+                     pool: Optional[int] = None,
+                     dispose: Optional[Callable[[Any], object]] = None):
             """
             Args:
                 wiring: Wiring to be applied on the service. By default only
@@ -100,23 +107,40 @@ class Service(metaclass=ServiceMeta, abstract=True):
                     :py:meth:`~.core.container.Scope.singleton`.
                 tags: Iterable of :py:class:`~.._providers.tag.Tag` tagging to the
                       service.
+                pool: Maximum number of instances lent at once. Injected plain
+                    functions borrow an instance for the duration of the call and give
+                    it back afterwards, so it must not be kept beyond the call. Methods,
+                    coroutines and generators keep it. Once all are borrowed, injected
+                    calls of other threads wait for one to be given back. Only
+                    non-singleton services without scope can be pooled, which is the
+                    default when specified. Defaults to :py:obj:`None`.
+                dispose: Function called with the service instance when its scope is
+                    reset, such as :code:`Connection.close`. It may be a coroutine
+                    function. Disposal is done in a background thread, see
+                    :py:func:`.world.scopes.reset`. Only services with a scope can be
+                    disposed. Defaults to :py:obj:`None`.
             """
             if not (wiring is None or isinstance(wiring, Wiring)):
                 raise TypeError(f"wiring can be a Wiring or None, "
                                 f"not {type(wiring)}")
 
+            scope = validated_scope(scope,
+                                    singleton,
+                                    default=Scope.singleton() if pool is None else None)
             super().__init__(wiring=wiring,
-                             scope=validated_scope(scope,
-                                                   singleton,
-                                                   default=Scope.singleton()),
-                             tags=validated_tags(tags))
+                             scope=scope,
+                             tags=validated_tags(tags),
+                             pool=validated_pool(pool, scope),
+                             dispose=validated_dispose(dispose, scope))
 
         def copy(self,
                  *,
                  wiring: Union[Optional[Wiring], Copy] = Copy.IDENTICAL,
                  singleton: Union[bool, Copy] = Copy.IDENTICAL,
                  scope: Union[Optional[Scope], Copy] = Copy.IDENTICAL,
-                 tags: Union[Optional[Iterable[Tag]], Copy] = Copy.IDENTICAL
+                 tags: Union[Optional[Iterable[Tag]], Copy] = Copy.IDENTICAL,
+                 pool: Union[Optional[int], Copy] = Copy.IDENTICAL,
+                 dispose: Union[Optional[Callable[[Any], object]], Copy] = Copy.IDENTICAL
                  ) -> 'Service.Conf':
             """
             Copies current configuration and overrides only specified arguments.
@@ -126,7 +150,8 @@ class Service(metaclass=ServiceMeta, abstract=True):
                 raise TypeError("Use either singleton or scope argument, not both.")
             if isinstance(singleton, bool):
                 scope = Scope.singleton() if singleton else None
-            return Copy.immutable(self, wiring=wiring, scope=scope, tags=tags)
+            return Copy.immutable(self, wiring=wiring, scope=scope, tags=tags,
+                                  pool=pool, dispose=dispose)
 
     __antidote__: Conf = Conf()
     """
@@ -1,5 +1,6 @@
 from . import scopes, singletons, test
-from ._methods import debug, freeze, get, lazy, provider
+from ._methods import (debug, freeze, get, lazy, provider, register_entry_points,
+                       register_lazy)
 
 __all__ = ['singletons', 'test', 'scopes', 'freeze', 'get', 'lazy', 'debug',
-           'provider']
+           'provider', 'register_entry_points', 'register_lazy']
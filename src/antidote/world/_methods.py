@@ -1,13 +1,15 @@
 import inspect
-from typing import Dict, Hashable, Type, TypeVar, Union, overload
+import sys
+from typing import (Dict, Hashable, Iterable, List, TYPE_CHECKING, Type, TypeVar, Union,
+                    cast, overload)
 
 from .._internal import API
-from .._internal.state import current_container, init
+from .._internal.state import current_container
 from .._internal.world import WorldGet, WorldLazy
 from ..core.container import RawProvider, Scope
 
-# Create the global container
-init()
+if TYPE_CHECKING:
+    from ..tag import Tag
 
 __sentinel = object()
 
@@ -102,13 +104,19 @@ def provider(p: P) -> P:
 
 
 @API.public
-def freeze() -> None:
+def freeze(*, compile_graphs: bool = False) -> None:
     """
     Freezes Antidote. No additional dependencies or scope can be defined.
 
     Its primary purpose is to state explicitly in your code when all dependencies have
     been defined and to offer a bit more control on Antidote's state.
 
+    As dependencies cannot change anymore, non-singleton services depending on other
+    non-singleton services can be compiled with :code:`compile_graphs=True`. Each one
+    of those is then created by a single generated function, calling all constructors
+    directly instead of going through Antidote for each one of them. Overrides only
+    exist in cloned worlds, which do not use the compiled graphs.
+
     .. doctest:: world_freeze
 
         >>> from antidote import world
@@ -118,8 +126,23 @@ def freeze() -> None:
         ...
         FrozenWorldError
 
+
+    Args:
+        compile_graphs: Whether object graphs of non-singleton services should be
+            compiled. Defaults to :py:obj:`False`.
+
     """
-    current_container().freeze()
+    if not isinstance(compile_graphs, bool):
+        raise TypeError(f"compile_graphs must be a boolean, not a {type(compile_graphs)}")
+
+    container = current_container()
+    container.freeze()
+    if compile_graphs:
+        from .._providers import ServiceProvider
+        with container.locked():
+            for provider in container.providers:
+                if isinstance(provider, ServiceProvider):
+                    provider.compile_graphs()
 
 
 @overload
@@ -167,6 +190,114 @@ def singleton_add(dependency: Union[Dict[Hashable, object], Hashable],
         current_container().add_singletons({dependency: value})
 
 
+@API.public
+def register_lazy(path: str, *, tags: Iterable['Tag'] = None) -> str:
+    """
+    Declares a dependency through its import path :code:`'module:qualname'` without
+    importing it. The module is only imported when the dependency is first retrieved,
+    which then provides the imported object as a dependency, typically a
+    :py:class:`.Service` or a class registered with :py:func:`.factory`. It is mostly
+    useful to avoid importing, at startup, modules which are rarely used.
+
+    As dependencies are declared when their module is imported, it cannot be used with
+    modules declaring dependencies if :py:func:`.freeze` was called.
+
+    .. doctest:: world_register_lazy
+
+        >>> from antidote import world, inject
+        >>> DATABASE = world.register_lazy('myapp.db:Database')
+        >>> DATABASE
+        'myapp.db:Database'
+        >>> @inject(dependencies=dict(db=DATABASE))
+        ... def load(db):
+        ...     # myapp.db is only imported on the first call.
+        ...     pass
+
+    Args:
+        path: Import path of the dependency, the module and the qualified name of the
+            object separated by a colon, :code:`'pkg.db:Database'` for example.
+        tags: Iterable of :py:class:`~.Tag` applied to the import path. The module is
+            only imported when :py:meth:`.Tagged.values` reaches it.
+
+    Returns:
+        The import path which can be used as the dependency.
+
+    """
+    from .._providers import LazyImportProvider, Tag, TagProvider
+
+    if not isinstance(path, str):
+        raise TypeError(f"path must be a str, not {type(path)}")
+    module_name, sep, qualname = path.partition(':')
+    if not (sep and module_name and qualname):
+        raise ValueError(f"path must have the form 'module:qualname', not {path!r}")
+    tags = list(tags) if tags is not None else []
+    if not all(isinstance(tag, Tag) for tag in tags):
+        raise TypeError(f"tags must be an iterable of Tag, not {tags!r}")
+
+    container = current_container()
+    cast(LazyImportProvider, container.get(LazyImportProvider)).register(path)
+    if tags:
+        cast(TagProvider, container.get(TagProvider)).register(path, tags=tags)
+    return path
+
+
+@API.public
+def register_entry_points(group: str, *, tags: Iterable['Tag']) -> List[str]:
+    """
+    Declares all the entry points of the specified group with
+    :py:func:`.register_lazy` and the given tags, typically to support plugins. No
+    plugin module is imported until :py:meth:`.Tagged.values` reaches it, so startup
+    does not depend on the number of installed plugins.
+
+    Entry points must reference an object, :code:`'plugin.module:Plugin'`, which is
+    provided by Antidote once imported, such as a :py:class:`.Service`. If any of them
+    only references a module, a :py:exc:`ValueError` is raised and none is registered.
+
+    .. doctest:: world_register_entry_points
+
+        >>> from antidote import world, Tag
+        >>> PLUGIN = Tag('plugin')
+        >>> world.register_entry_points('myapp.plugins', tags=[PLUGIN])
+        []
+
+    Args:
+        group: Entry points group.
+        tags: Iterable of :py:class:`~.Tag` applied to all entry points.
+
+    Returns:
+        The import paths of the entry points.
+
+    """
+    if not isinstance(group, str):
+        raise TypeError(f"group must be a str, not {type(group)}")
+    tags = list(tags)
+
+    if sys.version_info >= (3, 10):
+        from importlib.metadata import entry_points
+        group_entry_points = entry_points(group=group)
+    elif sys.version_info >= (3, 8):  # pragma: no cover
+        from importlib.metadata import entry_points
+        group_entry_points = entry_points().get(group, [])
+    else:  # pragma: no cover
+        from importlib_metadata import entry_points
+        group_entry_points = entry_points(group=group)
+
+    # Checked beforehand to register either all of the entry points or none of them.
+    paths = []
+    for entry_point in group_entry_points:
+        # Extras are irrelevant: 'module:attr [extra]'
+        path = entry_point.value.split('[', 1)[0].replace(' ', '')
+        if ':' not in path:
+            dist = getattr(getattr(entry_point, 'dist', None), 'name', None)
+            raise ValueError(
+                f"Entry point {entry_point.name!r} of group {group!r}"
+                + (f" from distribution {dist!r}" if dist is not None else "")
+                + f" must reference an object, 'module:qualname', not {path!r}")
+        paths.append(path)
+
+    return [register_lazy(path, tags=tags) for path in paths]
+
+
 @API.experimental
 def debug(dependency: Hashable, *, depth: int = -1) -> str:
     """
@@ -224,7 +355,8 @@ def new(name: str) -> Scope:
         raise TypeError(f"name must be a str, not {type(name)}")
     if not name:
         raise ValueError("name cannot be an empty string")
-    if name in {Scope.singleton().name, Scope.sentinel().name}:
+    if name in {Scope.singleton().name, Scope.thread_local().name,
+                Scope.sentinel().name}:
         raise ValueError(f"'{name}' is a reserved scope name.")
     container = current_container()
     if any(s.name == name for s in container.scopes):
@@ -232,11 +364,17 @@ def new(name: str) -> Scope:
     return container.create_scope(name)
 
 
-def reset(scope: Scope) -> None:
+def reset(scope: Scope, *, wait: bool = False) -> None:
     """
     All dependencies values of the specified scope will be discarded, so invalidating the
     scope. See :py:class:`~.core.container.Scope` for more information on scopes.
 
+    Discarded values are disposed in a background thread by their disposer, if any, such
+    as :code:`Service.Conf(dispose=...)`. Coroutine disposers are run in a private event
+    loop of this thread, not in the one of the caller. So they must not rely on objects
+    bound to another event loop, such as futures or asyncio locks. Close those in the
+    caller's event loop instead.
+
     .. doctest:: world_scopes_reset
 
         >>> from antidote import world
@@ -246,13 +384,15 @@ def reset(scope: Scope) -> None:
 
     Args:
         scope: Scope to reset.
+        wait: Whether to wait until the discarded values are disposed. Defaults to
+            :py:obj:`False`.
     """
     if not isinstance(scope, Scope):
         raise TypeError(f"scope must be a Scope, not {type(scope)}.")
     if scope in {Scope.singleton(), Scope.sentinel()}:
         raise ValueError(f"Cannot reset {scope}.")
     container = current_container()
-    if scope not in container.scopes:
+    if scope is not Scope.thread_local() and scope not in container.scopes:
         raise ValueError(f"Unknown scope {scope}. Only scopes created through "
                          f"world.scopes.new() are supported.")
-    return container.reset_scope(scope)
+    return container.reset_scope(scope, wait=wait)
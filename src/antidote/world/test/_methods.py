@@ -2,6 +2,7 @@ from contextlib import contextmanager
 from typing import (Hashable, Iterator, Optional)
 
 from ..._internal import API, state
+from ..._internal.pool import pooled_world
 from ...core.container import (DependencyValue, RawContainer, RawProvider)
 
 
@@ -68,7 +69,7 @@ def clone(*,
         return c.clone(keep_singletons=keep_singletons,
                        keep_scopes=keep_scopes)
 
-    with state.override(build):
+    with state.override(build), pooled_world(keep=True):
         yield
 
 
@@ -98,7 +99,8 @@ def new() -> Iterator[None]:
         DependencyNotFoundError: 'test'
 
     """
-    with state.override(lambda c: RawContainer.with_same_providers_and_scopes(c)):
+    with state.override(lambda c: RawContainer.with_same_providers_and_scopes(c)), \
+            pooled_world(keep=False):
         yield
 
 
@@ -116,7 +118,7 @@ def empty() -> Iterator[None]:
     one or several providers in isolation. If you're not testing provider, consider use
     :py:func:`.new` instead.
     """
-    with state.override(lambda _: RawContainer()):
+    with state.override(lambda _: RawContainer()), pooled_world(keep=False):
         yield
 
 
@@ -2,6 +2,7 @@ from typing import (Any, Callable, Dict, Hashable, Optional, TypeVar, Union, ove
 
 from ..._compatibility.typing import get_type_hints
 from ..._internal import API, state
+from ..._internal.disposal import validated_dispose
 from ...core.container import (DependencyValue, Scope)
 from ...utils import validated_scope
 
@@ -65,7 +66,8 @@ F = TypeVar('F', bound=Callable[..., Any])
 def factory(dependency: Hashable = None,
             *,
             singleton: bool = None,
-            scope: Optional[Scope] = Scope.sentinel()
+            scope: Optional[Scope] = Scope.sentinel(),
+            dispose: Optional[Callable[[Any], object]] = None
             ) -> Callable[[F], F]:
     """
     Override a dependency with the result of a factory. To be used as a function
@@ -107,6 +109,10 @@ def factory(dependency: Hashable = None,
             :code:`singleton`. The scope defines if and how long the returned dependency
             will be cached. See :py:class:`~.core.container.Scope`. Defaults to
             :py:meth:`~.core.container.Scope.singleton`.
+        dispose: Function called with the returned dependency when its scope is reset.
+            The disposer of the overridden dependency is never used, as the override may
+            return a stub. Only dependencies with a scope can be disposed. Defaults to
+            :py:obj:`None`.
 
     .. note::
 
@@ -119,6 +125,7 @@ def factory(dependency: Hashable = None,
         The decorated function, unchanged.
     """
     scope = validated_scope(scope, singleton, default=None)
+    dispose = validated_dispose(dispose, scope)
 
     def decorate(f: F) -> F:
         if not callable(f):
@@ -131,7 +138,7 @@ def factory(dependency: Hashable = None,
         else:
             output = dependency
         state.current_overridable_container() \
-            .override_factory(output, factory=f, scope=scope)
+            .override_factory(output, factory=f, scope=scope, dispose=dispose)
         return f
 
     return decorate
@@ -0,0 +1,105 @@
+import pytest
+
+from antidote import Service, Wiring, inject, world
+from antidote._providers import FactoryProvider, ServiceProvider
+from antidote.core._attribute import InjectedAttribute
+from antidote.exceptions import DependencyNotFoundError
+
+
+@pytest.fixture(autouse=True)
+def empty_world():
+    with world.test.empty():
+        world.provider(ServiceProvider)
+        world.provider(FactoryProvider)
+        yield
+
+
+def test_singleton():
+    created = []
+
+    class A(Service):
+        def __init__(self):
+            created.append(self)
+
+    class B:
+        a = inject.attr(A)
+
+    assert isinstance(B.__dict__['a'], InjectedAttribute)
+    assert B.a is B.__dict__['a']
+    assert 'A' in repr(B.a)
+
+    b = B()
+    assert created == []
+    assert b.a is world.get(A)
+    assert b.__dict__['a'] is b.a
+    assert B().a is b.a
+    assert len(created) == 1
+
+    # Every world has its own singletons.
+    with world.test.clone():
+        assert B().a is world.get(A)
+        assert B().a is not b.a
+
+
+def test_transient():
+    class A(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+    class B:
+        a = inject.attr(A)
+
+    b = B()
+    assert isinstance(b.a, A)
+    assert b.a is b.a
+    assert B().a is not b.a
+
+
+def test_override():
+    class A(Service):
+        pass
+
+    class B:
+        a = inject.attr(A)
+
+    with world.test.clone(keep_singletons=True):
+        assert B().a is world.get(A)
+        world.test.override.singleton(A, 'overridden')
+        assert B().a == 'overridden'
+
+
+def test_slots():
+    class A(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+    class B:
+        __slots__ = ()
+        a = inject.attr(A)
+
+    b = B()
+    assert isinstance(b.a, A)
+    assert b.a is not b.a
+
+
+def test_not_found():
+    class B:
+        a = inject.attr('unknown')
+
+    with pytest.raises(DependencyNotFoundError):
+        B().a
+
+
+def test_wiring():
+    class A(Service):
+        pass
+
+    class B(Service):
+        __antidote__ = Service.Conf(wiring=Wiring(methods=['method'],
+                                                  dependencies=dict(x=A)))
+        a = inject.attr(A)
+
+        def method(self, x=None):
+            return x
+
+    b = world.get(B)
+    assert b.a is world.get(A)
+    assert b.method() is b.a
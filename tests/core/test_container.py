@@ -1,3 +1,4 @@
+import threading
 from typing import Dict, Hashable, Optional
 
 import pytest
@@ -113,6 +114,23 @@ def test_singleton(container: RawContainer):
     assert container.get(A) == service
 
 
+def test_alias(container: RawContainer):
+    container.add_provider(DummyFactoryProvider)
+    container.get(DummyFactoryProvider).data = {A: lambda _: A()}
+    container.get(DummyFactoryProvider).singleton = False
+
+    container.add_alias('a', A)
+    container.add_alias('aa', 'a')
+    for alias in ['a', 'aa']:
+        assert isinstance(container.get(alias), A)
+        assert container.get(alias) is not container.get(alias)
+        assert container.provide(alias).scope is None
+
+    container.add_alias('b', B)
+    with pytest.raises(DependencyNotFoundError):
+        container.get('b')
+
+
 def test_dependency_cycle_error(container: RawContainer):
     container.add_provider(DummyFactoryProvider)
     container.get(DummyFactoryProvider).data = {
@@ -310,6 +328,125 @@ def test_scope(container: RawContainer):
     assert container.provide(1) == DependencyValue(y, scope=scope)
 
 
+@pytest.mark.parametrize('cacheable', [True, False])
+def test_thread_local_scope(container: RawContainer, cacheable: bool):
+    class ThreadLocalProvider(RawProvider):
+        def exists(self, dependency):
+            return dependency == 'local'
+
+        def maybe_provide(self, dependency: Hashable, container: Container
+                          ) -> Optional[DependencyValue]:
+            if dependency == 'local':
+                return DependencyValue(object(), scope=Scope.thread_local(),
+                                       cacheable=cacheable)
+            return None
+
+    container.add_provider(ThreadLocalProvider)
+    assert Scope.thread_local() not in container.scopes
+
+    x = container.get('local')
+    assert container.get('local') is x
+    assert container.provide('local') == DependencyValue(x, scope=Scope.thread_local())
+
+    values = []
+    thread = threading.Thread(target=lambda: values.extend([container.get('local'),
+                                                            container.get('local')]))
+    thread.start()
+    thread.join()
+    assert values[0] is values[1]
+    assert values[0] is not x
+    assert container.get('local') is x
+
+    container.reset_scope(Scope.thread_local())
+    y = container.get('local')
+    assert y is not x
+    assert container.get('local') is y
+
+
+def test_cacheable(container: RawContainer):
+    class First(RawProvider):
+        calls = 0
+
+        def exists(self, dependency):
+            return False
+
+        def maybe_provide(self, dependency: Hashable, container: Container
+                          ) -> Optional[DependencyValue]:
+            First.calls += 1
+            return None
+
+    class Cacheable(RawProvider):
+        def exists(self, dependency):
+            return dependency in {'cached', 'not cached'}
+
+        def maybe_provide(self, dependency: Hashable, container: Container
+                          ) -> Optional[DependencyValue]:
+            if dependency in {'cached', 'not cached'}:
+                return DependencyValue(object(), cacheable=dependency == 'cached')
+            return None
+
+    container.add_provider(First)
+    container.add_provider(Cacheable)
+
+    assert container.get('cached') is not container.get('cached')
+    assert container.provide('cached').cacheable is False
+    assert First.calls == 1
+
+    First.calls = 0
+    assert container.get('not cached') is not container.get('not cached')
+    assert First.calls == 2
+
+
+def test_transient_concurrency(container: RawContainer):
+    barrier = threading.Barrier(2, timeout=5)
+    behavior = 'default'
+
+    class Transient(RawProvider):
+        def exists(self, dependency):
+            return dependency == 'transient'
+
+        def maybe_provide(self, dependency: Hashable, container: Container
+                          ) -> Optional[DependencyValue]:
+            if dependency != 'transient':
+                return None
+            if behavior == 'wait':
+                barrier.wait()
+            elif behavior == 'cycle':
+                container.get('transient')
+            elif behavior == 'error':
+                raise RuntimeError()
+            return DependencyValue(object(), cacheable=True)
+
+    container.add_provider(Transient)
+    assert container.get('transient') is not container.get('transient')
+
+    behavior = 'cycle'
+    with pytest.raises(DependencyCycleError):
+        container.get('transient')
+
+    behavior = 'error'
+    with pytest.raises(DependencyInstantiationError):
+        container.get('transient')
+
+    # Once cached, transient dependencies are instantiated without any lock. Both threads
+    # would be waiting for each other otherwise.
+    behavior = 'wait'
+    values = []
+    threads = [threading.Thread(target=lambda: values.append(container.get('transient')))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(values) == 2
+    assert values[0] is not values[1]
+
+
+def test_invalid_dependency_value():
+    with pytest.raises(TypeError, match=".*cacheable.*"):
+        DependencyValue(object(), cacheable=object())
+
+
 def test_sanity_checks(container: RawContainer):
     # Cannot register twice the same kind of provider
     container.add_provider(DummyProvider)
@@ -1,4 +1,5 @@
 import itertools
+import threading
 from typing import Optional, Sequence, Union
 
 import pytest
@@ -61,7 +62,11 @@ def test_validate_injection(kwargs, expectation):
         validate_injection(**kwargs)
 
 
-@pytest.fixture(params=[inject])
+def lazy_inject(__func=None, **kwargs):
+    return inject(__func, lazy=True, **kwargs)
+
+
+@pytest.fixture(params=[inject, lazy_inject], ids=['inject', 'lazy_inject'])
 def injector(request):
     return request.param
 
@@ -591,6 +596,8 @@ def test_multiple_antidote_annotations(injector):
             def custom_annotated(x: Annotated[Dummy, a, b]):
                 return x
 
+            custom_annotated()
+
 
 @pytest.fixture(params=['function',
                         'method',
@@ -757,7 +764,7 @@ def test_strict_validation(injected_method_with, injector, expectation, kwargs,
     kwargs['strict_validation'] = strict
     if strict:
         with expectation:
-            injected_method_with(**kwargs)
+            injected_method_with(**kwargs)(object())
     else:
         injected_method_with(**kwargs)(object())
 
@@ -780,7 +787,7 @@ def test_cannot_inject_self(injector, expectation, kwargs):
             def method(self, x=None):
                 return x
 
-        A()
+        A().method()
 
     with expectation:
         class A:
@@ -789,7 +796,7 @@ def test_cannot_inject_self(injector, expectation, kwargs):
             def classmethod(self, x=None):
                 return x
 
-        A()
+        A.classmethod()
 
     with expectation:
         class A:
@@ -798,7 +805,7 @@ def test_cannot_inject_self(injector, expectation, kwargs):
             def classmethod(self, x=None):
                 return x
 
-        A()
+        A.classmethod()
 
 
 def test_no_injections():
@@ -888,3 +895,104 @@ def test_static_class_method(injector):
 
     assert isinstance(Dummy.__dict__['static'], staticmethod)
     assert isinstance(Dummy.__dict__['klass'], classmethod)
+
+
+def test_lazy_injection():
+    calls = []
+
+    def dependencies(arg):
+        calls.append(arg.name)
+        return 'x'
+
+    @inject(dependencies=dependencies, lazy=True)
+    def f(x, y=None):
+        return x
+
+    assert calls == []
+    with world.test.empty():
+        world.singletons.add('x', SENTINEL)
+        assert f() is SENTINEL
+        assert f() is SENTINEL
+    assert calls == ['x', 'y']
+
+
+def test_lazy_injection_independent_wrappers():
+    @inject(dependencies=dict(x='x'), lazy=True)
+    def g(x):
+        return x
+
+    def dependencies(arg):
+        # g is called for the first time while f's blueprint is being built.
+        thread = threading.Thread(target=lambda: results.append(g()))
+        thread.start()
+        thread.join(timeout=5)
+        return 'x'
+
+    @inject(dependencies=dependencies, lazy=True)
+    def f(x):
+        return x
+
+    results = []
+    with world.test.empty():
+        world.singletons.add('x', SENTINEL)
+        assert f() is SENTINEL
+        assert results == [SENTINEL]
+
+
+def test_lazy_injection_forward_reference():
+    @inject(auto_provide=True, lazy=True)
+    def f(x: 'ForwardService'):  # noqa: F821
+        return x
+
+    class ForwardService:
+        pass
+
+    globals()['ForwardService'] = ForwardService
+    try:
+        with world.test.empty():
+            world.singletons.add(ForwardService, SENTINEL)
+            assert f() is SENTINEL
+    finally:
+        del globals()['ForwardService']
+
+
+def test_lazy_injection_without_any_dependency():
+    def f(x):
+        return x
+
+    assert inject(f, lazy=True) is f
+
+    def g(x: int, y: Optional[str] = None) -> int:
+        return x
+
+    assert inject(g, lazy=False) is g
+    assert inject(g, lazy=True) is g
+
+    def h(x: Optional[Provide[int]] = None) -> int:
+        return x
+
+    assert inject(h, lazy=True) is not h
+
+    def k(x: 'int') -> int:
+        return x
+
+    # String annotations are only resolved on the first call.
+    assert inject(k, lazy=False) is k
+    assert inject(k, lazy=True) is not k
+
+
+def test_lazy_injection_default(monkeypatch):
+    from antidote.core import injection
+
+    monkeypatch.setattr(injection, '_LAZY_INJECTION', True)
+
+    @inject(dependencies=dict(unknown='x'))
+    def f(x=None):
+        return x
+
+    # Invalid arguments are only detected on the first call
+    with pytest.raises(ValueError, match=".*unknown.*"):
+        f()
+
+    with pytest.raises(TypeError, match=".*lazy.*"):
+        inject(f, lazy=object())
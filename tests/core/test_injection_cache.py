@@ -0,0 +1,173 @@
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+
+from antidote import Provide, inject, world
+from antidote._internal import argspec
+from antidote.core import _injection_cache, injection
+
+
+class Service:
+    pass
+
+
+class OtherService:
+    pass
+
+
+# Functions defined within another one are never cached, so those are defined here.
+def f(a, x: Provide[Service], y=None):
+    return x, y
+
+
+def g(a):
+    return a
+
+
+def h(a):
+    return a
+
+
+def make_injected(dependency):
+    @inject
+    def injected(x: Provide[dependency]):
+        return x
+
+    return injected
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    # Blueprints are only built, hence cached, on first call with lazy injection.
+    monkeypatch.setattr(injection, '_LAZY_INJECTION', False)
+    cache = tmp_path / 'cache'
+    cache.mkdir()
+    monkeypatch.setattr(_injection_cache, '_CACHE_DIR', str(cache))
+    monkeypatch.setattr(_injection_cache, '__modules', dict())
+    monkeypatch.setattr(_injection_cache, '__sources', dict())
+    yield cache
+
+
+def restart(monkeypatch):
+    """Simulates a new process"""
+    _injection_cache.save()
+    monkeypatch.setattr(_injection_cache, '__modules', dict())
+    monkeypatch.setattr(_injection_cache, '__sources', dict())
+
+
+def forbid_analysis(monkeypatch):
+    def from_callable(f):
+        raise RuntimeError("Cache was not used.")
+
+    monkeypatch.setattr(argspec.Arguments, 'from_callable', from_callable)
+
+
+def test_cached_blueprint(monkeypatch, cache_dir):
+    assert inject(g) is g
+    inject(f)
+    inject(h, dependencies='{arg_name}', use_names=['a'])
+    assert len(list(cache_dir.iterdir())) == 0
+
+    restart(monkeypatch)
+    assert len(list(cache_dir.iterdir())) == 1
+    forbid_analysis(monkeypatch)
+
+    assert inject(g) is g
+    injected_f = inject(f)
+    injected_h = inject(h, dependencies='{arg_name}', use_names=['a'])
+    with world.test.empty():
+        s = Service()
+        world.singletons.add({Service: s, 'a': 'A'})
+        assert (s, None) == injected_f(1)
+        assert 'A' == injected_h()
+
+    # Different parameters
+    with pytest.raises(RuntimeError, match="Cache"):
+        inject(h, dependencies='{arg_name}')
+
+
+def test_not_cacheable(monkeypatch):
+    class LocalService:
+        pass
+
+    def local(x: Provide[LocalService]):
+        return x
+
+    inject(local)
+    inject(g, dependencies=dict(a=Service))
+    restart(monkeypatch)
+    forbid_analysis(monkeypatch)
+
+    with pytest.raises(RuntimeError, match="Cache"):
+        inject(local)
+    with pytest.raises(RuntimeError, match="Cache"):
+        inject(g, dependencies=dict(a=Service))
+
+
+def test_local_functions_not_cached(monkeypatch, cache_dir):
+    with world.test.empty():
+        service, other = Service(), OtherService()
+        world.singletons.add({Service: service, OtherService: other})
+        # Same definition site, but different dependencies.
+        assert make_injected(Service)() is service
+        assert make_injected(OtherService)() is other
+
+    restart(monkeypatch)
+    assert len(list(cache_dir.iterdir())) == 0
+
+
+def test_invalidation(monkeypatch, cache_dir):
+    inject(f)
+    restart(monkeypatch)
+
+    path, = cache_dir.iterdir()
+    content = json.loads(path.read_text())
+    content['stamp'][-1] += 1
+    path.write_text(json.dumps(content))
+
+    forbid_analysis(monkeypatch)
+    with pytest.raises(RuntimeError, match="Cache"):
+        inject(f)
+
+
+def load_module(monkeypatch, path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, path.stem, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_invalidation_by_other_module(monkeypatch, cache_dir, tmp_path):
+    source = tmp_path / 'cache_dependency.py'
+    source.write_text("class Dependency:\n    pass\n")
+    load_module(monkeypatch, source)
+    user = tmp_path / 'cache_user.py'
+    user.write_text("from antidote import Provide\n"
+                    "from cache_dependency import Dependency\n"
+                    "\n"
+                    "def f(x: Provide[Dependency]):\n"
+                    "    return x\n")
+    f = load_module(monkeypatch, user).f
+
+    inject(f)
+    restart(monkeypatch)
+    forbid_analysis(monkeypatch)
+    inject(f)
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    restart(monkeypatch)
+    with pytest.raises(RuntimeError, match="Cache"):
+        inject(f)
+
+
+def test_disabled(monkeypatch, cache_dir):
+    monkeypatch.setattr(_injection_cache, '_CACHE_DIR', None)
+
+    inject(f)
+    restart(monkeypatch)
+    assert len(list(cache_dir.iterdir())) == 0
@@ -99,6 +99,85 @@ def test_auto_cast(auto_cast, a, b, c):
     assert Config().D is D
 
 
+def test_memoized():
+    calls = []
+
+    class Config(Constants):
+        A = const[int]('a')
+        B = const('b', default='x')
+
+        def get(self, key):
+            calls.append(key)
+            return dict(a='1')[key]
+
+    conf = Config()
+    assert conf.A == 1
+    assert conf.A == 1
+    assert conf.B == 'x'
+    assert conf.B == 'x'
+    assert calls == ['a', 'b']
+
+    assert world.get(Config.A) == 1
+    assert world.get(Config.B) == 'x'
+    assert calls == ['a', 'b', 'a', 'b']
+
+
+def test_get_all():
+    calls = []
+
+    class Config(Constants):
+        __antidote__ = Constants.Conf(bulk_load=True)
+        A = const[int]('a')
+        B = const('b')
+        C = const('c', default='z')
+        D = const('d')
+
+        def get_all(self, keys):
+            calls.append(('get_all', list(keys)))
+            return dict(a='1', b='y')
+
+        def get(self, key):
+            calls.append(('get', key))
+            if key == 'd':
+                return 'w'
+            raise KeyError(key)
+
+    assert world.get(Config.B) == 'y'
+    assert calls == [('get_all', ['a', 'b', 'c', 'd'])]
+    assert world.get(Config.A) == 1
+    assert world.get(Config.C) == 'z'
+    assert world.get(Config.D) == 'w'
+    assert calls == [('get_all', ['a', 'b', 'c', 'd']), ('get', 'c'), ('get', 'd')]
+
+    calls.clear()
+    conf = Config()
+    assert (conf.D, conf.C, conf.B, conf.A) == ('w', 'z', 'y', 1)
+    assert calls == [('get_all', ['a', 'b', 'c', 'd']), ('get', 'd'), ('get', 'c')]
+
+
+def test_get_all_not_enabled():
+    class Config(Constants):
+        A = const('a')
+
+        def get_all(self, keys):  # pragma: no cover
+            raise RuntimeError()
+
+        def get(self, key):
+            return key * 2
+
+    assert world.get(Config.A) == 'aa'
+
+
+def test_bulk_load_without_get_all():
+    with pytest.raises(TypeError, match=".*get_all.*"):
+        class Config(Constants):
+            __antidote__ = Constants.Conf(bulk_load=True)
+            A = const('a')
+
+            def get(self, key):
+                pass
+
+
 def test_no_const():
     class Config(Constants):
         __antidote__ = Constants.Conf()
@@ -146,6 +225,7 @@ def test_no_subclass_of_constants():
     (dict(wiring=object()), pytest.raises(TypeError, match=".*wiring.*")),
     (dict(auto_cast=object()), pytest.raises(TypeError, match=".*auto_cast.*")),
     (dict(auto_cast=['1']), pytest.raises(TypeError, match=".*auto_cast.*")),
+    (dict(bulk_load=object()), pytest.raises(TypeError, match=".*bulk_load.*")),
 ])
 def test_conf_error(kwargs, expectation):
     with expectation:
@@ -155,6 +235,7 @@ def test_conf_error(kwargs, expectation):
 @pytest.mark.parametrize('kwargs', [
     dict(wiring=Wiring(methods=['method'])),
     dict(auto_cast=frozenset((str,))),
+    dict(bulk_load=True),
 ])
 def test_conf_copy(kwargs):
     conf = Constants.Conf().copy(**kwargs)
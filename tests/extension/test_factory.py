@@ -218,13 +218,59 @@ def test_invalid_conf():
                 'singleton',
                 'scope',
                 'tags',
-                'public']
+                'public',
+                'pool',
+                'dispose']
 ])
 def test_invalid_conf_args(kwargs, expectation):
     with expectation:
         Factory.Conf(**kwargs)
 
 
+def test_pool():
+    class Connection:
+        pass
+
+    class ConnectionFactory(Factory):
+        __antidote__ = Factory.Conf(pool=1)
+
+        def __call__(self) -> Connection:
+            return Connection()
+
+    @inject(dependencies=dict(connection=Connection @ ConnectionFactory))
+    def query(connection=None):
+        return connection
+
+    connection = query()
+    assert isinstance(connection, Connection)
+    assert query() is connection
+
+    with world.test.clone():
+        assert query() is not connection
+
+    # Instances retrieved outside of an injected function are not given back.
+    assert world.get(Connection @ ConnectionFactory) is connection
+    assert query() is not connection
+
+
+def test_dispose():
+    scope = world.scopes.new('dummy')
+    disposed = []
+
+    class Connection:
+        pass
+
+    class ConnectionFactory(Factory):
+        __antidote__ = Factory.Conf(scope=scope, dispose=disposed.append)
+
+        def __call__(self) -> Connection:
+            return Connection()
+
+    connection = world.get(Connection @ ConnectionFactory)
+    world.scopes.reset(scope, wait=True)
+    assert disposed == [connection]
+
+
 @pytest.mark.parametrize('kwargs', [
     dict(singleton=False),
     dict(scope=None),
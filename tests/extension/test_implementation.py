@@ -68,6 +68,83 @@ def test_implementation(singleton: bool, permanent: bool):
         assert (world.get(dependency) is world.get(B)) is singleton
 
 
+@pytest.mark.parametrize('singleton', [True, False])
+def test_permanent_implementation_alias(singleton: bool):
+    class A(Interface, Service):
+        __antidote__ = Service.Conf(singleton=singleton)
+
+    @implementation(Interface)
+    def choose():
+        return A
+
+    @implementation(Interface)
+    def choose_again():
+        return Interface @ choose
+
+    for dependency in [Interface @ choose, Interface @ choose_again]:
+        assert isinstance(world.get(dependency), A)
+        assert isinstance(world.get(dependency), A)
+        assert (world.get(dependency) is world.get(A)) is singleton
+
+        # Overrides of the target still apply.
+        with world.test.clone():
+            a = A()
+            world.test.override.singleton(A, a)
+            assert world.get(dependency) is a
+
+
+@pytest.mark.parametrize('singleton', [True, False])
+def test_scoped_implementation(singleton: bool):
+    scope = world.scopes.new(name='dummy')
+    choice = 'a'
+
+    class A(Interface, Service):
+        __antidote__ = Service.Conf(singleton=singleton)
+
+    class B(Interface, Service):
+        __antidote__ = Service.Conf(singleton=singleton)
+
+    calls = 0
+
+    @implementation(Interface, scope=scope)
+    def choose_service():
+        nonlocal calls
+        calls += 1
+        return dict(a=A, b=B)[choice]
+
+    dependency = Interface @ choose_service
+    assert isinstance(world.get(dependency), A)
+    assert (world.get(dependency) is world.get(A)) is singleton
+    assert calls == 1
+
+    choice = 'b'
+    assert isinstance(world.get(dependency), A)
+    assert calls == 1
+
+    world.scopes.reset(scope)
+    assert isinstance(world.get(dependency), B)
+    assert (world.get(dependency) is world.get(B)) is singleton
+    assert calls == 2
+
+
+def test_scoped_implementation_none():
+    choice = 'a'
+
+    class A(Interface, Service):
+        pass
+
+    class B(Interface, Service):
+        pass
+
+    @implementation(Interface, scope=None)
+    def choose_service():
+        return dict(a=A, b=B)[choice]
+
+    assert world.get(Interface @ choose_service) is world.get(A)
+    choice = 'b'
+    assert world.get(Interface @ choose_service) is world.get(B)
+
+
 def test_implementation_with_service():
     x = object()
 
@@ -137,6 +214,14 @@ def test_invalid_implementation(expectation, kwargs: dict, func):
         implementation(**kwargs)(func)
 
 
+def test_invalid_implementation_scope():
+    with pytest.raises(TypeError, match=".*scope.*"):
+        implementation(Interface, scope=object())
+
+    with pytest.raises(TypeError, match=".*permanent.*scope.*"):
+        implementation(Interface, permanent=False, scope=None)
+
+
 def test_invalid_implementation_return_type():
     class B:
         pass
@@ -1,7 +1,9 @@
 import pytest
 
-from antidote import LazyCall, LazyMethodCall, Service, world
+from antidote import (LazyCall, LazyMethodCall, LazyProvide, Provide, Service, inject,
+                      world)
 from antidote._providers import LazyProvider, ServiceProvider
+from antidote.exceptions import DependencyNotFoundError
 
 
 @pytest.fixture(autouse=True)
@@ -127,3 +129,80 @@ def test_invalid_lazy_method_call():
 
     with pytest.raises(TypeError, match=".*singleton.*"):
         LazyMethodCall(method='method', singleton=object())
+
+
+def test_lazy_provide():
+    created = []
+
+    class Database(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+        def __init__(self):
+            created.append(self)
+            self.name = 'db'
+
+        def query(self, x):
+            return x * 2
+
+        def __call__(self):
+            return 'called'
+
+    @inject
+    def f(db: LazyProvide[Database]):
+        return db
+
+    db = f()
+    assert created == []
+    assert isinstance(db, Database)
+    assert len(created) == 1
+    assert db.name == 'db'
+    assert db.query(3) == 6
+    assert db() == 'called'
+    db.name = 'other'
+    assert created[0].name == 'other'
+    assert db == created[0]
+    assert hash(db) == hash(created[0])
+    assert repr(db) == repr(created[0])
+    # Resolved only once per proxy.
+    assert len(created) == 1
+    f().name
+    assert len(created) == 2
+
+    @inject
+    def g(x: Provide[Database], db: LazyProvide[Database]):
+        return db
+
+    g()
+    assert len(created) == 3
+
+
+def test_lazy_provide_container_protocols():
+    class Items(list):
+        pass
+
+    world.singletons.add(Items, Items([1, 2]))
+
+    @inject
+    def f(items: LazyProvide[Items]):
+        return items
+
+    items = f()
+    assert len(items) == 2
+    assert list(items) == [1, 2]
+    assert 1 in items
+    assert items[0] == 1
+    items[0] = 3
+    assert world.get(Items) == [3, 2]
+
+
+def test_lazy_provide_not_found():
+    class Unknown:
+        pass
+
+    @inject
+    def f(x: LazyProvide[Unknown]):
+        return x
+
+    proxy = f()
+    with pytest.raises(DependencyNotFoundError):
+        proxy.attr
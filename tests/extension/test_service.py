@@ -1,10 +1,12 @@
+import threading
 from contextlib import contextmanager
 
 import pytest
 
-from antidote import service, Service, Tag, Wiring, world
+from antidote import inject, Provide, Scope, service, Service, Tag, Wiring, world
+from antidote._internal.pool import pooled_dependencies
 from antidote._providers import ServiceProvider
-from antidote.exceptions import DuplicateDependencyError
+from antidote.exceptions import DependencyNotFoundError, DuplicateDependencyError
 
 
 @contextmanager
@@ -166,13 +168,256 @@ def test_invalid_conf():
     for arg in ['wiring',
                 'singleton',
                 'scope',
-                'tags']
+                'tags',
+                'pool',
+                'dispose']
 ])
 def test_invalid_conf_args(kwargs, expectation):
     with expectation:
         Service.Conf(**kwargs)
 
 
+def test_pool():
+    created = []
+
+    class Parser(Service):
+        __antidote__ = Service.Conf(pool=1)
+
+        def __init__(self):
+            created.append(self)
+
+    assert not Parser.__antidote__.singleton
+
+    @inject
+    def parse(parser: Provide[Parser]):
+        return parser
+
+    @inject
+    def nested(parser: Provide[Parser]):
+        return parser, parse()
+
+    parser = parse()
+    assert parse() is parser
+    assert created == [parser]
+
+    outer, inner = nested()
+    assert outer is not inner
+    assert parse() in {outer, inner}
+    # At most one idle instance is kept.
+    nested()
+    assert len(created) == 3
+
+    # Instances retrieved outside of an injected function are not given back.
+    idle = parse()
+    assert world.get(Parser) is idle
+    assert parse() is not idle
+
+    # Explicitly passed arguments are left untouched.
+    assert parse(idle) is idle
+
+
+def test_pool_retrieval_within_call():
+    class Parser(Service):
+        __antidote__ = Service.Conf(pool=2)
+
+    retrieved = []
+
+    @inject
+    def parse(parser: Provide[Parser]):
+        retrieved.append(world.get(Parser))
+        return parser
+
+    parser = parse()
+    assert retrieved[0] is not parser
+    # Only the injected instance is given back.
+    assert world.get(Parser) is parser
+    assert world.get(Parser) is not retrieved[0]
+
+
+def test_pool_threads():
+    class Parser(Service):
+        __antidote__ = Service.Conf(pool=2)
+
+    barrier = threading.Barrier(2)
+    parsers = []
+
+    @inject
+    def parse(parser: Provide[Parser]):
+        barrier.wait()
+        parsers.append(parser)
+
+    threads = [threading.Thread(target=parse) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert parsers[0] is not parsers[1]
+
+    @inject
+    def both(first: Provide[Parser], second: Provide[Parser]):
+        return {first, second}
+
+    assert both() == set(parsers)
+
+
+def test_pool_not_given_back_by_methods():
+    class Parser(Service):
+        __antidote__ = Service.Conf(singleton=False, pool=2)
+
+    class Handler(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+        def __init__(self, parser: Provide[Parser]):
+            self.parser = parser
+
+        @inject
+        def set_parser(self, parser: Provide[Parser]):
+            self.other_parser = parser
+
+    h1 = world.get(Handler)
+    h2 = world.get(Handler)
+    assert h1.parser is not h2.parser
+
+    h1.set_parser()
+    h2.set_parser()
+    assert h1.other_parser is not h2.other_parser
+
+    @inject
+    def handle(handler: Provide[Handler]):
+        return handler
+
+    # Instances injected into the dependencies are kept too.
+    assert handle().parser is not handle().parser
+
+
+def test_pool_limit():
+    created = []
+
+    class Parser(Service):
+        __antidote__ = Service.Conf(pool=1)
+
+        def __init__(self):
+            created.append(self)
+
+    borrowed = threading.Event()
+    done = threading.Event()
+    parsers = []
+
+    @inject
+    def parse(parser: Provide[Parser]):
+        parsers.append(parser)
+        borrowed.set()
+        done.wait()
+
+    thread = threading.Thread(target=parse)
+    other = threading.Thread(target=parse)
+    try:
+        thread.start()
+        borrowed.wait()
+        # Waits for the borrowed instance to be given back.
+        other.start()
+        other.join(timeout=0.1)
+        assert len(parsers) == 1
+    finally:
+        done.set()
+        thread.join()
+        other.join()
+    assert parsers[0] is parsers[1]
+    assert created == parsers[:1]
+
+    # Nested calls within the same thread do not wait, but the additional instance is
+    # not kept.
+    @inject
+    def get(parser: Provide[Parser]):
+        return parser
+
+    @inject
+    def nested(parser: Provide[Parser]):
+        return parser, get()
+
+    outer, inner = nested()
+    assert outer is parsers[0]
+    assert inner is not outer
+    assert get() is outer
+    assert len(created) == 2
+
+
+def test_pool_injection_failure():
+    class Parser(Service):
+        __antidote__ = Service.Conf(pool=1)
+
+    @inject(dependencies=dict(missing='missing'))
+    def parse(parser: Provide[Parser], missing):
+        return parser
+
+    with pytest.raises(DependencyNotFoundError):
+        parse()
+
+    # A failed injection does not hold the pool.
+    thread = threading.Thread(target=parse, kwargs=dict(missing=None))
+    thread.start()
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+
+
+def test_pool_declared_after_injection():
+    class Parser:
+        pass
+
+    @inject
+    def parse(parser: Provide[Parser]):
+        return parser
+
+    world.get(ServiceProvider).register(Parser, scope=None, pool=1)
+    parser = parse()
+    assert parse() is parser
+
+
+def test_pool_test_worlds():
+    class Parser(Service):
+        __antidote__ = Service.Conf(pool=1)
+
+    @inject
+    def parse(parser: Provide[Parser]):
+        return parser
+
+    parser = parse()
+    with world.test.clone():
+        assert parse() is parse()
+        assert parse() is not parser
+
+    with world.test.new():
+        class Other(Service):
+            __antidote__ = Service.Conf(pool=1)
+
+        assert Other in pooled_dependencies
+        assert Parser not in pooled_dependencies
+
+    assert Other not in pooled_dependencies
+    assert parse() is parser
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(pool=0),
+    dict(pool=1, singleton=True),
+    dict(pool=1, scope=Scope.singleton()),
+])
+def test_invalid_pool(kwargs):
+    with pytest.raises(ValueError, match='.*pool.*'):
+        Service.Conf(**kwargs)
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(),
+    dict(singleton=True),
+    dict(singleton=False),
+])
+def test_invalid_dispose(kwargs):
+    with pytest.raises(ValueError, match='.*scope.*'):
+        Service.Conf(dispose=lambda x: None, **kwargs)
+
+
 @pytest.mark.parametrize('kwargs', [
     dict(singleton=False),
     dict(tags=(Tag(),)),
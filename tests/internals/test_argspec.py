@@ -1,8 +1,10 @@
 import itertools
 from inspect import getattr_static
+from typing import Optional
 
 import pytest
 
+from antidote import Provide
 from antidote._internal.argspec import Argument, Arguments
 
 
@@ -320,3 +322,56 @@ def test_repr_argument():
                    type_hint_with_extras='found me!')
     assert 'x:int =' in repr(arg)
     assert arg.type_hint_with_extras in repr(arg)
+
+
+class Forward:
+    pass
+
+
+def test_string_annotations():
+    def f1(x: 'Provide[Forward]', y: 'Forward' = None):
+        pass
+
+    def f2(x: 'Provide[Forward]', y: 'Optional[Forward]' = None):
+        pass
+
+    arguments1 = Arguments.from_callable(f1)
+    arguments2 = Arguments.from_callable(f2)
+
+    assert arguments1['x'].type_hint is Forward
+    assert arguments1['x'].type_hint_with_extras == Provide[Forward]
+    # Evaluated once
+    assert arguments1['x'].type_hint_with_extras is arguments2['x'].type_hint_with_extras
+    assert arguments2['y'].type_hint == Optional[Forward]
+
+
+def test_string_annotations_rebinding():
+    global Forward
+    original = Forward
+
+    def f(x: 'Forward'):
+        pass
+
+    assert Arguments.from_callable(f)['x'].type_hint is original
+
+    class Forward:  # noqa: F811
+        pass
+
+    try:
+        assert Arguments.from_callable(f)['x'].type_hint is Forward
+    finally:
+        Forward = original
+
+    def g(x: 'Unknown'):  # noqa: F821
+        pass
+
+    with pytest.raises(NameError):
+        Arguments.from_callable(g)
+
+
+def test_string_annotations_outside_module():
+    # Namespaces which aren't modules are not memoized, their id may be re-used.
+    for tpe in [int, str]:
+        namespace = dict(T=tpe)
+        exec("def f(x: 'T'): pass", namespace)
+        assert Arguments.from_callable(namespace['f'])['x'].type_hint is tpe
@@ -10,12 +10,13 @@ def test_double_init():
 
 
 def test_reset():
-    state.reset()
-    with pytest.raises(AssertionError):
-        state.current_container()
-
     state.init()
-    assert state.current_container() is not None
+    state.reset()
+    # created lazily
+    container = state.current_container()
+    assert container is not None
+    assert state.current_container() is container
+    assert state.init() is container
 
 
 def test_overridable_container():
@@ -2,6 +2,7 @@
 Test only that the wrapper behaves nicely in all cases.
 Injection itself is tested through inject.
 """
+import functools
 import inspect
 from typing import Any, List, Tuple
 
@@ -168,6 +169,21 @@ def test_classmethod_wrapping():
     assert A == A.method.__self__
 
 
+def test_bound_methods():
+    d = Dummy()
+    # Bound methods are simple (wrapper, instance) pairs.
+    assert Dummy.__dict__['method'] is d.method.__func__
+    assert d is d.method.__self__
+    assert Dummy.__dict__['class_before'] is d.class_before.__func__
+    assert Dummy is d.class_before.__self__
+    assert Dummy.__dict__['class_after'].__func__ is Dummy.class_after.__func__
+
+    # Same as functions, no binding otherwise
+    assert Dummy.__dict__['method'] is Dummy.method
+    assert Dummy.__dict__['static_before'] is Dummy.static_before
+    assert Dummy.__dict__['static_before'] is d.static_before
+
+
 def test_required_dependency_not_found():
     @easy_wrap(arg_dependency=[('x', True, 'unknown')])
     def f(x):
@@ -208,6 +224,101 @@ def test_multiple_injections():
         f(A, x=A)
 
 
+def test_keyword_only_injections():
+    @easy_wrap(arg_dependency=[('a', True, None),
+                               ('x', True, 'x'),
+                               ('y', False, 'unknown'),
+                               ('z', True, 'x')])
+    def f(a, *, x, y=B, z=None):
+        return a, x, y, z
+
+    assert (C, A, B, A) == f(C)
+    assert (C, B, C, A) == f(C, x=B, y=C)
+    assert (C, A, B, C) == f(a=C, z=C)
+
+
+def test_variadic_arguments():
+    @easy_wrap(arg_dependency=[('x', True, 'x'), ('y', True, 'x')])
+    def f(x, *args, y, **kwargs):
+        return x, args, y, kwargs
+
+    assert (A, (), A, {}) == f()
+    assert (B, (), A, {}) == f(B)
+    assert (A, (), B, dict(z=C)) == f(y=B, z=C)
+
+
+def test_positional_argument_after_injection():
+    @easy_wrap(arg_dependency=[('x', True, 'x'), ('y', True, None)])
+    def f(x, y):
+        return x, y
+
+    assert (A, B) == f(y=B)
+    assert (C, B) == f(C, B)
+    with pytest.raises(TypeError):
+        f(B)
+
+
+def test_optional_injection_followed_by_others():
+    @easy_wrap(arg_dependency=[('x', True, 'x'),
+                               ('y', False, 'unknown'),
+                               ('z', True, 'x'),
+                               ('w', True, None)])
+    def f(x, y=B, z=None, w=C):
+        return x, y, z, w
+
+    assert (A, B, A, C) == f()
+    assert (C, B, A, C) == f(C)
+    assert (C, C, A, C) == f(C, C)
+    assert (A, B, A, B) == f(w=B)
+
+
+def test_many_arguments():
+    names = [f"a{i}" for i in range(20)]
+    namespace = dict()
+    exec(f"def f({', '.join(names)}, x): return {', '.join(names)}, x", namespace)
+    f = easy_wrap(namespace['f'],
+                  arg_dependency=[(name, True, None) for name in names] + arg_x)
+
+    assert tuple(range(20)) + (A,) == f(*range(20))
+    assert tuple(range(20)) + (B,) == f(*range(20), B)
+    assert tuple(range(20)) + (B,) == f(*range(20), x=B)
+
+
+def test_many_arguments_decorated_function():
+    names = [f"a{i}" for i in range(40)]
+    namespace = dict()
+    exec(f"def f({', '.join(names)}, x): return {', '.join(names)}, x", namespace)
+
+    @functools.wraps(namespace['f'])
+    def wrapper(*args, **kwargs):
+        return namespace['f'](*args, **kwargs)
+
+    f = easy_wrap(wrapper,
+                  arg_dependency=[(name, True, None) for name in names] + arg_x)
+
+    assert tuple(range(40)) + (A,) == f(*range(40))
+    assert tuple(range(40)) + (B,) == f(*range(40), B)
+    assert tuple(range(40)) + (B,) == f(*range(40), x=B)
+
+
+def test_decorated_function():
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @easy_wrap(arg_dependency=[('x', True, 'x'), ('y', False, 'unknown')])
+    @decorator
+    def f(x, y=B):
+        return x, y
+
+    assert (A, B) == f()
+    assert (C, B) == f(C)
+    assert (A, C) == f(y=C)
+
+
 def g():
     pass
 
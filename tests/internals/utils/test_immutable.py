@@ -51,3 +51,45 @@ def test_immutability(cls: type):
 
     with pytest.raises(AttributeError):
         a.unknown = 1
+
+
+def test_initialization(cls: type):
+    class A(cls):
+        __slots__ = ('x', '__y')
+
+        def y(self):
+            return self.__y
+
+    a = A(1, __y=2)
+    assert (a.x, a.y()) == (1, 2)
+    a = A(x=1)
+    assert a.x == 1
+    with pytest.raises(AttributeError):
+        a.y()
+
+    class B(cls):
+        __slots__ = ('x', '__y')
+
+        def __init__(self, x, y):
+            super().__init__(x, y)
+
+        def y(self):
+            return self.__y
+
+    b = B(1, 2)
+    assert (b.x, b.y()) == (1, 2)
+
+
+def test_inherited_slots():
+    class A(Immutable):
+        __slots__ = ('x',)
+
+    class B(A):
+        __slots__ = ('y',)
+
+        def __init__(self, x, y):
+            super().__init__(y=y, x=x)
+
+    b = B(1, 2)
+    assert (b.x, b.y) == (1, 2)
+    assert A(1).x == 1
@@ -72,6 +72,18 @@ def test_exists(scope: Scope, factory: Any):
     assert not provider.exists(build)
 
 
+def test_transient(provider: FactoryProvider, factory: Any):
+    factory_id = provider.register(A, factory=factory, scope=None)
+    for _ in range(3):
+        assert isinstance(world.get(factory_id), A)
+        assert world.get(factory_id) is not world.get(factory_id)
+
+    with world.test.clone():
+        a = A()
+        world.test.override.singleton(factory_id, a)
+        assert world.get(factory_id) is a
+
+
 @pytest.mark.parametrize('singleton', [True, False])
 def test_singleton(provider: FactoryProvider, singleton: bool, factory: Any):
     scope = Scope.singleton() if singleton else None
@@ -0,0 +1,109 @@
+import pytest
+
+from antidote import Provide, Service, inject, world
+from antidote.exceptions import DependencyCycleError, DependencyInstantiationError
+
+
+@pytest.fixture(autouse=True)
+def test_world():
+    with world.test.new():
+        yield
+
+
+def test_compile_graphs():
+    calls = []
+
+    class Singleton(Service):
+        pass
+
+    class Leaf(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+        def __init__(self):
+            calls.append('leaf')
+
+    class Middle(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+        def __init__(self, leaf: Provide[Leaf], singleton: Provide[Singleton]):
+            self.leaf = leaf
+            self.singleton = singleton
+
+    class Root(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+        def __init__(self,
+                     middle: Provide[Middle],
+                     leaf: Provide[Leaf],
+                     optional: Provide[Leaf] = None):
+            self.middle = middle
+            self.leaf = leaf
+            self.optional = optional
+
+    # Retrieved before compilation
+    world.get(Root)
+    world.freeze(compile_graphs=True)
+
+    for _ in range(3):
+        calls.clear()
+        root = world.get(Root)
+        assert calls == ['leaf', 'leaf', 'leaf']
+        assert isinstance(root.middle.leaf, Leaf)
+        assert root.middle.singleton is world.get(Singleton)
+        assert len({id(root.leaf), id(root.middle.leaf), id(root.optional)}) == 3
+        assert world.get(Root) is not root
+
+    with world.test.clone():
+        leaf = Leaf()
+        world.test.override.singleton(Leaf, leaf)
+        root = world.get(Root)
+        assert root.leaf is leaf
+        assert root.middle.leaf is leaf
+
+
+def test_cycle():
+    class A(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+        @inject(dependencies=dict(b='b'))
+        def __init__(self, b):
+            self.b = b
+
+    class B(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+        def __init__(self, a: Provide[A]):
+            self.a = a
+
+    A.__init__ = inject(A.__init__.__wrapped__, dependencies=dict(b=B))
+    world.freeze(compile_graphs=True)
+    with pytest.raises(DependencyCycleError):
+        world.get(A)
+
+
+def test_errors():
+    fail = False
+
+    class Leaf(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+        def __init__(self):
+            if fail:
+                raise RuntimeError()
+
+    class Root(Service):
+        __antidote__ = Service.Conf(singleton=False)
+
+        def __init__(self, leaf: Provide[Leaf]):
+            self.leaf = leaf
+
+    world.freeze(compile_graphs=True)
+    assert isinstance(world.get(Root).leaf, Leaf)
+    fail = True
+    with pytest.raises(DependencyInstantiationError, match=".*Root.*"):
+        world.get(Root)
+
+
+def test_invalid_compile_graphs():
+    with pytest.raises(TypeError, match=".*compile_graphs.*"):
+        world.freeze(compile_graphs=object())
@@ -0,0 +1,192 @@
+import sys
+import textwrap
+
+import pytest
+
+from antidote import Tag, Tagged, world
+from antidote._providers import LazyImportProvider, ServiceProvider, TagProvider
+from antidote.exceptions import (DependencyInstantiationError, DuplicateDependencyError,
+                                 FrozenWorldError)
+
+
+@pytest.fixture(autouse=True)
+def test_world():
+    with world.test.empty():
+        world.provider(ServiceProvider)
+        world.provider(LazyImportProvider)
+        yield
+
+
+@pytest.fixture
+def module(tmp_path, monkeypatch, request):
+    name = f"lazy_import_{request.node.name}".replace('[', '_').replace(']', '')
+    (tmp_path / f"{name}.py").write_text(textwrap.dedent("""
+        from antidote import Service
+
+        class Database(Service):
+            pass
+
+        class Nested:
+            class Database(Service):
+                pass
+
+        class Unknown:
+            pass
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+def test_import_on_first_lookup(module: str):
+    dependency = world.register_lazy(f"{module}:Database")
+    assert dependency == f"{module}:Database"
+    assert module not in sys.modules
+
+    db = world.get(dependency)
+    assert module in sys.modules
+    assert isinstance(db, sys.modules[module].Database)
+    assert world.get(dependency) is db
+    assert world.get(sys.modules[module].Database) is db
+
+
+def test_nested(module: str):
+    db = world.get(world.register_lazy(f"{module}:Nested.Database"))
+    assert isinstance(db, sys.modules[module].Nested.Database)
+
+
+def test_debug(module: str):
+    world.register_lazy(f"{module}:Database")
+    assert f"{module}:Database" in world.debug(f"{module}:Database")
+
+
+def test_clone(module: str):
+    provider = LazyImportProvider()
+    provider.register(f"{module}:Database")
+    assert f"{module}:Database" in repr(provider)
+    assert provider.clone(False).exists(f"{module}:Database")
+
+
+def test_invalid_path():
+    with pytest.raises(TypeError):
+        world.register_lazy(object())
+
+    for path in ['module', ':Database', 'module:']:
+        with pytest.raises(ValueError, match=".*module:qualname.*"):
+            world.register_lazy(path)
+
+
+def test_not_a_dependency(module: str):
+    world.register_lazy(f"{module}:Unknown")
+    with pytest.raises(DependencyInstantiationError):
+        world.get(f"{module}:Unknown")
+
+
+def test_missing_module():
+    world.register_lazy("antidote_missing_module:Database")
+    with pytest.raises(DependencyInstantiationError):
+        world.get("antidote_missing_module:Database")
+
+
+def test_duplicate(module: str):
+    world.register_lazy(f"{module}:Database")
+    with pytest.raises(DuplicateDependencyError):
+        world.register_lazy(f"{module}:Database")
+
+    world.singletons.add("x:y", 1)
+    with pytest.raises(DuplicateDependencyError):
+        world.register_lazy("x:y")
+
+
+def test_freeze(module: str):
+    world.freeze()
+    with pytest.raises(FrozenWorldError):
+        world.register_lazy(f"{module}:Database")
+
+
+def test_tags(module: str):
+    world.provider(TagProvider)
+    tag = Tag()
+    world.register_lazy(f"{module}:Database", tags=[tag])
+    world.register_lazy(f"{module}:Nested.Database", tags=[tag])
+
+    tagged = world.get[Tagged](Tagged.with_(tag))
+    assert len(tagged) == 2
+    assert module not in sys.modules
+
+    values = list(tagged.values())
+    assert {type(v) for v in values} == {sys.modules[module].Database,
+                                         sys.modules[module].Nested.Database}
+
+    with pytest.raises(TypeError):
+        world.register_lazy(f"{module}:Unknown", tags=[object()])
+    assert not world.get[LazyImportProvider]().exists(f"{module}:Unknown")
+
+
+def test_entry_points(module: str, tmp_path):
+    world.provider(TagProvider)
+    dist_info = tmp_path / f"{module}-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Name: {module}\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(textwrap.dedent(f"""
+        [{module}.plugins]
+        database = {module}:Database
+        nested = {module}:Nested.Database [extra]
+    """))
+
+    tag = Tag()
+    paths = world.register_entry_points(f"{module}.plugins", tags=[tag])
+    assert sorted(paths) == [f"{module}:Database", f"{module}:Nested.Database"]
+    assert world.register_entry_points(f"{module}.missing", tags=[tag]) == []
+    assert module not in sys.modules
+
+    values = list(world.get[Tagged](Tagged.with_(tag)).values())
+    assert {type(v) for v in values} == {sys.modules[module].Database,
+                                         sys.modules[module].Nested.Database}
+
+    with pytest.raises(TypeError):
+        world.register_entry_points(object(), tags=[tag])
+
+
+def test_import_outside_of_instantiation_lock(tmp_path, monkeypatch):
+    name = "lazy_import_threaded"
+    (tmp_path / f"{name}.py").write_text(textwrap.dedent("""
+        import threading
+        from antidote import Service, world
+
+        class Database(Service):
+            pass
+
+        # Dependencies may be retrieved from another thread while being imported.
+        databases = []
+        thread = threading.Thread(target=lambda: databases.append(world.get(Database)))
+        thread.start()
+        thread.join(timeout=5)
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        db = world.get(world.register_lazy(f"{name}:Database"))
+        assert sys.modules[name].databases == [db]
+    finally:
+        sys.modules.pop(name, None)
+
+
+def test_entry_points_invalid(module: str, tmp_path):
+    world.provider(TagProvider)
+    dist_info = tmp_path / f"{module}-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Name: {module}\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(textwrap.dedent(f"""
+        [{module}.plugins]
+        database = {module}:Database
+        broken = {module}
+    """))
+
+    tag = Tag()
+    with pytest.raises(ValueError, match=".*'broken'.*") as exc_info:
+        world.register_entry_points(f"{module}.plugins", tags=[tag])
+    if sys.version_info >= (3, 10):
+        assert f"distribution '{module}'" in str(exc_info.value)
+    # None of them was registered.
+    assert not world.get[LazyImportProvider]().exists(f"{module}:Database")
+    world.register_lazy(f"{module}:Database", tags=[tag])
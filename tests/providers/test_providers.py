@@ -2,7 +2,7 @@ import pytest
 
 from antidote import world
 from antidote._providers import (FactoryProvider, IndirectProvider,
-                                 LazyProvider,
+                                 LazyImportProvider, LazyProvider,
                                  ServiceProvider, TagProvider)
 from antidote.core.container import RawProvider
 
@@ -12,7 +12,8 @@ from antidote.core.container import RawProvider
     ServiceProvider,
     LazyProvider,
     TagProvider,
-    IndirectProvider
+    IndirectProvider,
+    LazyImportProvider
 ])
 def provider(request):
     return request.param()
@@ -2,8 +2,8 @@ import pytest
 
 from antidote import Scope, world
 from antidote._providers.service import Build, ServiceProvider
-from antidote.exceptions import (DependencyNotFoundError, DuplicateDependencyError,
-                                 FrozenWorldError)
+from antidote.exceptions import (DependencyInstantiationError, DependencyNotFoundError,
+                                 DuplicateDependencyError, FrozenWorldError)
 
 
 @pytest.fixture
@@ -84,6 +84,36 @@ def test_register(singleton: bool):
         assert isinstance(world.test.maybe_provide_from(provider, A).unwrapped, A)
 
 
+def test_transient(provider: ServiceProvider):
+    fail = False
+
+    class Failing:
+        def __init__(self):
+            if fail:
+                raise RuntimeError()
+
+    class Nested:
+        def __init__(self):
+            self.dependency = world.get(Failing)
+
+    provider.register(Failing, scope=None)
+    provider.register(Nested, scope=None)
+    for _ in range(3):
+        assert isinstance(world.get(Nested).dependency, Failing)
+        assert world.get(Nested) is not world.get(Nested)
+
+    fail = True
+    with pytest.raises(DependencyInstantiationError, match=".*Nested.*"):
+        world.get(Nested)
+    with pytest.raises(DependencyInstantiationError, match=".*Failing.*"):
+        world.get(Failing)
+
+    fail = False
+    with world.test.clone():
+        world.test.override.singleton(Failing, Failing())
+        assert world.get(Nested).dependency is world.get(Failing)
+
+
 def test_build(provider: ServiceProvider, scope: Scope):
     provider.register(A, scope=scope)
 
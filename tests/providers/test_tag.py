@@ -3,7 +3,7 @@ import pytest
 from antidote import world
 from antidote._internal.utils import short_id
 from antidote._providers import Tag, Tagged, TagProvider
-from antidote.core import DependencyValue
+from antidote.core import DependencyValue, StatelessProvider
 from antidote.exceptions import (DependencyNotFoundError, DuplicateTagError,
                                  FrozenWorldError)
 
@@ -12,6 +12,14 @@ class Service:
     pass
 
 
+class DummyProvider(StatelessProvider[str]):
+    def exists(self, dependency):
+        return dependency == 'transient'
+
+    def provide(self, dependency, container):
+        return DependencyValue(object())
+
+
 @pytest.fixture()
 def provider():
     with world.test.empty():
@@ -207,3 +215,120 @@ def test_freeze(provider: TagProvider):
 
     with pytest.raises(FrozenWorldError):
         provider.register("test", tags=[Tag()])
+
+
+def test_cached_tagged(provider: TagProvider):
+    world.singletons.add(dict(test=object(), test2=object()))
+    tag = Tag()
+    provider.register('test', tags=[tag])
+
+    tagged = world.get(Tagged.with_(tag))
+    assert list(tagged.values()) == [world.get('test')]
+    # All singletons are resolved, the same Tagged is returned from now on.
+    tagged = world.get(Tagged.with_(tag))
+    assert world.get(Tagged.with_(tag)) is tagged
+
+    # A new tagged dependency invalidates the cache.
+    provider.register('test2', tags=[tag])
+    tagged2 = world.get(Tagged.with_(tag))
+    assert tagged2 is not tagged
+    assert list(tagged2.values()) == [world.get('test'), world.get('test2')]
+
+    world.freeze()
+    assert world.get(Tagged.with_(tag)) is world.get(Tagged.with_(tag))
+
+
+def test_tagged_non_singletons():
+    with world.test.empty():
+        world.provider(TagProvider)
+        world.provider(DummyProvider)
+        tag = Tag()
+        world.get(TagProvider).register('transient', tags=[tag])
+        world.singletons.add('singleton', object())
+        world.get(TagProvider).register('singleton', tags=[tag])
+
+        tagged = world.get(Tagged.with_(tag))
+        first = list(tagged.values())
+        assert list(tagged.values()) == first
+        assert first[1] is world.get('singleton')
+
+        other = world.get(Tagged.with_(tag))
+        assert other is not tagged
+        second = list(other.values())
+        assert first[0] is not second[0]
+        assert first[1] is second[1]
+
+
+def test_tags(provider: TagProvider):
+    tag = Tag()
+    tag2 = Tag()
+    provider.register('test', tags=[tag2, tag])
+    provider.register('test2', tags=[tag])
+
+    assert provider.tags('test') == (tag2, tag)
+    assert provider.tags('test2') == (tag,)
+    assert provider.tags('unknown') == tuple()
+
+    world.freeze()
+    assert provider.tags('test') == (tag2, tag)
+
+
+def test_registration_order(provider: TagProvider):
+    dependencies = [f"test{i}" for i in range(20)]
+    world.singletons.add({d: object() for d in dependencies})
+    tag = Tag()
+    for d in dependencies:
+        provider.register(d, tags=[tag])
+
+    tagged = world.get(Tagged.with_(tag))
+    assert list(tagged.values()) == [world.get(d) for d in dependencies]
+
+
+@pytest.mark.compiled_only
+def test_compiled_tagged_cache(provider: TagProvider):
+    from antidote.core.container import FastProvider
+
+    assert isinstance(provider, FastProvider)
+    world.singletons.add(dict(test=object(), test2=object()))
+    tag = Tag()
+    provider.register('test', tags=[tag])
+    first = world.get(Tagged.with_(tag))
+    # Not shared until its singletons are resolved.
+    assert world.get(Tagged.with_(tag)) is not first
+    assert list(first.values()) == [world.get('test')]
+    tagged = world.get(Tagged.with_(tag))
+    assert world.get(Tagged.with_(tag)) is tagged
+
+    # The cache is bound to the container it was created for.
+    with world.test.clone(keep_singletons=True):
+        other = world.get(Tagged.with_(tag))
+        assert other is not tagged
+        assert list(other.values()) == list(tagged.values())
+
+    provider.register('test2', tags=[tag])
+    tagged2 = world.get(Tagged.with_(tag))
+    assert tagged2 is not tagged
+    assert list(tagged2.values()) == [world.get('test'), world.get('test2')]
+
+
+@pytest.mark.compiled_only
+def test_compiled_tags_does_not_freeze(provider: TagProvider):
+    assert getattr(TagProvider.tags, "__antidote__freeze_sensitive") is False
+    provider.register('test', tags=[Tag()])
+    world.freeze()
+    assert len(provider.tags('test')) == 1
+
+
+def test_tagged_override(provider: TagProvider):
+    world.singletons.add('test', 'original')
+    tag = Tag()
+    provider.register('test', tags=[tag])
+
+    with world.test.clone(keep_singletons=True):
+        for _ in range(2):
+            assert list(world.get(Tagged.with_(tag)).values()) == ['original']
+
+        world.test.override.singleton('test', 'overridden')
+        assert list(world.get(Tagged.with_(tag)).values()) == ['overridden']
+
+    assert list(world.get(Tagged.with_(tag)).values()) == ['original']
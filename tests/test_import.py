@@ -0,0 +1,48 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import antidote
+
+
+def run(code: str) -> str:
+    return subprocess.run([sys.executable, '-c', code],
+                          check=True,
+                          stdout=subprocess.PIPE,
+                          env=dict(PYTHONPATH=':'.join(sys.path)),
+                          universal_newlines=True).stdout
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="PEP-562 is required.")
+def test_lazy_import():
+    # Guards against import time regressions: nothing besides antidote itself should
+    # be loaded nor the container created.
+    modules = run("import sys, antidote; "
+                  "print(sorted(m for m in sys.modules if m.startswith('antidote')))")
+    assert modules.strip() == "['antidote']"
+
+    # Container is not created either.
+    modules = run("import sys; from antidote import inject, Provide; "
+                  "print('antidote.factory' in sys.modules, "
+                  "      'antidote._providers' in sys.modules)")
+    assert modules.split() == ['False', 'False']
+
+
+def test_exports():
+    for name in antidote.__all__:
+        assert getattr(antidote, name) is not None
+    assert set(antidote.__all__) <= set(dir(antidote))
+
+    from antidote import factory, implementation, service, world
+    importlib.import_module('antidote.factory')
+    importlib.import_module('antidote.service')
+
+    assert callable(factory) and callable(antidote.factory)
+    assert callable(service) and callable(antidote.service)
+    assert callable(implementation)
+    assert world.get is antidote.world.get
+
+    with pytest.raises(AttributeError):
+        antidote.unknown
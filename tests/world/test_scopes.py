@@ -1,6 +1,10 @@
+import threading
+
 import pytest
 
-from antidote import world, Scope
+from antidote import Service, world, Scope
+from antidote._providers import ServiceProvider
+from antidote.core import DependencyValue
 
 
 @pytest.fixture(autouse=True)
@@ -18,6 +22,7 @@ def test_new():
 @pytest.mark.parametrize('expectation,name', [
     (pytest.raises(TypeError, match=".*name.*str.*"), object()),
     (pytest.raises(ValueError, match=".*reserved.*"), Scope.singleton().name),
+    (pytest.raises(ValueError, match=".*reserved.*"), Scope.thread_local().name),
     (pytest.raises(ValueError, match=".*reserved.*"), Scope.sentinel().name),
     (pytest.raises(ValueError, match=".*empty.*"), "")
 ])
@@ -37,6 +42,176 @@ def test_reset():
     world.scopes.reset(s)  # should just work, the reset() is tested directly in providers
 
 
+def test_thread_local():
+    world.provider(ServiceProvider)
+
+    class Session(Service):
+        __antidote__ = Service.Conf(scope=Scope.thread_local())
+
+    session = world.get(Session)
+    assert world.get(Session) is session
+
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(world.get(Session)))
+    thread.start()
+    thread.join()
+    assert isinstance(sessions[0], Session)
+    assert sessions[0] is not session
+
+    world.scopes.reset(Scope.thread_local())
+    assert world.get(Session) is not session
+
+    with world.test.clone(keep_scopes=True):
+        assert world.get(Session) is world.get(Session)
+
+
+@pytest.mark.parametrize('override', ['factory', 'provider'])
+def test_thread_local_override(override):
+    world.provider(ServiceProvider)
+
+    class Session(Service):
+        pass
+
+    def other_thread_session():
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(world.get(Session)))
+        thread.start()
+        thread.join()
+        return sessions[0]
+
+    with world.test.clone():
+        if override == 'factory':
+            @world.test.override.factory(Session, scope=Scope.thread_local())
+            def create():
+                return object()
+        else:
+            @world.test.override.provider()
+            def provide(dependency):
+                if dependency is Session:
+                    return DependencyValue(object(), scope=Scope.thread_local())
+
+        session = world.get(Session)
+        assert world.get(Session) is session
+        other = other_thread_session()
+        assert other is not session
+        assert not isinstance(other, Session)
+
+        world.scopes.reset(Scope.thread_local())
+        assert world.get(Session) is not session
+
+        session = world.get(Session)
+        with world.test.clone(keep_scopes=True):
+            assert world.get(Session) is session
+        with world.test.clone():
+            assert world.get(Session) is not session
+
+
+def test_dispose():
+    world.provider(ServiceProvider)
+    scope = world.scopes.new('dummy')
+    disposed = []
+
+    class Connection(Service):
+        __antidote__ = Service.Conf(scope=scope, dispose=lambda c: c.close())
+
+        def close(self):
+            disposed.append((self, threading.current_thread()))
+
+    connection = world.get(Connection)
+    world.scopes.reset(scope, wait=True)
+    assert [c for c, _ in disposed] == [connection]
+    # Disposed off the caller thread.
+    assert disposed[0][1] is not threading.current_thread()
+
+    # Values which were never retrieved aren't disposed.
+    world.scopes.reset(scope, wait=True)
+    assert len(disposed) == 1
+
+    second = world.get(Connection)
+    world.scopes.reset(scope)
+    world.scopes.reset(scope, wait=True)  # waits for previous disposals too
+    assert [c for c, _ in disposed] == [connection, second]
+
+
+@pytest.mark.parametrize('scope_name', ['dummy', 'thread_local'])
+def test_dispose_override(scope_name):
+    world.provider(ServiceProvider)
+    scope = (Scope.thread_local() if scope_name == 'thread_local'
+             else world.scopes.new(scope_name))
+    disposed = []
+
+    class Connection(Service):
+        __antidote__ = Service.Conf(scope=scope, dispose=disposed.append)
+
+    with world.test.clone():
+        # Stubs are not given to the disposer of the actual dependency.
+        @world.test.override.factory(Connection, scope=scope)
+        def create():
+            return "stub"
+
+        assert world.get(Connection) == "stub"
+        world.scopes.reset(scope, wait=True)
+        assert disposed == []
+
+        stub_disposed = []
+
+        @world.test.override.factory(Connection, scope=scope,
+                                     dispose=stub_disposed.append)
+        def create_disposable():
+            return object()
+
+        connection = world.get(Connection)
+        world.scopes.reset(scope, wait=True)
+        assert stub_disposed == [connection]
+        assert disposed == []
+        assert world.get(Connection) is not connection
+
+    with world.test.clone():
+        with pytest.raises(ValueError, match="(?i)singleton"):
+            world.test.override.factory(Connection, dispose=disposed.append)
+
+
+def test_async_dispose():
+    world.provider(ServiceProvider)
+    scope = world.scopes.new('dummy')
+    disposed = []
+
+    async def aclose(session):
+        disposed.append(session)
+
+    class Session(Service):
+        __antidote__ = Service.Conf(scope=scope, dispose=aclose)
+
+    class Other(Service):
+        __antidote__ = Service.Conf(scope=scope, dispose=aclose)
+
+    values = {world.get(Session), world.get(Other)}
+    world.scopes.reset(scope, wait=True)
+    assert set(disposed) == values
+
+
+def test_dispose_failure(caplog):
+    world.provider(ServiceProvider)
+    scope = world.scopes.new('dummy')
+
+    def fail(_):
+        raise RuntimeError()
+
+    async def async_fail(_):
+        raise RuntimeError()
+
+    class A(Service):
+        __antidote__ = Service.Conf(scope=scope, dispose=fail)
+
+    class B(Service):
+        __antidote__ = Service.Conf(scope=scope, dispose=async_fail)
+
+    a, b = world.get(A), world.get(B)
+    world.scopes.reset(scope, wait=True)
+    failed = [record for record in caplog.records if 'dispose' in record.getMessage()]
+    assert {record.args[0] for record in failed} == {a, b}
+
+
 @pytest.mark.parametrize('expectation,scope', [
     (pytest.raises(TypeError, match=".*scope.*Scope.*"), object()),
     (pytest.raises(ValueError, match=".*Cannot reset.*"), Scope.singleton()),
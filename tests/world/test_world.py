@@ -1,3 +1,5 @@
+import gc
+import weakref
 from typing import Callable
 
 import pytest
@@ -118,6 +120,47 @@ def test_lazy():
     assert world.lazy[A]().get() is world.get(A)
 
 
+def test_typed_get_cached():
+    assert world.get[A] is world.get[A]
+    assert world.get[int] is not world.get[A]
+
+
+def test_lazy_singleton_cache():
+    x = object()
+    world.singletons.add('x', x)
+    lazy = world.lazy('x')
+    assert lazy.get() is x
+    assert lazy.get() is x
+    assert repr(lazy) == "Dependency(unwrapped='x')"
+
+    with world.test.empty():
+        world.singletons.add('x', 'other')
+        assert lazy.get() == 'other'
+
+    with world.test.clone(keep_singletons=True):
+        assert lazy.get() is x
+        world.test.override.singleton('x', 'overridden')
+        assert lazy.get() == 'overridden'
+
+    assert lazy.get() is x
+
+
+def test_lazy_does_not_keep_values():
+    class Value:
+        pass
+
+    lazy = world.lazy('x')
+    with world.test.empty():
+        value = Value()
+        world.singletons.add('x', value)
+        assert lazy.get() is value
+        ref = weakref.ref(value)
+        del value
+
+    gc.collect()
+    assert ref() is None
+
+
 def test_freeze():
     world.provider(ServiceProvider)
     factory = world.get(ServiceProvider)